@@ -0,0 +1,205 @@
+# Benchmark/bench_line_buffer.py
+"""
+수신 줄 분리 방식 비교 (자동 송신 'VC_MON Data' 스트림 기준).
+
+    python Benchmark/bench_line_buffer.py [--lines 200000] [--chunk 256] [--repeat 7] [--duration 3]
+
+1) offline : 같은 바이트 스트림을 chunk 크기로 나눠 넣었을 때의 처리량 (lines/sec)
+   방식들을 번갈아 repeat 번 실행해 중앙값을 낸다 (1회 측정은 실행마다 ±20% 가까이 흔들림)
+   - readline : pyserial readline() 처럼 1바이트씩 read(1) 로 줄을 모은 뒤 decode → strip → parse_line
+                (기존 Monitoring/serial_manager 방식)
+   - concat   : bytes 버퍼 += chunk, 줄마다 잘라 새 버퍼 생성 → decode → parse_line (기존 SerialManager 방식)
+   - buffer   : bytearray 버퍼에 일괄 추가(memoryview 조각) → FrameDecoder 가 줄마다 bytearray 사본으로 분리
+                → parse_vcmon_bytes (decode/strip 없음, 버퍼 앞부분은 한 번에 지움)
+2) live    : 가상 장치(pty)의 자동 송신을 실제 포트로 읽었을 때
+             lines/s, 줄당 CPU 시간, 줄당 포트 읽기 syscall 수 (readline 방식 vs 일괄 읽기)
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "Simulator"))
+
+import serial
+
+from virtual_kit import VirtualKit
+from PyQt_Service.Protocol.binary_frames import FrameDecoder
+from PyQt_Service.Protocol.firmware_protocol import parse_line, parse_vcmon_bytes
+
+
+SAMPLE_LINES = [
+    b"VC_MON Data - V:24.01V, I:0.125A, P:3.00W, C:0.412Ah",
+    b"VC_MON Data - V:23.98V, I:0.131A, P:3.14W, C:0.413Ah",
+    b"VC_MON Data - V:24.05V, I:0.119A, P:2.86W, C:0.414Ah",
+    b"VC_MON Data - V:24.02V, I:0.127A, P:3.05W, C:0.415Ah",
+]
+
+
+# ========================================
+# offline
+# ========================================
+def split_readline(stream, chunk):
+    parsed = 0
+    f = io.BytesIO(stream)
+    read = f.read
+    while True:
+        raw = bytearray()
+        while True:
+            c = read(1)
+            if not c:
+                break
+            raw += c
+            if c == b"\n":
+                break
+        if not raw:
+            break
+        line = raw.decode(errors="ignore").strip()
+        if line and parse_line(line) is not None:
+            parsed += 1
+    return parsed
+
+
+def split_concat(stream, chunk):
+    parsed = 0
+    buffer = b""
+    for i in range(0, len(stream), chunk):
+        buffer += stream[i:i + chunk]
+        while True:
+            idx = buffer.find(b"\n")
+            if idx < 0:
+                break
+            raw, buffer = buffer[:idx], buffer[idx + 1:]
+            line = raw.decode(errors="ignore").strip()
+            if line and parse_line(line) is not None:
+                parsed += 1
+    return parsed
+
+
+def split_buffer(stream, chunk):
+    counts = [0]
+
+    def on_line(raw):
+        if parse_vcmon_bytes(raw) is not None:
+            counts[0] += 1
+
+    decoder = FrameDecoder()
+    buffer = bytearray()
+    view = memoryview(stream)
+    for i in range(0, len(stream), chunk):
+        buffer += view[i:i + chunk]
+        decoder.decode(buffer, on_line, None)
+    return counts[0]
+
+
+def bench_offline(lines, chunk, repeat):
+    stream = b"".join(SAMPLE_LINES[i % len(SAMPLE_LINES)] + b"\r\n" for i in range(lines))
+    methods = (("readline", split_readline), ("concat", split_concat), ("buffer", split_buffer))
+
+    runs = {name: [] for name, _ in methods}
+    parsed = {}
+    for _ in range(repeat):
+        for name, fn in methods:
+            start = time.perf_counter()
+            parsed[name] = fn(stream, chunk)
+            runs[name].append(lines / (time.perf_counter() - start))
+
+    rates = {name: statistics.median(r) for name, r in runs.items()}
+    for name, _ in methods:
+        print(f"offline {name:>8}: {rates[name]:>12,.0f} lines/sec median "
+              f"(min {min(runs[name]):,.0f} / max {max(runs[name]):,.0f}, {parsed[name]}/{lines} parsed)")
+
+    # 같은 회차끼리의 비율 → 중앙값 (회차마다 흔들리는 정도도 함께)
+    for other in ("readline", "concat"):
+        ratios = [b / o for b, o in zip(runs["buffer"], runs[other])]
+        print(f"offline speedup : x{statistics.median(ratios):.2f} median vs {other} "
+              f"(x{min(ratios):.2f} – x{max(ratios):.2f}, {repeat} runs)")
+
+
+# ========================================
+# live (pty)
+# ========================================
+def read_readline(port, duration):
+    lines = 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        raw = port.readline()
+        line = raw.decode(errors="ignore").strip()
+        if line.startswith("VC_MON") and parse_line(line) is not None:
+            lines += 1
+    return lines
+
+
+def read_bulk(port, duration):
+    counts = [0]
+
+    def on_line(raw):
+        if parse_vcmon_bytes(raw) is not None:
+            counts[0] += 1
+
+    decoder = FrameDecoder()
+    buffer = bytearray()
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        chunk = port.read(port.in_waiting or 1)
+        if chunk:
+            buffer += chunk
+            decoder.decode(buffer, on_line, None)
+    return counts[0]
+
+
+def bench_live(duration, auto_interval):
+    kit = VirtualKit(baud=0, auto_interval=auto_interval, auto_control=False, seed=0)
+    path = kit.start()
+    try:
+        for name, fn in (("readline", read_readline), ("bulk", read_bulk)):
+            port = serial.Serial(path, 115200, timeout=0.05)
+            port.write(b"$me\n")
+            time.sleep(0.2)
+            port.reset_input_buffer()
+
+            # readline() 도 내부에서 read() 를 부르므로 인스턴스에서 호출 수를 센다
+            calls = [0]
+            read = port.read
+
+            def counting_read(size=1):
+                calls[0] += 1
+                return read(size)
+
+            port.read = counting_read
+
+            cpu = time.thread_time()
+            lines = fn(port, duration)
+            cpu = time.thread_time() - cpu
+
+            port.write(b"$ne\n")
+            port.close()
+            time.sleep(0.2)
+
+            per_line = cpu / lines * 1e6 if lines else 0.0
+            print(f"live    {name:>8}: {lines / duration:>8,.0f} lines/s, "
+                  f"{per_line:6.1f} µs CPU/line, {calls[0] / max(lines, 1):.2f} read()/line")
+    finally:
+        kit.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--chunk", type=int, default=256, help="offline 1회 읽기 크기(바이트)")
+    parser.add_argument("--repeat", type=int, default=7, help="offline 반복 횟수 (중앙값)")
+    parser.add_argument("--duration", type=float, default=3.0, help="live 측정 시간(초)")
+    parser.add_argument("--auto-interval", type=float, default=0.0005, help="가상 장치 자동 송신 주기(초)")
+    args = parser.parse_args()
+
+    bench_offline(args.lines, args.chunk, args.repeat)
+    bench_live(args.duration, args.auto_interval)
+
+
+if __name__ == "__main__":
+    main()
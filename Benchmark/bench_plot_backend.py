@@ -0,0 +1,135 @@
+# Benchmark/bench_plot_backend.py
+"""
+실시간 그래프 백엔드 비교 (Monitoring/live_plot.py).
+
+    python Benchmark/bench_plot_backend.py [--points 1000 10000 100000] [--charts 4] [--duration 2]
+
+- 백엔드마다 charts 개의 그래프를 띄우고, 프레임마다 샘플 1개 추가 → set_data → refresh → 이벤트 처리(화면 그리기)
+- 프레임 시간(ms, 평균 / p95)과 프레임당 CPU 시간(ms), 초당 프레임 수를 출력
+- redraw : 기존 방식 (fig.clear → add_subplot → plot → draw) 기준값
+- 그래프는 가로 픽셀 수에 맞게 점을 줄여 그린다 (downsample.minmax) → 점 수가 늘어도 프레임 시간이 거의 같아야 함
+- 화면이 없으면 QT_QPA_PLATFORM=offscreen 으로 실행
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import numpy as np
+from PyQt5 import QtWidgets
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from PyQt_Service.Monitoring.live_plot import create_plot
+from PyQt_Service.Monitoring.monitoring_controller import format_time
+from PyQt_Service.Monitoring.ring_buffer import RingBuffer
+
+
+class RedrawPlot:
+    """비교용: 매번 축을 새로 만드는 기존 방식"""
+
+    def __init__(self, **_):
+        self.fig = Figure(figsize=(4, 3))
+        self.canvas = FigureCanvas(self.fig)
+        self.data = {}
+
+    def line(self, key, **style):
+        self.data[key] = ([], [], style)
+
+    def set_data(self, key, x, y):
+        self.data[key] = (x, y, self.data[key][2])
+
+    def refresh(self):
+        self.fig.clear()
+        ax = self.fig.add_subplot(111)
+        for x, y, style in self.data.values():
+            ax.plot(x, y, **style)
+        ax.grid(True)
+        ax.xaxis.set_major_formatter(format_time)
+        self.canvas.draw()
+
+
+def make_plot(backend):
+    if backend == "redraw":
+        return RedrawPlot()
+    plot = create_plot(backend, figsize=(4, 3), x_formatter=format_time)
+    if plot.backend != backend:
+        return None
+    return plot
+
+
+def bench(app, backend, points, charts, duration):
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(window)
+    plots = [make_plot(backend) for _ in range(charts)]
+    if plots[0] is None:
+        print(f"{backend:>10} {points:>7,}: 사용 불가")
+        return
+
+    for k, plot in enumerate(plots):
+        plot.line("v", color="#930B0D")
+        layout.addWidget(plot.canvas, k // 2, k % 2)
+    window.resize(900, 300 * ((charts + 1) // 2))
+    window.show()
+
+    # 점 수와 관계없이 같은 모양(사인 3주기 + 잡음)이 되도록
+    t0 = time.time()
+    buf = RingBuffer(points, ("v",))
+    rng = np.random.default_rng(0)
+    wave = lambda n: 18 + np.sin(np.asarray(n) / points * 6 * np.pi) + rng.normal(0, 0.02, np.shape(n))
+    n = np.arange(points)
+    buf.extend(t0 + n * 0.1, wave(n))
+
+    def frame(k):
+        buf.append(t0 + (points + k) * 0.1, float(wave(points + k)))
+        for plot in plots:
+            plot.set_data("v", buf.view("ts"), buf.view("v"))
+            plot.refresh()
+        app.processEvents()
+
+    for k in range(3):                      # 첫 전체 그리기는 제외
+        frame(k)
+
+    times = []
+    cpu = time.process_time()
+    began = time.perf_counter()
+    k = 3
+    while time.perf_counter() - began < duration:
+        start = time.perf_counter()
+        frame(k)
+        times.append(time.perf_counter() - start)
+        k += 1
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - began
+
+    times = np.array(times) * 1e3
+    print(
+        f"{backend:>10} {points:>7,}: frame {times.mean():7.2f} ms (p95 {np.percentile(times, 95):7.2f}), "
+        f"CPU {cpu / len(times) * 1e3:7.2f} ms/frame, {len(times) / wall:6.1f} fps"
+    )
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--charts", type=int, default=4, help="동시에 갱신할 그래프 수 (모니터링 페이지 = 4)")
+    parser.add_argument("--duration", type=float, default=2.0, help="설정별 측정 시간(초)")
+    parser.add_argument("--backends", nargs="+", default=["pyqtgraph", "matplotlib", "redraw"])
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    print(f"그래프 {args.charts}개, 프레임마다 샘플 1개 추가 (Qt 플랫폼: {app.platformName()})")
+    for points in args.points:
+        for backend in args.backends:
+            bench(app, backend, points, args.charts, args.duration)
+
+
+if __name__ == "__main__":
+    main()
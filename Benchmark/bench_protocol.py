@@ -0,0 +1,79 @@
+# Benchmark/bench_protocol.py
+"""
+펌웨어 출력 파서 마이크로 벤치마크 (lines/sec).
+
+    python Benchmark/bench_protocol.py [--lines 200000]
+
+- table : firmware_protocol.parse_line (접두어 표 + partition/split)
+- regex : 기존 방식처럼 줄마다 re.search 로 필드를 찾는 비교 기준
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt_Service.Protocol.firmware_protocol import parse_line
+
+
+# 자동 송신 스트림을 흉내 낸 줄 구성 (VC_MON 줄이 대부분)
+SAMPLE_LINES = [
+    "VC_MON Data - V:24.01V, I:0.125A, P:3.00W, C:0.412Ah",
+    "VC_MON Data - V:23.98V, I:0.131A, P:3.14W, C:0.413Ah",
+    "VC_MON Data - V:24.05V, I:0.119A, P:2.86W, C:0.414Ah",
+    "VC_MON Data - V:24.02V, I:0.127A, P:3.05W, C:0.415Ah",
+    "A3 (Total) - ADC: 512 | Voltage: 12.500V",
+    "A0 (1S) - ADC: 170 | Voltage: 4.150V",
+    "Battery Status: OK (12.34V >= 10V)",
+    "Halogen Lamp ON",
+    "Pilot Lamp GREEN (NO Contact)",
+    "Commercial Fan turned OFF due to interlock",
+]
+
+_REGEX_TABLE = [
+    re.compile(r"VC_MON Data - V:([\d.]+)V, I:([\d.]+)A, P:([\d.]+)W, C:([\d.]+)Ah"),
+    re.compile(r"ADC:\s*(\d+)\s*\|\s*Voltage:\s*([\d.]+)V"),
+    re.compile(r"Battery Status: (OK|LOW) \(([\d.]+)V"),
+    re.compile(r"(Halogen Lamp|Commercial Fan|Battery Fan) (ON|OFF)"),
+    re.compile(r"Pilot Lamp (GREEN|RED|OFF)"),
+    re.compile(r"turned OFF due to interlock"),
+]
+
+
+def parse_regex(line):
+    for pattern in _REGEX_TABLE:
+        match = re.search(pattern, line)
+        if match:
+            return match.groups()
+    return None
+
+
+def run(name, fn, lines):
+    start = time.perf_counter()
+    parsed = 0
+    for line in lines:
+        if fn(line) is not None:
+            parsed += 1
+    elapsed = time.perf_counter() - start
+    rate = len(lines) / elapsed
+    print(f"{name:>6}: {rate:>12,.0f} lines/sec  ({parsed}/{len(lines)} parsed, {elapsed * 1000:.1f} ms)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200000)
+    args = parser.parse_args()
+
+    lines = (SAMPLE_LINES * (args.lines // len(SAMPLE_LINES) + 1))[:args.lines]
+
+    table = run("table", parse_line, lines)
+    regex = run("regex", parse_regex, lines)
+    print(f"speedup: x{table / regex:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Benchmark/bench_serial_stack.py
+"""
+가상 장치(Simulator/virtual_kit.py)를 상대로 시리얼 계층 전체를 측정한다.
+
+    python Benchmark/bench_serial_stack.py [--latency 0.005] [--noise 0.0005]
+
+1) latency   : '$re' 요청 → 응답까지 왕복 시간 (p50 / p95 / max)
+2) pipeline  : 응답을 기다리지 않고 연속 요청했을 때의 처리량 (req/s)
+3) push      : '$m' 자동 송신 스트림 수신·파싱 처리량 (lines/s, 파싱 실패 수)
+               --binary 면 '$x' 바이너리 프레임 모드로 받는다 (frames/s, CRC 오류 수)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "Simulator"))
+
+from virtual_kit import VirtualKit
+from PyQt_Service.Setting.serial_manager import SerialManager
+from PyQt_Service.Protocol.firmware_protocol import VcMonReading, parse_line
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def bench_latency(serial, count):
+    times, lost = [], 0
+    for _ in range(count):
+        start = time.perf_counter()
+        lines = serial.request("r", timeout=1.0)
+        if lines is None:
+            lost += 1
+            continue
+        times.append((time.perf_counter() - start) * 1000)
+
+    if times:
+        print(f"latency  : p50 {percentile(times, 0.5):.2f} ms, p95 {percentile(times, 0.95):.2f} ms, "
+              f"max {max(times):.2f} ms  (timeout {lost}/{count})")
+    else:
+        print(f"latency  : no replies (timeout {lost}/{count})")
+
+
+def bench_pipeline(serial, count):
+    start = time.perf_counter()
+    futures = [serial.send_request("opqr"[i % 4], timeout=2.0) for i in range(count)]
+    replies = sum(1 for f in futures if f is not None and f.result() is not None)
+    elapsed = time.perf_counter() - start
+    print(f"pipeline : {count / elapsed:,.0f} req/s  ({replies}/{count} replied, {elapsed:.2f} s)")
+
+
+def bench_push(serial, duration):
+    counts = {"lines": 0, "parsed": 0}
+
+    def on_line(line):
+        if line.startswith("VC_MON"):
+            counts["lines"] += 1
+            if isinstance(parse_line(line), VcMonReading):
+                counts["parsed"] += 1
+
+    serial.add_listener(on_line)
+    serial.request("m")
+
+    # 측정 구간의 수신 줄 수만 센다 (정지 명령 응답을 기다리는 동안 들어온 줄 제외)
+    start_lines, start_parsed = counts["lines"], counts["parsed"]
+    time.sleep(duration)
+    lines = counts["lines"] - start_lines
+    parsed = counts["parsed"] - start_parsed
+
+    serial.request("n")
+    serial.remove_listener(on_line)
+
+    print(f"push     : {lines / duration:,.0f} lines/s  (parsed {parsed}/{lines})")
+
+
+def bench_push_binary(serial, duration):
+    counts = {"frames": 0}
+
+    def on_frame(frame):
+        counts["frames"] += 1
+
+    serial.add_frame_listener(on_frame)
+    serial.request("x")
+    serial.request("m")
+
+    start_frames, start_stats = counts["frames"], serial.frame_stats
+    time.sleep(duration)
+    frames = counts["frames"] - start_frames
+    stats = serial.frame_stats
+
+    serial.request("n")
+    serial.request("y")
+    serial.remove_frame_listener(on_frame)
+
+    errors = {k: stats[k] - start_stats[k] for k in ("crc_errors", "bad_type", "lost", "skipped_bytes")}
+    print(f"push     : {frames / duration:,.0f} frames/s  {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.0, help="가상 장치 응답 지연(초)")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--drop", type=float, default=0.0)
+    parser.add_argument("--noise", type=float, default=0.0)
+    parser.add_argument("--auto-interval", type=float, default=0.002, help="자동 송신 주기(초)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=3.0, help="push 측정 시간(초)")
+    parser.add_argument("--binary", action="store_true", help="push 를 바이너리 프레임 모드로 측정")
+    args = parser.parse_args()
+
+    kit = VirtualKit(
+        latency=args.latency,
+        baud=args.baud,
+        drop_rate=args.drop,
+        noise_rate=args.noise,
+        auto_interval=args.auto_interval,
+        seed=0,
+    )
+    port = kit.start()
+
+    serial = SerialManager()
+    if not serial.connect(port):
+        print("❌ 가상 장치 연결 실패")
+        kit.stop()
+        return
+
+    try:
+        bench_latency(serial, args.requests)
+        bench_pipeline(serial, args.requests)
+        if args.binary:
+            bench_push_binary(serial, args.duration)
+        else:
+            bench_push(serial, args.duration)
+    finally:
+        serial.disconnect()
+        kit.stop()
+        print("device   :", kit.stats)
+
+
+if __name__ == "__main__":
+    main()
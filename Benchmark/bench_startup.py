@@ -0,0 +1,130 @@
+# Benchmark/bench_startup.py
+"""
+프로그램 시작 시간 (전원을 켤 때마다 키오스크가 새로 시작하는 상황).
+
+    python Benchmark/bench_startup.py [--runs 5] [--eager] [--runtime-ui]
+
+- 실행마다 새 파이썬 프로세스로 StackApp 을 띄우고 아래 시각(프로세스 시작 기준, ms)을 잰다
+  · qt     : PyQt5 import + QApplication
+  · import : stack 모듈 (컨트롤러·서비스 import)
+  · build  : StackApp() 생성
+  · frame  : 첫 화면 그리기 (time-to-first-frame)
+  · ready  : 대시보드 그래프까지 만들어진 시각
+- --eager      : 모든 페이지를 시작할 때 만들고 그래프도 첫 화면 전에 만든다 (이전 방식과 비교용)
+- --runtime-ui : 변환 모듈(ui_compiled/) 대신 uic.loadUi 로 .ui 를 읽는다
+- 두 번째 실행부터는 OS 파일 캐시가 차 있으므로 첫 실행이 실제 전원 투입 직후에 가장 가깝다
+- 화면이 없으면 QT_QPA_PLATFORM=offscreen 으로 실행
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARK = "STARTUP "
+STEPS = ("qt", "import", "build", "frame", "ready")
+
+
+# ========================================
+# 자식 프로세스 — 실제 시작 과정
+# ========================================
+def child(started, eager, runtime_ui):
+    sys.path.append(ROOT)
+    sys.path.append(os.path.join(ROOT, "PyQt_GUI"))
+    marks = {}
+    mark = lambda step: marks.setdefault(step, (time.time() - started) * 1e3)
+
+    from PyQt5 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+    mark("qt")
+
+    import stack
+    if runtime_ui:
+        from PyQt5 import uic
+        import ui_loader
+
+        stack.load_ui = lambda name, base=None: uic.loadUi(ui_loader.ui_path(name), base)
+    mark("import")
+
+    window = stack.StackApp()
+    if eager:
+        for index in range(len(window.pages)):
+            window._page(index)
+        window.change_page(0)
+        window.dashboard_controller.build_plot()
+    mark("build")
+
+    class FirstFrame(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Paint:
+                mark("frame")
+            return False
+
+    first_frame = FirstFrame()
+    window.installEventFilter(first_frame)
+    window.show()
+
+    def poll():
+        if "frame" in marks and window.dashboard_controller.plot is not None:
+            mark("ready")
+            timer.stop()
+            window.close()
+            app.quit()
+
+    timer = QtCore.QTimer()
+    timer.timeout.connect(poll)
+    timer.start(0)
+    app.exec_()
+
+    print(MARK + json.dumps(marks), flush=True)
+
+
+# ========================================
+# 부모 — 실행 반복 + 결과 정리
+# ========================================
+def run_once(eager, runtime_ui):
+    args = [sys.executable, os.path.abspath(__file__), "--child", repr(time.time())]
+    if eager:
+        args.append("--eager")
+    if runtime_ui:
+        args.append("--runtime-ui")
+
+    out = subprocess.run(args, capture_output=True, text=True, timeout=120).stdout
+    for line in out.splitlines():
+        if line.startswith(MARK):
+            return json.loads(line[len(MARK):])
+    raise RuntimeError("자식 프로세스 결과 없음:\n" + out[-2000:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="모든 페이지를 시작할 때 생성 (비교용)")
+    parser.add_argument("--runtime-ui", action="store_true", help=".ui 를 uic.loadUi 로 읽기 (비교용)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        child(float(args.child), args.eager, args.runtime_ui)
+        return
+
+    mode = ("eager" if args.eager else "lazy") + (" + runtime .ui" if args.runtime_ui else " + compiled .ui")
+    print(f"시작 시간 (ms, 프로세스 시작 기준) — {mode}")
+    print("      " + "".join(f"{step:>9}" for step in STEPS))
+
+    results = []
+    for k in range(args.runs):
+        marks = run_once(args.eager, args.runtime_ui)
+        results.append(marks)
+        print(f"run {k + 1:<2}" + "".join(f"{marks[step]:9.0f}" for step in STEPS))
+
+    print("median" + "".join(f"{statistics.median(m[step] for m in results):9.0f}" for step in STEPS))
+
+
+if __name__ == "__main__":
+    main()
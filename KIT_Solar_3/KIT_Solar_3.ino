@@ -110,6 +110,14 @@ typedef struct {
 
 VCMonData vcMonitor;
 
+// Binary Frame Mode ($xe / $ye)
+// A5 5A | LEN | TYPE | PAYLOAD | CRC16(LEN~PAYLOAD, CCITT 0x1021, 초기값 0xFFFF) — 정수는 little-endian
+bool binaryFrameMode = false;
+const byte FRAME_SYNC1 = 0xA5;
+const byte FRAME_SYNC2 = 0x5A;
+const byte FRAME_VCMON = 0x01;
+unsigned int frameSeq = 0;
+
 
 
 void setup() {
@@ -371,6 +379,23 @@ void loop()
       command = "";
       command_char = 0;
       break;
+    case 'w': // 전체 채널 스냅샷 (PC 프로그램용 한 줄 출력)
+      printSnapshot();
+      command = "";
+      command_char = 0;
+      break;
+    case 'x': // 바이너리 프레임 모드 ON (VC_MON 자동 송신 데이터를 CRC 프레임으로 출력)
+      binaryFrameMode = true;
+      Serial.println("Binary Frame Mode ON");
+      command = "";
+      command_char = 0;
+      break;
+    case 'y': // 바이너리 프레임 모드 OFF (텍스트 출력)
+      binaryFrameMode = false;
+      Serial.println("Binary Frame Mode OFF");
+      command = "";
+      command_char = 0;
+      break;
   }
 
   // Process Push Button Inputs
@@ -561,6 +586,12 @@ void parseVCMonitorData(String data)
       }
       prevTime = currentTime;
       
+      if(binaryFrameMode)
+      {
+        sendVCMonitorFrame();
+        return;
+      }
+
       Serial.print("VC_MON Data - V:");
       Serial.print(vcMonitor.voltage, 2);
       Serial.print("V, I:");
@@ -574,6 +605,53 @@ void parseVCMonitorData(String data)
   }
 }
 
+// CRC-CCITT (다항식 0x1021, 초기값 0xFFFF)
+unsigned int crc16Update(unsigned int crc, byte data)
+{
+  crc ^= (unsigned int)data << 8;
+  for(byte i = 0; i < 8; i++)
+  {
+    if(crc & 0x8000) crc = (crc << 1) ^ 0x1021;
+    else crc <<= 1;
+  }
+  return crc;
+}
+
+void putFrameValue(byte *buf, byte &idx, unsigned long value, byte size)
+{
+  for(byte i = 0; i < size; i++)
+  {
+    buf[idx++] = (value >> (8 * i)) & 0xFF;
+  }
+}
+
+// VC_MON 샘플 프레임 (20바이트) - 'VC_MON Data - ...' 텍스트 줄(약 55바이트) 대신 출력
+// PAYLOAD: seq u16 | 전압 u16 (0.01V) | 전류 u16 (0.001A) | 전력 u32 (0.01W) | 용량 u32 (0.001Ah)
+void sendVCMonitorFrame()
+{
+  byte frame[20];
+  byte idx = 0;
+
+  frame[idx++] = FRAME_SYNC1;
+  frame[idx++] = FRAME_SYNC2;
+  frame[idx++] = 14;
+  frame[idx++] = FRAME_VCMON;
+  putFrameValue(frame, idx, frameSeq++, 2);
+  putFrameValue(frame, idx, (unsigned long)(vcMonitor.voltage * 100.0 + 0.5), 2);
+  putFrameValue(frame, idx, (unsigned long)(vcMonitor.current * 1000.0 + 0.5), 2);
+  putFrameValue(frame, idx, (unsigned long)(vcMonitor.power * 100.0 + 0.5), 4);
+  putFrameValue(frame, idx, (unsigned long)(vcMonitor.capacity * 1000.0 + 0.5), 4);
+
+  unsigned int crc = 0xFFFF;
+  for(byte i = 2; i < idx; i++)
+  {
+    crc = crc16Update(crc, frame[i]);
+  }
+  putFrameValue(frame, idx, crc, 2);
+
+  Serial.write(frame, idx);
+}
+
 void printVCMonitorData()
 {
   if(vcMonitor.dataValid)
@@ -816,3 +894,45 @@ void printSystemStatus()
   
   Serial.println("====================================================");
 }
+
+// 전체 채널 스냅샷 ($we) - PC 프로그램이 한 번의 요청으로 모든 상태를 읽기 위한 한 줄 출력
+// SNAP,<1S ADC>,<2S ADC>,<3S ADC>,<Total ADC>,<VC 유효>,<V>,<I>,<P>,<C>,<최대 I>,<누적 Wh>,
+//      <파일럿 0=OFF/1=GREEN/2=RED>,<상용팬>,<배터리팬>,<할로겐>,<배터리 OK>
+// 예: SNAP,503,168,336,503,1,24.01,0.125,3.00,0.412,0.130,0.015,1,0,1,0,1
+void printSnapshot()
+{
+  Serial.print("SNAP,");
+  Serial.print(battery1sVoltage);
+  Serial.print(',');
+  Serial.print(battery2sVoltage);
+  Serial.print(',');
+  Serial.print(battery3sVoltage);
+  Serial.print(',');
+  Serial.print(batteryTotalVoltage);
+  Serial.print(',');
+
+  Serial.print(vcMonitor.dataValid ? 1 : 0);
+  Serial.print(',');
+  Serial.print(vcMonitor.voltage, 2);
+  Serial.print(',');
+  Serial.print(vcMonitor.current, 3);
+  Serial.print(',');
+  Serial.print(vcMonitor.power, 2);
+  Serial.print(',');
+  Serial.print(vcMonitor.capacity, 3);
+  Serial.print(',');
+  Serial.print(maxCurrent, 3);
+  Serial.print(',');
+  Serial.print(cumulativeEnergy, 3);
+  Serial.print(',');
+
+  Serial.print((int)PilotLampControl);
+  Serial.print(',');
+  Serial.print(FanCommercialControl == FAN_ON ? 1 : 0);
+  Serial.print(',');
+  Serial.print(FanBatteryControl == FAN_ON ? 1 : 0);
+  Serial.print(',');
+  Serial.print(HalogenLampControl == HALOGEN_LAMP_ON ? 1 : 0);
+  Serial.print(',');
+  Serial.println(batteryVoltageOK ? 1 : 0);
+}
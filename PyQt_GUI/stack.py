@@ -1,75 +1,111 @@
 # PyQt_GUI/stack.py
 
-from PyQt5 import QtWidgets, uic
+from PyQt5 import QtWidgets, QtCore
 import sys, os
 
 # 경로 설정
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Controller import
+# Controller import (matplotlib 등 무거운 모듈은 쓰는 곳에서 처음 필요할 때 import)
+from ui_loader import load_ui
+from PyQt_Service.Monitoring.monitoring_collector import MonitoringCollector
 from PyQt_Service.Monitoring.monitoring_controller import MonitoringController
+from PyQt_Service.Monitoring.live_plot import load_backend
+from PyQt_Service.Monitoring.monitoring_repository import MonitoringRepository
+from PyQt_Service.Monitoring.monitoring_service import MonitoringService
+from PyQt_Service.Database.telemetry_ring import TelemetryRing, ring_path
 from PyQt_Service.Setting.setting_controller import SettingController
+from PyQt_Service.Setting.acquisition_scheduler import AcquisitionScheduler
+from PyQt_Service.Setting.device_registry import DeviceRegistry
 from PyQt_Service.Dashboard.dashboard_controller import DashboardController
 from PyQt_Service.Log.log_controller import LogController
 from PyQt_Service.Log.log_manager import LogManager
 
 
 class StackApp(QtWidgets.QMainWindow):
+    # 왼쪽 메뉴 버튼 순서대로 (.ui 이름, 페이지를 처음 열 때 컨트롤러를 만드는 메서드)
+    # 대시보드(dashboard.ui 의 첫 페이지)와 설정(보드 목록·시리얼 포트를 가짐)은 시작할 때 만든다
+    PAGES = (
+        ("dashboard", None),
+        ("sungp", "_build_monitoring"),
+        ("log", "_build_log"),
+        ("new_set", None),
+        ("information", None),
+    )
+
     def __init__(self):
         super().__init__()
 
-        base_path = os.path.dirname(os.path.abspath(__file__))
-
-        # main UI 로드 (대시보드 메인 윈도우)
-        uic.loadUi(os.path.join(base_path, "dashboard.ui"), self)
+        # main UI 로드 (대시보드 메인 윈도우) — ui_compiled/ 의 변환 모듈, 없으면 .ui
+        load_ui("dashboard", self)
         self.stack: QtWidgets.QStackedWidget = self.findChild(
             QtWidgets.QStackedWidget, "stackedWidget"
         )
 
-        # 각 페이지 로드
+        # 페이지 (PAGES 순서) — None 인 페이지는 처음 열 때 로드 (_page)
         dashboard_page = self.stack.widget(0)  # 대시보드 첫 페이지
-        page_sungp = uic.loadUi(os.path.join(base_path, "sungp.ui"))
-        page_log = uic.loadUi(os.path.join(base_path, "log.ui"))
-        page_setting = uic.loadUi(os.path.join(base_path, "new_set.ui"))
-        page_info = uic.loadUi(os.path.join(base_path, "information.ui"))
-
-        # stackedWidget 에 페이지 등록
-        self.stack.addWidget(page_sungp)
-        self.stack.addWidget(page_log)
+        page_setting = load_ui("new_set")
         self.stack.addWidget(page_setting)
-        self.stack.addWidget(page_info)
-
-        # 시스템 상태 (대시보드 + 설정 페이지에서 공유)
-        self.system_state = {
-            "pilot": "RED",          # 기본 RED
-            "halogen": False,
-            "fan_commercial": False,
-            "fan_battery": False,
-        }
+        self.pages = [dashboard_page, None, None, page_setting, None]
 
-        # 🔹 로그 컨트롤러 생성 + LogManager 에 등록
-        self.log_controller = LogController(page_log)
-        LogManager.instance().set_controller(self.log_controller)
+        # 시스템 상태 저장소 (대시보드 + 설정 + 모니터링 페이지에서 공유) — 첫 보드(KIT-1)의 상태
+        # 추가 보드의 상태는 DeviceRegistry 가 보드별로 따로 가진다 (Setting/device_state.py)
+        self.system_state = DeviceRegistry.default_state()
 
-        # 🔹 모니터링 컨트롤러
-        self.monitoring_controller = MonitoringController(page_sungp, self.system_state)
-        
+        # 🔹 로그 컨트롤러 — 로그 페이지를 처음 열 때 (그 전 로그는 LogManager 가 모아 둠)
+        self.log_controller = None
 
-        # 🔹 설정 컨트롤러
+        # 🔹 설정 컨트롤러 (보드 목록·SerialManager 소유)
         self.setting_controller = SettingController(page_setting, self.system_state)
 
+        # 🔹 모든 보드의 주기적 데이터 요청 (스레드 1개)
+        self.scheduler = AcquisitionScheduler(self.setting_controller.devices)
+
+
+        # 🔹 VC_MON 자동 송신 데이터 수신 (푸시, 자동 송신이 꺼져 있으면 주기 요청 결과)
+        # 수신·저장은 바로 시작하고, 그래프(MonitoringController)는 모니터링 페이지를 처음 열 때 만든다
+        self.collector = MonitoringCollector(
+            self.setting_controller.serial,
+            self.scheduler,
+            DeviceRegistry.PRIMARY,
+        )
+        self.collector.add_sink(lambda s: self.system_state.update(last_power=s.power))
+        self.monitoring_controller = None
+
+        # 🔹 측정값 DB 저장 (db.json — SQLite / MySQL, 백그라운드 배치 쓰기)
+        self.repository = MonitoringRepository()
+        self.monitoring_service = MonitoringService(self.repository)   # 1분/1시간/1일 집계
+        self.collector.add_sink(self.repository.sink(DeviceRegistry.PRIMARY))
+        LogManager.instance().log(f"💾 측정값 저장: {self.repository.db}")
+
+        # 🔹 최근 측정값 링 파일 (재시작·비정상 종료 후 그래프를 바로 복원)
+        self.vcmon_ring = TelemetryRing(
+            ring_path(f"vcmon_{DeviceRegistry.PRIMARY}"), MonitoringController.RING_FIELDS
+        )
+        last = self.vcmon_ring.recent(1)
+        if len(last):
+            self.system_state["last_power"] = float(last["power"][-1])
+        self.collector.add_sink(self.vcmon_ring.sink())
+
+
+        # 🔹 그래프 백엔드 (plot.json — pyqtgraph / matplotlib, 대시보드·모니터링 공통)
+        self.plot_backend = load_backend()
 
         # 🔹 대시보드 컨트롤러
         self.dashboard_controller = DashboardController(
             dashboard_page,
-            self.setting_controller.serial,
-            self.setting_controller.system_state,
+            self.setting_controller.devices,
+            self.scheduler,
+            self.plot_backend,
         )
         
         self.setting_controller.dashboard = self.dashboard_controller
 
-        # 페이지 리스트 (버튼 순서와 매칭)
-        self.pages = [dashboard_page, page_sungp, page_log, page_setting, page_info]
+        # 화면 갱신을 하는 페이지의 컨트롤러 — 보이는 페이지만 activate, 나머지는 deactivate
+        # (숨은 페이지도 데이터 수신·저장은 계속)
+        self.page_controllers = {
+            dashboard_page: self.dashboard_controller,
+        }
 
         # 왼쪽 메뉴 버튼들
         self.buttons = [
@@ -81,8 +117,8 @@ class StackApp(QtWidgets.QMainWindow):
         ]
 
         # 버튼 클릭 시 페이지 변경
-        for btn, page in zip(self.buttons, self.pages):
-            btn.clicked.connect(lambda _, p=page: self.change_page(p))
+        for index, btn in enumerate(self.buttons):
+            btn.clicked.connect(lambda _, i=index: self.change_page(i))
 
         # 종료 버튼
         self.pushButton_6.clicked.connect(self.close)
@@ -91,15 +127,57 @@ class StackApp(QtWidgets.QMainWindow):
         )
 
         # 초기 페이지: 대시보드
-        self.change_page(self.pages[0])
+        self.change_page(0)
+
+        # 첫 화면을 그린 뒤에 할 일 (무거운 import — 대시보드 그래프)
+        self._after_first_frame = [self.dashboard_controller.build_plot]
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._after_first_frame:
+            tasks, self._after_first_frame = self._after_first_frame, []
+            for task in tasks:
+                QtCore.QTimer.singleShot(0, task)
+
+    # ─────────────────────────────────────
+    # 페이지 (처음 열 때 로드)
+    # ─────────────────────────────────────
+    def _page(self, index):
+        page = self.pages[index]
+        if page is None:
+            name, builder = self.PAGES[index]
+            page = self.pages[index] = load_ui(name)
+            self.stack.addWidget(page)
+            if builder is not None:
+                getattr(self, builder)(page)
+        return page
+
+    def _build_monitoring(self, page):
+        # 🔹 모니터링 컨트롤러 (VC_MON 그래프) — 링 파일에 남은 샘플로 채우고 이후 샘플을 이어 그림
+        self.monitoring_controller = MonitoringController(page, self.collector, self.plot_backend)
+        self.monitoring_controller.restore(self.vcmon_ring)
+        self.page_controllers[page] = self.monitoring_controller
+
+    def _build_log(self, page):
+        # 🔹 로그 컨트롤러 생성 + LogManager 에 등록 (보일 때만 모인 로그를 주기적으로 붙임)
+        self.log_controller = LogController(page)
+        LogManager.instance().set_controller(self.log_controller)
+        self.page_controllers[page] = self.log_controller
+
+    def change_page(self, index):
+        page = self._page(index)
+        for other, controller in self.page_controllers.items():
+            if other is not page:
+                controller.deactivate()
 
-    def change_page(self, page):
         self.stack.setCurrentWidget(page)
-        idx = self.pages.index(page)
+        if page in self.page_controllers:
+            self.page_controllers[page].activate()
+
         for i, btn in enumerate(self.buttons):
             style = btn.styleSheet()
             style = remove_color_from_stylesheet(style)
-            if i == idx:
+            if i == index:
                 btn.setStyleSheet(style + "color: #9E1010;")
             else:
                 btn.setStyleSheet(style + "color: #333333;")
@@ -112,12 +190,24 @@ class StackApp(QtWidgets.QMainWindow):
         """
         try:
             if hasattr(self, "setting_controller"):
-                serial = self.setting_controller.serial
-                if serial.port and serial.port.is_open:
-                    serial.port.close()
-                    print("🔌 시리얼 포트 정상 종료됨")
+                self.scheduler.stop()
+                self.setting_controller.executor.shutdown()
+                # 모든 보드의 수신·재연결 스레드 정지 + 포트 닫기
+                self.setting_controller.devices.disconnect_all()
+                LogManager.instance().log("🔌 시리얼 포트 정상 종료됨")
         except Exception as e:
-            print(f"⚠️ 시리얼 포트 종료 중 오류: {e}")
+            LogManager.instance().error(f"⚠️ 시리얼 포트 종료 중 오류: {e}")
+
+        # 큐에 남은 측정값 기록 후 DB 쓰기 스레드 정지
+        if hasattr(self, "repository"):
+            self.repository.close()
+        if hasattr(self, "vcmon_ring"):
+            self.vcmon_ring.close()
+        if hasattr(self, "dashboard_controller"):
+            self.dashboard_controller.close()
+
+        # 남은 로그를 파일에 쓰고 로그 쓰기 스레드 정지
+        LogManager.instance().pipeline.stop()
 
         event.accept()
 
@@ -135,6 +225,10 @@ if __name__ == "__main__":
     QtWidgets.QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QtWidgets.QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    # --quiet : 로그를 터미널에 출력하지 않음 (로그 페이지에는 그대로)
+    if "--quiet" in sys.argv:
+        LogManager.instance().set_console(False)
+
     app = QtWidgets.QApplication(sys.argv)
     window = StackApp()
     window.show()
@@ -0,0 +1,136 @@
+# PyQt_GUI/ui_loader.py
+"""
+.ui 파일 로드 — 미리 변환해 둔 파이썬 모듈(ui_compiled/<이름>_ui.py)이 있으면 그것으로,
+없거나 .ui 가 바뀌었으면 uic.loadUi 로 (그리고 다음 실행을 위해 변환해 둔다).
+
+    python PyQt_GUI/ui_loader.py        # 배포 전에 전부 변환 (pyuic5 와 같은 결과 + 원본 해시)
+
+- 변환 모듈에는 원본 .ui 의 해시(UI_HASH)를 넣어 두고, 읽을 때 .ui 와 비교한다 → 파일 시각과 무관
+- uic.loadUi 와 같게 이름 있는 위젯을 위젯 속성으로 붙인다 (page.textEdit, self.pushButton ...)
+- PyQt5.uic(XML 파서 + 코드 생성기)은 변환 모듈이 없을 때만 import 한다
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import sys
+
+from PyQt5 import QtWidgets
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPILED_DIR = os.path.join(BASE_DIR, "ui_compiled")
+
+UI_NAMES = ("dashboard", "sungp", "log", "new_set", "information")
+
+# LogPipeline 의 "kit" 로거 (이 파일은 단독 실행도 하므로 PyQt_Service 를 import 하지 않는다)
+logger = logging.getLogger("kit")
+
+
+def ui_path(name):
+    return os.path.join(BASE_DIR, f"{name}.ui")
+
+
+def compiled_path(name):
+    return os.path.join(COMPILED_DIR, f"{name}_ui.py")
+
+
+def _hash(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+# ========================================
+# 로드
+# ========================================
+def load_ui(name, baseinstance=None):
+    """
+    name(.ui 파일 이름, 확장자 제외) → 위젯.
+    baseinstance 가 있으면 그 위젯에 UI 를 만든다 (uic.loadUi(path, baseinstance) 와 같음).
+    """
+    with open(ui_path(name), "rb") as f:
+        source = f.read()
+
+    module = _compiled_module(name, _hash(source))
+    if module is None:
+        from PyQt5 import uic
+
+        widget = uic.loadUi(ui_path(name), baseinstance)
+        try:
+            compile_ui(name, source)
+        except Exception as e:
+            logger.warning(f"[UiLoader] {name}.ui 변환 실패: {e}")
+        return widget
+
+    widget = baseinstance
+    if widget is None:
+        widget = getattr(QtWidgets, module.BASE_CLASS)()
+
+    form = module.UI_CLASS()
+    form.setupUi(widget)
+    for attr, child in vars(form).items():
+        setattr(widget, attr, child)
+    return widget
+
+
+def _compiled_module(name, ui_hash):
+    """변환 모듈 (없거나 .ui 와 해시가 다르면 None)"""
+    path = compiled_path(name)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        spec = importlib.util.spec_from_file_location(f"ui_compiled.{name}_ui", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        logger.warning(f"[UiLoader] {name} 변환 모듈 읽기 실패 → .ui 로: {e}")
+        return None
+
+    if getattr(module, "UI_HASH", None) != ui_hash:
+        return None
+    return module
+
+
+# ========================================
+# 변환 (.ui → .py)
+# ========================================
+def compile_ui(name, source=None):
+    """name.ui → ui_compiled/name_ui.py"""
+    import io
+    import xml.etree.ElementTree as ET
+    from PyQt5 import uic
+
+    if source is None:
+        with open(ui_path(name), "rb") as f:
+            source = f.read()
+
+    root = ET.fromstring(source)
+    form_class = root.findtext("class")
+    base_class = root.find("widget").get("class")
+
+    code = io.StringIO()
+    uic.compileUi(io.StringIO(source.decode("utf-8")), code)
+    code.write(
+        f"\n\n"
+        f"UI_HASH = {_hash(source)!r}\n"
+        f"UI_CLASS = Ui_{form_class}\n"
+        f"BASE_CLASS = {base_class!r}\n"
+    )
+
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    path = compiled_path(name)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(code.getvalue())
+    os.replace(tmp, path)
+    return path
+
+
+def compile_all(names=UI_NAMES):
+    for name in names:
+        print("🛠 ", compile_ui(name))
+
+
+if __name__ == "__main__":
+    compile_all(sys.argv[1:] or UI_NAMES)
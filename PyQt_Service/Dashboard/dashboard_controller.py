@@ -1,25 +1,31 @@
-import threading
 import time
-from datetime import datetime
 from PyQt5 import QtWidgets, QtCore
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from PyQt_Service.Log.log_service import LogService
 from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.firmware_protocol import PILOT_LAMP_COLOR
+from PyQt_Service.Database.telemetry_ring import TelemetryRing, ring_path
+from PyQt_Service.Monitoring.live_plot import create_plot
+from PyQt_Service.Monitoring.ring_buffer import RingBuffer
+
+
+# X축: epoch 초 → 현지 시각 (matplotlib 은 (x, pos), pyqtgraph 축은 x 만 넘긴다)
+def format_time(x, pos=None):
+    return time.strftime("%H:%M", time.localtime(x))
 
 
 class DashboardController(QtCore.QObject):
+    ALL = "전체"                  # 장치 선택 콤보의 합산 보기 항목
+    RING_CAPACITY = 4096          # 보드별 총전압 링 파일 크기 (1분 주기면 약 3일)
 
-    def __init__(self, ui, serial_manager, system_state):
+    def __init__(self, ui, devices, scheduler, plot_backend=None):
         super().__init__()
 
         self.ui = ui
-        self.serial = serial_manager
-        self.system_state = system_state
+        self.devices = devices
+        self.scheduler = scheduler
 
-        self.log = LogService()
+        # 화면에 표시할 보드 (ALL 이면 전체 합산)
+        self.selected_id = devices.PRIMARY
 
         # ─────────────────────────────
         # UI Label 가져오기
@@ -29,6 +35,7 @@ class DashboardController(QtCore.QObject):
         self.label_solar = self.ui.findChild(QtWidgets.QLabel, "solar_power_label")
         self.label_status = self.ui.findChild(QtWidgets.QLabel, "label_5")
         self.graph_widget = self.ui.findChild(QtWidgets.QWidget, "widget_graph_area")
+        self.device_combo = self.ui.findChild(QtWidgets.QComboBox, "device_combo")
 
         self.label_pilot = self.ui.findChild(QtWidgets.QLabel, "label_8")
         self.label_commercial_fan = self.ui.findChild(QtWidgets.QLabel, "label_9")
@@ -36,204 +43,326 @@ class DashboardController(QtCore.QObject):
         self.label_halogen = self.ui.findChild(QtWidgets.QLabel, "label_11")
 
         # ─────────────────────────────
-        # 그래프 준비
+        # 그래프 (축은 한 번만 — 보드·보기 선택이 바뀔 때만 선을 다시 만든다)
+        # 그래프 라이브러리 import 가 무거우므로 첫 화면을 그린 뒤 build_plot() 으로 만든다
         # ─────────────────────────────
-        self.fig = Figure(figsize=(4, 2))
-        self.canvas = FigureCanvas(self.fig)
-        layout = QtWidgets.QVBoxLayout(self.graph_widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.canvas)
+        self.plot = None
+        self.plot_backend = plot_backend
+        self._plot_keys = None
 
-        self.time_buffer = []
-        self.voltage_buffer = []
+        # 보드별 총전압 기록 (장치 ID → RingBuffer[ts, voltage])
+        self.history = {}
         self.buffer_limit = 30
 
-        # UI 업데이트 타이머
+        # 보드별 총전압 링 파일 (재시작 시 history 복원)
+        self.rings = {}
+
+        # 라벨은 보드 상태가 바뀔 때만 갱신 (state_changed), 1초 타이머는 시각만
+        # (페이지가 가려지면 deactivate() 로 정지)
+        self.active = True
+        self._shown = {}            # 라벨 → 마지막으로 표시한 값
+        if self.label_time:
+            self.label_time.setTextFormat(QtCore.Qt.PlainText)
+            self.label_time.setStyleSheet("font-size:14pt;")
         self.timer_ui = QtCore.QTimer()
-        self.timer_ui.timeout.connect(self.update_ui)
+        self.timer_ui.timeout.connect(self.update_clock)
         self.timer_ui.start(1000)
 
-        # 1분마다 총전압 읽기 스레드
-        self.thread = threading.Thread(target=self.collect_voltage, daemon=True)
-        self.thread.start()
+        # 총전압·VC_MON·시스템 상태 — 모든 보드를 AcquisitionScheduler 하나가 주기 요청
+        # (주기는 PyQt_Service/Setting/polling.json 에서 조정)
+        self.scheduler.result_ready.connect(self._on_result)
+        self.devices.devices_changed.connect(self._on_devices_changed)
+        self.devices.state_changed.connect(self.on_state_changed)
+        if self.device_combo is not None:
+            self.device_combo.currentTextChanged.connect(self.select_device)
+        self._on_devices_changed()
+        self.update_ui()
+        self.update_clock()
 
     # ===============================================================
-    # 1분마다 총전압 읽기 (시리얼 하드웨어)
+    # 보드 목록 변경 → 그래프 기록 + 선택 콤보 갱신
     # ===============================================================
-    def collect_voltage(self):
-        while True:
-            voltage = self.read_total_voltage()
-            now = datetime.now().strftime("%H:%M")
-
-            if voltage is not None:
-                self.time_buffer.append(now)
-                self.voltage_buffer.append(voltage)
-
-                # 대시보드에 표시할 최신값 저장
-                self.system_state["latest_voltage"] = voltage
-
-            else:
-                LogManager.instance().log("⚠️ 총전압 갱신 실패")
+    def _on_devices_changed(self):
+        ids = self.devices.ids()
+
+        for device_id in ids:
+            if device_id not in self.history:
+                self.history[device_id] = self._restore_history(device_id)
+
+        for device_id in [d for d in self.history if d not in ids]:
+            del self.history[device_id]
+            ring = self.rings.pop(device_id, None)
+            if ring is not None:
+                ring.close()
+
+        if self.selected_id != self.ALL and self.selected_id not in ids:
+            self.selected_id = self.devices.PRIMARY
+
+        if self.device_combo is not None:
+            self.device_combo.blockSignals(True)
+            self.device_combo.clear()
+            self.device_combo.addItems(ids + [self.ALL])
+            self.device_combo.setCurrentText(self.selected_id)
+            self.device_combo.blockSignals(False)
+
+        self.update_graph()
+
+    def _restore_history(self, device_id):
+        """보드 총전압 버퍼 — 링 파일에 남아 있는 최근 값으로 채워서"""
+        history = RingBuffer(self.buffer_limit, ("voltage",))
+        try:
+            ring = TelemetryRing(ring_path(f"voltage_{device_id}"), ("voltage",), self.RING_CAPACITY)
+        except Exception as e:
+            LogManager.instance().error(f"[{device_id}] 전압 기록(링 파일) 열기 실패: {e}")
+            return history
+
+        self.rings[device_id] = ring
+        records = ring.recent(self.buffer_limit)
+        history.extend(records["ts"], records["voltage"])
+        return history
+
+    def build_plot(self):
+        """그래프 만들기 (StackApp 이 첫 화면을 그린 뒤 호출) → 모아 둔 기록을 바로 그림"""
+        if self.plot is not None:
+            return
+        self.plot = create_plot(self.plot_backend, figsize=(4, 2), x_formatter=format_time, labelsize=7)
+        layout = QtWidgets.QVBoxLayout(self.graph_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.plot.canvas)
+        self.update_graph()
 
-            # 버퍼 제한
-            if len(self.voltage_buffer) > self.buffer_limit:
-                self.time_buffer.pop(0)
-                self.voltage_buffer.pop(0)
-
-            self.update_graph()
-            time.sleep(60)
+    def close(self):
+        """링 파일 닫기 (프로그램 종료 시)"""
+        for ring in self.rings.values():
+            ring.close()
+        self.rings.clear()
 
     # ===============================================================
-    # '$re' → 총전압 읽기
+    # 페이지 표시 / 숨김 (StackApp.change_page)
     # ===============================================================
-    def read_total_voltage(self) -> float:
-        try:
-            if not (self.serial.is_connected and self.serial.port):
-                return None
-
-            self.serial.port.reset_input_buffer()
-            self.serial.port.write(b"$re")
-            self.serial.port.flush()
+    def activate(self):
+        """페이지가 보일 때 — 그래프·라벨을 한 번에 최신으로 맞추고 시각 갱신 재개"""
+        if self.active:
+            return
+        self.active = True
+        self.update_graph()
+        self.update_ui()
+        self.update_clock()
+        self.timer_ui.start(1000)
 
-            deadline = time.time() + 1.0
-            line = ""
+    def deactivate(self):
+        """페이지가 가려질 때 — 화면 갱신만 멈춘다 (총전압 수집·기록은 계속)"""
+        self.active = False
+        self.timer_ui.stop()
 
-            while time.time() < deadline:
-                raw = self.serial.port.readline().decode(errors="ignore").strip()
-                if "Voltage:" in raw:
-                    line = raw
-                    break
+    def select_device(self, device_id):
+        if device_id != self.ALL and self.devices.get(device_id) is None:
+            return
 
-            if not line:
-                self.log.add("⚠️ 총전압 응답 없음")
-                return None
+        self.selected_id = device_id
+        self.update_graph()
+        self.update_ui()
 
-            import re
-            match = re.search(r"Voltage:\s*([0-9.]+)", line)
-            if match:
-                voltage = float(match.group(1))
-                return voltage
+    # ===============================================================
+    # 주기 데이터 수신 (시리얼 하드웨어)
+    # ===============================================================
+    def collect_voltage(self, device_id=None):
+        """다음 주기를 기다리지 않고 바로 읽기 (device_id 생략 시 전체 보드)"""
+        for d in [device_id] if device_id else self.devices.ids():
+            self.scheduler.trigger(d, "total_voltage")
+
+    def on_connection_changed(self, device_id, state):
+        """SettingController 가 연결·끊김·재연결 시 호출 (GUI 스레드)"""
+        self.update_ui()
+        if state in ("connected", "reconnected"):
+            # 다음 1분 주기를 기다리지 않고 바로 다시 읽기
+            self.collect_voltage(device_id)
+
+    def _on_result(self, device_id, name, result):
+        """GUI 스레드에서 실행 (AcquisitionScheduler.result_ready)"""
+        if name == "total_voltage":
+            self._append_voltage(device_id, result)
+            return
+
+        device = self.devices.get(device_id)
+        if device is None or result is None:
+            return
+
+        # 상태 저장소가 바뀐 값만 state_changed 로 알린다 → on_state_changed
+        if name == "snapshot":
+            # '$w' 한 줄 → 보드 상태 전체를 한 번에 교체
+            device.state.update(result.as_state())
+        elif name == "vcmon":
+            device.state["last_power"] = result.power
+        elif name == "cell_voltages":
+            device.state["cell_voltages"] = result
+        elif name == "system_status":
+            # 실제 출력 상태로 맞춤 (한 번에 반영)
+            values = {
+                key: getattr(result, key)
+                for key in ("fan_commercial", "fan_battery", "halogen")
+                if getattr(result, key) is not None
+            }
+            if result.pilot is not None:
+                values["pilot"] = PILOT_LAMP_COLOR[result.pilot]
+            device.state.update(values)
+
+    def _append_voltage(self, device_id, voltage):
+        device = self.devices.get(device_id)
+        if device is None:
+            return
+
+        now = time.time()
+        history = self.history.get(device_id)
+        if history is None:
+            history = self.history[device_id] = self._restore_history(device_id)
+
+        if voltage is not None:
+            history.append(now, voltage)
+
+            ring = self.rings.get(device_id)
+            if ring is not None:
+                ring.append(now, voltage)
+
+            # 대시보드에 표시할 최신값 저장
+            device.state["latest_voltage"] = voltage
 
-        except Exception as e:
-            self.log.add(f"⚠️ read_total_voltage 오류: {e}")
+        else:
+            LogManager.instance().warning(f"[{device_id}] 총전압 갱신 실패")
 
-        return None
+        if self.selected_id in (device_id, self.ALL):
+            self.update_graph()
 
     # ===============================================================
     # 그래프 업데이트
     # ===============================================================
     def update_graph(self):
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
+        if not self.active or self.plot is None:
+            return
 
-        if self.voltage_buffer:
-            ax.plot(
-                self.time_buffer,
-                self.voltage_buffer,
-                color="#4C934C",
-                linewidth=1.8,
-            )
+        if self.selected_id == self.ALL:
+            keys = tuple(self.history)
+        else:
+            keys = (self.selected_id,) if self.selected_id in self.history else ()
+
+        # 보여줄 선 구성이 바뀌었을 때만 선·범례를 다시 만든다
+        if (self.selected_id, keys) != self._plot_keys:
+            self._plot_keys = (self.selected_id, keys)
+            self.plot.clear()
+            if self.selected_id == self.ALL:
+                for device_id in keys:
+                    self.plot.line(device_id, linewidth=1.4, label=device_id)
+                self.plot.legend(fontsize=6, loc="lower left")
+            else:
+                for device_id in keys:
+                    self.plot.line(device_id, color="#4C934C", linewidth=1.8)
+                self.plot.legend()
 
-        ax.grid(True)
-        ax.tick_params(axis="y", labelsize=7)
-        ax.tick_params(axis="x", labelsize=7)
+        for device_id in keys:
+            history = self.history[device_id]
+            self.plot.set_data(device_id, history.view("ts"), history.view("voltage"))
 
-        self.canvas.draw_idle()
+        self.plot.refresh()
 
     # ===============================================================
-    # UI 업데이트 (1초)
+    # 보드 상태 변경 → 바뀐 라벨만 갱신
     # ===============================================================
-    def update_ui(self):
+    def on_state_changed(self, device_id, keys=None):
+        """DeviceRegistry.state_changed (GUI 스레드) — 보고 있는 보드(또는 전체 보기)일 때만"""
+        if self.selected_id in (device_id, self.ALL):
+            self.update_ui()
 
-        # (1) 현재 시각
-        now = datetime.now().strftime("%H:%M:%S")
-        if self.label_time:
-            self.label_time.setText(
-                f"<html><body><p>"
-                f"<span style='font-size:14pt;'>현재 시각 : </span>"
-                f"<span style='font-size:14pt; color:#00ac00;'>{now}</span>"
-                f"</p></body></html>"
-            )
-
-        # (2) 이차전지 모듈 상태 (총전압)
-        latest_voltage = self.system_state.get("latest_voltage", 0.0)
-        batt_text = f"{latest_voltage:.2f} V" if latest_voltage else "---- V"
+    # ===============================================================
+    # 현재 시각 (1초) — 서식 없는 텍스트만 교체
+    # ===============================================================
+    def update_clock(self):
+        if self.label_time and self.active:
+            self.label_time.setText(time.strftime("현재 시각 : %H:%M:%S"))
 
-        self.label_batt.setText(
-            f"<html><body><p>"
-            f"<span style='font-size:14pt;'>이차전지 모듈 상태 : </span>"
-            f"<span style='font-size:14pt; color:#00ac00;'>{batt_text}</span>"
+    # ===============================================================
+    # 라벨 — 표시할 값이 그대로면 setText 하지 않음 (서식 있는 텍스트 재해석·재배치 방지)
+    # ===============================================================
+    def _show(self, label, title, text, color, center=False):
+        key = (title, text, color, center)
+        if label is None or self._shown.get(label) == key:
+            return
+
+        self._shown[label] = key
+        align = " align='center'" if center else ""
+        label.setText(
+            f"<html><body><p{align}>"
+            f"<span style='font-size:14pt;'>{title} : </span>"
+            f"<span style='font-size:14pt; color:{color};'>{text}</span>"
             f"</p></body></html>"
         )
 
-        # (3) 태양광 발전량 — MonitoringController에서 전달된 난수 power
-        solar_p = self.system_state.get("last_power", 0.0)
+    def update_ui(self):
+        """상태 라벨 전체 (바뀐 것만 실제로 갱신)"""
+        if not self.active:
+            return
 
-        self.label_solar.setText(
-            f"<html><body><p>"
-            f"<span style='font-size:14pt;'>태양광 발전 데이터 : </span>"
-            f"<span style='font-size:14pt; color:#930b0d;'>{solar_p:.2f} W</span>"
-            f"</p></body></html>"
-        )
+        if self.selected_id == self.ALL:
+            self._update_aggregate_ui()
+            return
 
-        # (4) 연결 상태
-        if self.serial.is_connected:
-            status_color = "#0014a9"
-            status_text = "정상"
-        else:
-            status_color = "#930b0d"
-            status_text = "연결해제"
+        device = self.devices.get(self.selected_id)
+        state = device.state.snapshot()
 
-        self.label_status.setText(
-            f"<html><body><p>"
-            f"<span style='font-size:14pt;'>연결 상태 : </span>"
-            f"<span style='font-size:14pt; color:{status_color};'>{status_text}</span>"
-            f"</p></body></html>"
-        )
+        # 이차전지 모듈 상태 (총전압)
+        latest_voltage = state.get("latest_voltage", 0.0)
+        batt_text = f"{latest_voltage:.2f} V" if latest_voltage else "---- V"
+        self._show(self.label_batt, "이차전지 모듈 상태", batt_text, "#00ac00")
 
-        # ─────────────────────────────
-        # 시스템 상태 표시 (pilot, fan, halogen)
-        # ─────────────────────────────
+        # 태양광 발전량 — MonitoringController가 받은 VC_MON power
+        solar_p = state.get("last_power", 0.0)
+        self._show(self.label_solar, "태양광 발전 데이터", f"{solar_p:.2f} W", "#930b0d")
 
-        # 파일럿 램프
-        pilot_state = self.system_state.get("pilot", "RED")
-        color = "#00ac00" if pilot_state == "GREEN" else "#930b0d"
-        self.label_pilot.setText(
-            f"<html><body><p align='center'>"
-            f"<span style='font-size:14pt;'>🚦 파일럿 램프 : </span>"
-            f"<span style='font-size:14pt; color:{color};'>{pilot_state}</span>"
-            f"</p></body></html>"
-        )
+        # 연결 상태
+        if device.serial.is_connected:
+            status_color, status_text = "#0014a9", "정상"
+        elif device.serial.is_reconnecting:
+            status_color, status_text = "#930b0d", "재연결 중"
+        else:
+            status_color, status_text = "#930b0d", "연결해제"
+        self._show(self.label_status, "연결 상태", status_text, status_color)
 
-        # 상용 선풍기
-        fc = self.system_state.get("fan_commercial", False)
-        color = "#00ac00" if fc else "#930b0d"
-        text = "ON" if fc else "OFF"
-        self.label_commercial_fan.setText(
-            f"<html><body><p align='center'>"
-            f"<span style='font-size:14pt;'>🌪️ 상용 선풍기 : </span>"
-            f"<span style='font-size:14pt; color:{color};'>{text}</span>"
-            f"</p></body></html>"
-        )
+        # 시스템 상태 표시 (pilot, fan, halogen)
+        pilot_state = state.get("pilot", "RED")
+        color = "#00ac00" if pilot_state == "GREEN" else "#930b0d"
+        self._show(self.label_pilot, "🚦 파일럿 램프", pilot_state, color, center=True)
 
-        # 배터리 선풍기
-        fb = self.system_state.get("fan_battery", False)
-        color = "#00ac00" if fb else "#930b0d"
-        text = "ON" if fb else "OFF"
-        self.label_battery_fan.setText(
-            f"<html><body><p align='center'>"
-            f"<span style='font-size:14pt;'>🔋 배터리 선풍기 : </span>"
-            f"<span style='font-size:14pt; color:{color};'>{text}</span>"
-            f"</p></body></html>"
-        )
+        for label, title, key in (
+            (self.label_commercial_fan, "🌪️ 상용 선풍기", "fan_commercial"),
+            (self.label_battery_fan, "🔋 배터리 선풍기", "fan_battery"),
+            (self.label_halogen, "💡 할로겐 램프", "halogen"),
+        ):
+            on = state.get(key, False)
+            self._show(label, title, "ON" if on else "OFF", "#00ac00" if on else "#930b0d", center=True)
 
-        # 할로겐 램프
-        halogen = self.system_state.get("halogen", False)
-        color = "#00ac00" if halogen else "#930b0d"
-        text = "ON" if halogen else "OFF"
-        self.label_halogen.setText(
-            f"<html><body><p align='center'>"
-            f"<span style='font-size:14pt;'>💡 할로겐 램프 : </span>"
-            f"<span style='font-size:14pt; color:{color};'>{text}</span>"
-            f"</p></body></html>"
-        )
+    # ===============================================================
+    # '전체' 보기 — 여러 보드 합산
+    # ===============================================================
+    def _update_aggregate_ui(self):
+        agg = self.devices.aggregate_state()
+        count = agg["count"]
+
+        # 평균 총전압 / 발전량 합계
+        batt_text = f"평균 {agg['latest_voltage']:.2f} V" if agg["latest_voltage"] else "---- V"
+        self._show(self.label_batt, "이차전지 모듈 상태", batt_text, "#00ac00")
+        self._show(self.label_solar, "태양광 발전 데이터", f"합계 {agg['last_power']:.2f} W", "#930b0d")
+
+        # 연결된 보드 수
+        status_color = "#0014a9" if agg["connected"] == count else "#930b0d"
+        self._show(self.label_status, "연결 상태", f"{agg['connected']}/{count} 정상", status_color)
+
+        # 출력 장치는 켜진 보드 수로 표시
+        for label, title, key in (
+            (self.label_pilot, "🚦 파일럿 램프", "pilot_green"),
+            (self.label_commercial_fan, "🌪️ 상용 선풍기", "fan_commercial"),
+            (self.label_battery_fan, "🔋 배터리 선풍기", "fan_battery"),
+            (self.label_halogen, "💡 할로겐 램프", "halogen"),
+        ):
+            on = agg[key]
+            color = "#00ac00" if on else "#930b0d"
+            text = f"GREEN {on}/{count}" if key == "pilot_green" else f"ON {on}/{count}"
+            self._show(label, title, text, color, center=True)
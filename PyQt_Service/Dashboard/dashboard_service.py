@@ -1,5 +1,7 @@
 import time
-import re
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.firmware_protocol import parse_reply
 
 class DashboardService:
     def __init__(self, serial_instance=None):
@@ -9,120 +11,68 @@ class DashboardService:
     # ============================================================
     # 안정적인 시리얼 송신 + 응답 수신 함수 (개선버전)
     # ============================================================
-    def send_cmd(self, cmd):
+    def _request(self, cmd):
         """
         Arduino에 명령 전달: $cmd e
-        Arduino 응답을 최대 1초간 기다리고 개행(\n) 기준으로 수신
+        SerialManager 리더 스레드가 해당 명령의 응답 줄을 모아 돌려준다 (최대 1초)
         """
         if self.serial is None:
             return None
 
-        full_cmd = f"${cmd}e"
-
         try:
-            # 🔥 기존 버퍼 정리
-            self.serial.reset_input_buffer()
-            self.serial.write(full_cmd.encode())
-            self.serial.flush()
+            lines = self.serial.request(cmd, timeout=1.0)
         except Exception as e:
-            print("Serial Write Error:", e)
+            LogManager.instance().warning(f"[Dashboard] 시리얼 요청 실패 ({cmd}): {e}")
             return None
 
-        # 🔥 Arduino 응답 수신 대기
-        timeout = time.time() + 1.0  # 최대 1초 기다림
-        buffer = ""
-
-        while time.time() < timeout:
-            if self.serial.in_waiting > 0:
-                try:
-                    buffer += self.serial.read(self.serial.in_waiting).decode(errors="ignore")
-                except:
-                    pass
-
-                # Arduino println → \n 으로 끝남
-                if buffer.endswith("\n") or buffer.endswith("\r\n"):
-                    break
-
-            time.sleep(0.01)
+        if not lines:
+            return None
 
         # 수신이 있었으면 연결 유지 시간 갱신
-        if buffer.strip():
-            self.last_received_ts = time.time()
+        self.last_received_ts = time.time()
 
-        return buffer
+        return lines
+
+    def send_cmd(self, cmd):
+        """응답 줄을 개행으로 이어 붙인 문자열 반환 (응답 없으면 None)"""
+        lines = self._request(cmd)
+        if lines is None:
+            return None
+        return "\n".join(lines)
 
     # ============================================================
     # 1) Total Battery Voltage 읽기  ($r)
     # ============================================================
     def read_total_voltage(self):
-        raw = self.send_cmd("r")
-        if raw is None:
-            return None
-
-        # 예: "Voltage: 12.345V"
-        match = re.search(r"Voltage:\s*([\d\.]+)V", raw)
-        if match:
-            try:
-                return float(match.group(1))
-            except:
-                return None
-
-        return None
+        # 예: "A3 (Total) - ADC: 512 | Voltage: 12.500V"
+        reading = parse_reply("r", self._request("r"))
+        return reading.voltage if reading is not None else None
 
     # ============================================================
     # 2) 태양광 Power 읽기 ($k)
     # ============================================================
     def read_solar_power(self):
-        raw = self.send_cmd("k")
-        if raw is None:
-            return None
-
         # 예: "Power: 18.52 W"
-        match = re.search(r"Power:\s*([\d\.]+)\s*W", raw)
-        if match:
-            try:
-                return float(match.group(1))
-            except:
-                return None
-
-        return None
+        reading = parse_reply("k", self._request("k"))
+        return reading.power if reading is not None else None
 
     # ============================================================
     # 3) 전체 시스템 상태 읽기 ($u)
     # ============================================================
     def read_system_status(self):
-        raw = self.send_cmd("u")
-        if raw is None:
+        status = parse_reply("u", self._request("u"))
+        if status is None:
             return None
 
-        status = {
-            "pilot": None,
-            "fan_commercial": None,
-            "fan_battery": None,
-            "halogen": None
-        }
+        def on_off(value):
+            return None if value is None else ("ON" if value else "OFF")
 
-        # Pilot Lamp 상태
-        m_pilot = re.search(r"Pilot Lamp.*: *(GREEN|RED|OFF)", raw)
-        if m_pilot:
-            status["pilot"] = m_pilot.group(1)
-
-        # Commercial Fan 상태
-        m_fc = re.search(r"Commercial Power:\s*(ON|OFF)", raw)
-        if m_fc:
-            status["fan_commercial"] = m_fc.group(1)
-
-        # Battery Fan 상태
-        m_fb = re.search(r"Battery Power:\s*(ON|OFF)", raw)
-        if m_fb:
-            status["fan_battery"] = m_fb.group(1)
-
-        # Halogen Lamp 상태
-        m_h = re.search(r"Halogen Lamp Status.*:\s*(ON|OFF)", raw)
-        if m_h:
-            status["halogen"] = m_h.group(1)
-
-        return status
+        return {
+            "pilot": status.pilot,
+            "fan_commercial": on_off(status.fan_commercial),
+            "fan_battery": on_off(status.fan_battery),
+            "halogen": on_off(status.halogen)
+        }
 
     # ============================================================
     # 연결 상태 판단
@@ -0,0 +1,47 @@
+-- PyQt_Service/Database/create_table_measurement.sql
+-- VC_MON 측정값 시계열 테이블 + 주기별 집계 테이블 (MySQL / SQLite 공통 문법)
+--
+-- - ts 는 epoch 초(소수점 = 밀리초 이하). 시간대 변환 없이 그대로 범위 조회한다.
+-- - PRIMARY KEY (device_id, ts) : 보드별 시간 범위 조회가 인덱스 한 구간 읽기로 끝난다.
+--   (MySQL InnoDB 는 이 순서로 행을 저장하므로 몇 달치가 쌓여도 조회 비용이 범위 크기에만 비례)
+-- - 같은 보드·같은 시각의 중복 행은 INSERT IGNORE / INSERT OR IGNORE 로 버린다.
+
+CREATE TABLE IF NOT EXISTS measurement (
+    device_id  VARCHAR(32)  NOT NULL,
+    ts         DOUBLE       NOT NULL,
+    voltage    DOUBLE       NOT NULL,   -- V
+    current    DOUBLE       NOT NULL,   -- A
+    power      DOUBLE       NOT NULL,   -- W
+    capacity   DOUBLE       NOT NULL,   -- Ah
+    PRIMARY KEY (device_id, ts)
+);
+
+-- 주기별 집계 (1분 / 1시간 / 1일) — MonitoringService 가 샘플이 들어올 때마다 갱신한다
+--
+-- - period : 버킷 크기(초) 60 / 3600 / 86400, bucket : 버킷 시작 epoch 초 (1일 버킷은 현지 자정)
+-- - 평균은 *_sum / n 으로 구한다 (합을 저장해야 버킷을 이어 붙여도 평균이 정확하다)
+-- - energy : 버킷 안의 전력량(Wh) 합, capacity : 버킷 마지막 용량(Ah), last_ts : 버킷 마지막 샘플 시각
+-- - 행 전체를 REPLACE 로 덮어쓴다 (MySQL / SQLite 모두 지원)
+
+CREATE TABLE IF NOT EXISTS measurement_rollup (
+    device_id     VARCHAR(32)  NOT NULL,
+    period        INT          NOT NULL,
+    bucket        DOUBLE       NOT NULL,
+    n             INT          NOT NULL,
+    voltage_min   DOUBLE       NOT NULL,
+    voltage_max   DOUBLE       NOT NULL,
+    voltage_sum   DOUBLE       NOT NULL,
+    voltage_last  DOUBLE       NOT NULL,
+    current_min   DOUBLE       NOT NULL,
+    current_max   DOUBLE       NOT NULL,
+    current_sum   DOUBLE       NOT NULL,
+    current_last  DOUBLE       NOT NULL,
+    power_min     DOUBLE       NOT NULL,
+    power_max     DOUBLE       NOT NULL,
+    power_sum     DOUBLE       NOT NULL,
+    power_last    DOUBLE       NOT NULL,
+    energy        DOUBLE       NOT NULL,
+    capacity      DOUBLE       NOT NULL,
+    last_ts       DOUBLE       NOT NULL,
+    PRIMARY KEY (device_id, period, bucket)
+);
@@ -0,0 +1,107 @@
+# PyQt_Service/Database/db.py
+"""
+측정 데이터 DB 연결 관리 (MySQL / SQLite).
+
+- 설정은 db.json 의 "backend" 로 고른다.
+    sqlite : 서버 없이 파일 하나로 동작하는 내장 DB (오프라인·노트북용, 기본값)
+    mysql  : mysql-connector-python 필요 (설치돼 있지 않으면 connect() 에서 오류)
+- DB-API 연결은 스레드끼리 공유하지 않는다 → 쓰는 스레드마다 connect() 로 따로 연다.
+- 두 DB 의 SQL 차이(자리표시자, 중복 무시 INSERT)는 placeholder / insert_ignore 로 맞춘다.
+"""
+
+import json
+import os
+import re
+import sqlite3
+
+from PyQt_Service.Log.log_manager import LogManager
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "db.json")
+SCHEMA_PATH = os.path.join(BASE_DIR, "create_table_measurement.sql")
+
+
+class Database:
+    SQLITE = "sqlite"
+    MYSQL = "mysql"
+
+    def __init__(self, backend=SQLITE, path=None, **mysql_options):
+        if backend not in (self.SQLITE, self.MYSQL):
+            raise ValueError(f"unknown DB backend: {backend}")
+
+        self.backend = backend
+        self.path = path or os.path.join(BASE_DIR, "measurement.db")
+        self.mysql_options = mysql_options
+
+    @classmethod
+    def from_config(cls, config_path=CONFIG_PATH):
+        """db.json 으로 생성 (파일이 없거나 잘못되면 SQLite 기본값)"""
+        try:
+            with open(config_path, encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            LogManager.instance().warning(f"[DB] db.json 읽기 실패 → SQLite 기본값: {e}")
+            return cls()
+
+        backend = config.get("backend", cls.SQLITE)
+        if backend == cls.MYSQL:
+            return cls(cls.MYSQL, **config.get("mysql", {}))
+
+        path = config.get("sqlite", {}).get("path", "measurement.db")
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(os.path.abspath(config_path)), path)
+        return cls(cls.SQLITE, path)
+
+    def __repr__(self):
+        if self.backend == self.SQLITE:
+            return f"sqlite:{self.path}"
+        return "mysql://{host}:{port}/{database}".format(
+            host=self.mysql_options.get("host", "localhost"),
+            port=self.mysql_options.get("port", 3306),
+            database=self.mysql_options.get("database", ""),
+        )
+
+    # ─────────────────────────────────────
+    # 백엔드별 SQL 차이
+    # ─────────────────────────────────────
+    @property
+    def placeholder(self):
+        return "?" if self.backend == self.SQLITE else "%s"
+
+    @property
+    def insert_ignore(self):
+        return "INSERT OR IGNORE" if self.backend == self.SQLITE else "INSERT IGNORE"
+
+    # ─────────────────────────────────────
+    # 연결 / 스키마
+    # ─────────────────────────────────────
+    def connect(self):
+        """새 연결 반환 (자동 커밋 없음 — 호출한 쪽이 commit)"""
+        if self.backend == self.SQLITE:
+            conn = sqlite3.connect(self.path, timeout=10.0)
+            # WAL: 쓰기 중에도 다른 연결이 읽을 수 있고, 커밋마다 fsync 하지 않는다
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            return conn
+
+        try:
+            import mysql.connector
+        except ImportError:
+            raise RuntimeError("MySQL 백엔드에는 mysql-connector-python 이 필요합니다")
+
+        return mysql.connector.connect(autocommit=False, **self.mysql_options)
+
+    def init_schema(self, conn):
+        """create_table_measurement.sql 실행 (이미 있으면 그대로)"""
+        with open(SCHEMA_PATH, encoding="utf-8") as f:
+            sql = re.sub(r"--[^\n]*", "", f.read())
+
+        cur = conn.cursor()
+        try:
+            for statement in sql.split(";"):
+                if statement.strip():
+                    cur.execute(statement)
+            conn.commit()
+        finally:
+            cur.close()
@@ -0,0 +1,71 @@
+# PyQt_Service/Database/insert_dummy_measurement.py
+"""
+measurement 테이블에 더미 데이터를 넣는다 (조회·집계 시험용 / 쓰기 속도 확인용).
+
+    python PyQt_Service/Database/insert_dummy_measurement.py --days 30 --interval 1.0 [--device KIT-1]
+
+- 낮(06~18시)에는 태양광 패널 출력을 사인 곡선으로, 밤에는 0 근처로 만든다.
+- MonitoringRepository 와 같은 배치 INSERT 로 넣고 초당 행 수를 출력한다.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PyQt_Service.Monitoring.monitoring_collector import VcMonSample
+from PyQt_Service.Monitoring.monitoring_repository import MonitoringRepository
+from PyQt_Service.Database.db import Database
+
+
+def dummy_samples(start, end, interval, rng):
+    capacity = 0.0
+    ts = start
+    while ts < end:
+        hour = time.localtime(ts).tm_hour + time.localtime(ts).tm_min / 60
+        sun = max(0.0, math.sin((hour - 6) / 12 * math.pi)) if 6 <= hour <= 18 else 0.0
+
+        voltage = 17.0 + 4.0 * sun + rng.uniform(-0.2, 0.2) if sun else rng.uniform(0.0, 2.0)
+        current = 0.15 * sun + rng.uniform(0.0, 0.01)
+        capacity += current * interval / 3600
+
+        yield VcMonSample(ts, round(voltage, 2), round(current, 3), round(voltage * current, 2), round(capacity, 3))
+        ts += interval
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="샘플 간격(초)")
+    parser.add_argument("--device", default="KIT-1")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    db = Database.from_config()
+    repository = MonitoringRepository(db)
+    repository.MAX_PENDING = float("inf")
+
+    end = time.time()
+    start = end - args.days * 86400
+    print(f"📦 {db} ← {args.device}, {args.days} 일치 ({args.interval}s 간격)")
+
+    began = time.perf_counter()
+    count = 0
+    for sample in dummy_samples(start, end, args.interval, random.Random(args.seed)):
+        repository.add(args.device, sample)
+        count += 1
+    queued = time.perf_counter() - began
+
+    repository.close(timeout=3600)
+    elapsed = time.perf_counter() - began
+
+    print(f"✅ {count:,} 행 (큐 적재 {count / queued:,.0f} 행/s, DB 기록 {count / elapsed:,.0f} 행/s)")
+    print("   stats:", repository.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# PyQt_Service/Database/rebuild_rollup.py
+"""
+measurement 원본으로 measurement_rollup(1분 / 1시간 / 1일 집계)을 다시 만든다.
+
+    python PyQt_Service/Database/rebuild_rollup.py [--device KIT-1] [--days 30]
+
+- 집계 기능이 생기기 전에 쌓인 데이터나, 집계 규칙을 바꾼 뒤에 사용한다.
+- 프로그램(stack.py)을 끈 상태에서 실행한다 (실행 중이면 현재 버킷을 서로 덮어쓸 수 있음).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PyQt_Service.Database.db import Database
+from PyQt_Service.Monitoring.monitoring_repository import MonitoringRepository
+from PyQt_Service.Monitoring.monitoring_service import MonitoringService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--device", default=None, help="보드 ID (기본: 전체)")
+    parser.add_argument("--days", type=float, default=None, help="최근 N 일만 (기본: 전체)")
+    args = parser.parse_args()
+
+    db = Database.from_config()
+    repository = MonitoringRepository(db)
+    service = MonitoringService(repository)
+
+    start = time.time() - args.days * 86400 if args.days else None
+    print(f"📦 {db} 집계 재생성")
+
+    def progress(device_id, rows):
+        print(f"   {device_id}: {rows:,} 행", end="\r")
+
+    began = time.perf_counter()
+    written = service.backfill(args.device, start, progress=progress)
+    elapsed = time.perf_counter() - began
+
+    repository.close()
+    print(f"\n✅ 버킷 {written:,} 행 기록 ({elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# PyQt_Service/Database/telemetry_ring.py
+"""
+최근 측정값을 담는 고정 크기 링 파일 (mmap).
+
+- 프로그램이 죽거나 다시 시작해도 그래프를 바로 채울 수 있도록 최근 샘플만 파일에 남긴다.
+  (몇 달치 기록은 measurement 테이블 — 여기는 최근 몇 시간만, DB 없이)
+- 파일 = 헤더(256 바이트) + 레코드 capacity 개. 레코드는 seq, ts, 필드 값(float64).
+- append() 는 슬롯 하나와 헤더의 쓰기 위치만 고친다 (O(1)). fsync 는 하지 않는다.
+  → 프로세스가 죽어도 페이지 캐시의 내용은 OS 가 파일에 기록한다 (전원 차단 시 최근 일부 유실 가능).
+- 슬롯마다 seq 를 마지막에 쓰므로, 쓰다 만 레코드는 읽을 때 seq 가 맞지 않아 걸러진다.
+- 필드 구성이나 크기가 바뀌면 파일을 새로 만든다.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from operator import attrgetter
+
+import numpy as np
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RECENT_DIR = os.path.join(BASE_DIR, "recent")
+
+
+def ring_path(name):
+    """RECENT_DIR 안의 링 파일 경로 ('vcmon_KIT-1' → .../recent/vcmon_KIT-1.ring)"""
+    return os.path.join(RECENT_DIR, f"{name}.ring")
+
+
+class TelemetryRing:
+    MAGIC = b"KITRING1"
+    HEADER_SIZE = 256
+    # magic | record_size u32 | capacity u64 | count u64 | 필드 이름(쉼표 구분, 나머지 영역)
+    _HEADER = struct.Struct("<8sIQQ")
+    _COUNT_OFFSET = 20
+
+    DEFAULT_CAPACITY = 1 << 18      # 262,144 개 ≈ 10 Hz 로 7시간
+
+    def __init__(self, path, fields, capacity=DEFAULT_CAPACITY):
+        self.path = path
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.dtype = np.dtype([("seq", "<u8"), ("ts", "<f8")] + [(f, "<f8") for f in self.fields])
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._mm = None
+        self._open()
+
+    # ─────────────────────────────────────
+    # 열기 / 닫기
+    # ─────────────────────────────────────
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        size = self.HEADER_SIZE + self.capacity * self.dtype.itemsize
+        names = ",".join(self.fields).encode()
+        if len(names) > self.HEADER_SIZE - self._HEADER.size:
+            raise ValueError("too many ring fields")
+
+        fresh = not self._header_matches(size, names)
+        self._file = open(self.path, "r+b" if not fresh else "w+b")
+        if fresh:
+            self._file.truncate(size)
+
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        if fresh:
+            self._mm[:self._HEADER.size] = self._HEADER.pack(self.MAGIC, self.dtype.itemsize, self.capacity, 0)
+            self._mm[self._HEADER.size:self._HEADER.size + len(names)] = names
+
+        self._data = np.ndarray((self.capacity,), self.dtype, buffer=self._mm, offset=self.HEADER_SIZE)
+        self._seq = self._data["seq"]
+        self.count = self._HEADER.unpack_from(self._mm)[3]
+
+    def _header_matches(self, size, names):
+        try:
+            if os.path.getsize(self.path) != size:
+                return False
+            with open(self.path, "rb") as f:
+                head = f.read(self.HEADER_SIZE)
+        except OSError:
+            return False
+
+        magic, record_size, capacity, _ = self._HEADER.unpack_from(head)
+        stored = head[self._HEADER.size:].rstrip(b"\0")
+        return (magic, record_size, capacity, stored) == (self.MAGIC, self.dtype.itemsize, self.capacity, names)
+
+    def flush(self):
+        """페이지 캐시를 디스크로 (종료 시 1번이면 충분)"""
+        with self._lock:
+            if self._mm is not None:
+                self._mm.flush()
+
+    def close(self):
+        with self._lock:
+            if self._mm is None:
+                return
+            self._mm.flush()
+            del self._data, self._seq       # mmap 을 닫기 전에 numpy 뷰 해제
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    # ─────────────────────────────────────
+    # 쓰기 / 읽기
+    # ─────────────────────────────────────
+    def append(self, ts, *values):
+        """샘플 1개 기록 (values 는 fields 순서)"""
+        with self._lock:
+            if self._mm is None:
+                return
+            seq = self.count + 1
+            slot = self.count % self.capacity
+            self._data[slot] = (0, ts, *values)
+            self._seq[slot] = seq                # 레코드가 다 써진 뒤에 seq 표시
+            struct.pack_into("<Q", self._mm, self._COUNT_OFFSET, seq)
+            self.count = seq
+
+    def sink(self):
+        """MonitoringCollector.add_sink() 에 넘길 콜백 — sample.timestamp + fields 와 같은 이름의 속성"""
+        get = attrgetter(*self.fields)
+        if len(self.fields) == 1:
+            return lambda sample: self.append(sample.timestamp, get(sample))
+        return lambda sample: self.append(sample.timestamp, *get(sample))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def recent(self, count=None, since=None):
+        """
+        최근 레코드 (오래된 것부터, numpy 구조체 배열 사본).
+        count : 최대 개수 / since : 이 시각(epoch 초) 이후만
+        """
+        with self._lock:
+            if self._mm is None:
+                return np.empty(0, self.dtype)
+
+            n = len(self) if count is None else min(count, len(self))
+            first = self.count - n
+            slots = np.arange(first, self.count) % self.capacity
+            records = self._data[slots]
+
+        # 쓰다 만 슬롯(seq 불일치) 제외
+        records = records[records["seq"] == np.arange(first + 1, first + n + 1)]
+        if since is not None:
+            records = records[records["ts"] >= since]
+        return records
+
+    def rows(self, count=None, since=None):
+        """recent() 를 (ts, *fields) 튜플 리스트로"""
+        records = self.recent(count, since)
+        return list(zip(*(records[name].tolist() for name in ("ts",) + self.fields)))
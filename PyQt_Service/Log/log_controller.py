@@ -1,8 +1,22 @@
-from PyQt5.QtCore import QObject, pyqtSignal
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import QFileDialog
 
 class LogController(QObject):
-    append_signal = pyqtSignal(str)
+    """
+    로그 페이지.
+    - add_log() 는 큐에 넣기만 한다 (어느 스레드에서든, 시그널 없음)
+    - FLUSH_INTERVAL 마다 GUI 스레드에서 모인 줄을 한 번에 붙인다 (appendPlainText 1번, 최대 FLUSH_MAX 줄)
+      큐만으로 화면이 다 차면 붙이지 않고 화면 전체를 바꾼다 (가득 찬 문서에 붙이면 줄마다 앞줄을 지워 느림)
+    - 화면은 최근 MAX_LINES 줄만 유지 (QPlainTextEdit.maximumBlockCount) → 메모리·붙이기 비용 일정
+    - 페이지가 가려지면 붙이기를 멈추고, 큐도 MAX_LINES 줄까지만 모아 둔다
+    """
+
+    FLUSH_INTERVAL = 200    # ms
+    FLUSH_MAX = 500         # 한 번에 붙일 최대 줄 수 (나머지는 다음 주기)
+    MAX_LINES = 5000        # 화면·큐에 남길 최대 줄 수
 
     def __init__(self, ui):
         super().__init__()
@@ -12,27 +26,59 @@ class LogController(QObject):
         self.textbox = ui.findChild(type(ui.textEdit), "textEdit")
         self.btn_save = ui.findChild(type(ui.pushButton_2), "pushButton_2")
         self.btn_clear = ui.findChild(type(ui.pushButton_3), "pushButton_3")
+        self.textbox.setMaximumBlockCount(self.MAX_LINES)
 
         # 버튼 기능 연결
         self.btn_save.clicked.connect(self.save_logs)
         self.btn_clear.clicked.connect(self.clear_logs)
 
-        # 백그라운드 스레드 → UI 를 위한 시그널 연결
-        self.append_signal.connect(self._append_text)
+        # 백그라운드 스레드 → 큐 → 타이머로 UI 반영
+        self._queue = deque(maxlen=self.MAX_LINES)
+        self.active = True
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.flush)
+        self.timer.start(self.FLUSH_INTERVAL)
 
     def add_log(self, message: str):
         """백그라운드 스레드에서도 안전하게 호출 가능"""
-        self.append_signal.emit(message)
+        self._queue.append(message)
+
+    def flush(self):
+        """UI 스레드에서 실행 — 큐에 모인 줄을 한 번에"""
+        queue = self._queue
+        if not queue:
+            return
+
+        if len(queue) >= self.MAX_LINES:
+            lines = [queue.popleft() for _ in range(len(queue))]
+            self.textbox.setPlainText("\n".join(lines))
+            self.textbox.moveCursor(QTextCursor.End)
+            return
+
+        lines = [queue.popleft() for _ in range(min(len(queue), self.FLUSH_MAX))]
+        self.textbox.appendPlainText("\n".join(lines))
+
+    # ─────────────────────────────────────
+    # 페이지 표시 / 숨김 (StackApp.change_page)
+    # ─────────────────────────────────────
+    def activate(self):
+        if self.active:
+            return
+        self.active = True
+        self.flush()
+        self.timer.start(self.FLUSH_INTERVAL)
 
-    def _append_text(self, text):
-        """UI 스레드에서 실행"""
-        self.textbox.append(text)
+    def deactivate(self):
+        self.active = False
+        self.timer.stop()
 
     def save_logs(self):
         path, _ = QFileDialog.getSaveFileName(None, "로그 저장", "", "Text Files (*.txt)")
         if path:
+            self.flush()
             with open(path, "w", encoding="utf-8") as f:
                 f.write(self.textbox.toPlainText())
 
     def clear_logs(self):
+        self._queue.clear()
         self.textbox.clear()
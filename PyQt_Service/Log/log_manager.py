@@ -1,8 +1,21 @@
+import logging
+
+from .log_pipeline import LogPipeline
+
+
 class LogManager:
+    """
+    화면·명령 쪽에서 쓰는 로그 창구 — 실제 처리는 LogPipeline (레벨, 파일, 터미널, 최근 줄).
+    로그 페이지(LogController)는 처음 열릴 때 등록되고, 그 전 로그는 LogPipeline 의 최근 줄에서 받는다.
+    """
+
     _instance = None
 
     def __init__(self):
-        # 나중에 LogController가 여기로 등록됨
+        self.pipeline = LogPipeline.instance()
+        self.logger = self.pipeline.logger
+
+        # 나중에 LogController가 여기로 등록됨 (로그 페이지를 처음 열 때)
         self.controller = None
 
     @staticmethod
@@ -12,25 +25,27 @@ class LogManager:
         return LogManager._instance
 
     def set_controller(self, controller):
-        """로그 페이지 컨트롤러 등록"""
+        """로그 페이지 컨트롤러 등록 → 남아 있는 최근 로그부터 넘긴다"""
+        if self.controller is not None:
+            self.pipeline.tail.unsubscribe(self.controller.add_log)
         self.controller = controller
+        self.pipeline.tail.subscribe(controller.add_log)
+
+    def set_console(self, enabled: bool):
+        """터미널 출력 켜기/끄기 (UI·파일 로그는 그대로)"""
+        self.pipeline.set_console(enabled)
+
+    # ─────────────────────────────────────
+    # 로그 (어느 스레드에서든 — 큐에 넣기만 한다)
+    # ─────────────────────────────────────
+    def log(self, msg: str, level=logging.INFO):
+        self.logger.log(level, msg)
+
+    def debug(self, msg: str):
+        self.logger.debug(msg)
+
+    def warning(self, msg: str):
+        self.logger.warning(msg)
 
-    def log(self, msg: str):
-        """터미널 + UI 로그 동시에 출력"""
-        from datetime import datetime
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        full_msg = f"[{now}] {msg}"
-
-        # 1) 터미널 출력
-        print("📘 LOG:", full_msg)
-
-        # 2) UI 로그 출력
-        if self.controller is None:
-            print("⚠️ LogManager: controller is None, UI log skipped")
-            return
-
-        try:
-            print("✅ LogManager: forwarding log to UI")
-            self.controller.add_log(full_msg)
-        except Exception as e:
-            print("❌ LogManager: failed to write to UI:", e)
+    def error(self, msg: str):
+        self.logger.error(msg)
@@ -0,0 +1,240 @@
+# PyQt_Service/Log/log_pipeline.py
+"""
+프로그램 로그를 한 곳에서 처리 (표준 logging, 레벨 DEBUG / INFO / WARNING / ERROR / CRITICAL).
+
+    logger = LogPipeline.instance().logger      # "kit" 로거 — LogManager / LogService 도 이것을 쓴다
+    logger.warning("포트 연결 끊김")
+
+- 부르는 쪽은 QueueHandler 로 큐에 넣기만 한다 (어느 스레드에서든, 파일 I/O 없음).
+- 쓰기 스레드(QueueListener) 1개가 받아서
+  · 파일   : logs/kit.log — rotate "size"(max_bytes 마다) 또는 "daily"(자정마다)로 교체, backup_count 개 보관.
+             기록마다 flush → 프로그램이 죽어도 그 직전 줄까지 남는다.
+  · 터미널 : console 이 true 일 때 (set_console() 로 실행 중에도 변경)
+  · tail   : 최근 tail_lines 줄만 메모리에 (로그 페이지·LogService) — 오래된 줄부터 버린다.
+- 설정은 logging.json (없거나 잘못되면 DEFAULTS).
+- 처리되지 않은 예외(GUI 스레드·다른 스레드)도 CRITICAL 로 남기고, 파일에 쓰일 때까지 기다린다.
+- stop() 뒤에 (데몬 스레드 등에서) 들어오는 로그는 큐를 거치지 않고 바로 터미널(stderr)에 쓴다.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import deque
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "logging.json")
+
+LOGGER_NAME = "kit"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+DEFAULTS = {
+    "level": "INFO",
+    "console": True,
+    "dir": "logs",                  # logging.json 기준 상대 경로
+    "rotate": "size",               # "size" | "daily"
+    "max_bytes": 5 * 1024 * 1024,
+    "backup_count": 10,
+    "tail_lines": 5000,
+}
+
+
+class TailHandler(logging.Handler):
+    """최근 maxlen 줄 (메모리 상한) + 새 줄 알림 — 쓰기 스레드에서 호출된다"""
+
+    def __init__(self, maxlen):
+        super().__init__()
+        self.lines = deque(maxlen=maxlen)
+        self._subscribers = []
+
+    def emit(self, record):
+        line = self.format(record)
+        self.lines.append(line)
+        for callback in self._subscribers:
+            try:
+                callback(line)
+            except Exception as e:
+                print("[Log] Subscriber Error:", e)
+
+    def subscribe(self, callback):
+        """callback(line) — 지금까지 남아 있는 줄을 먼저 넘기고 이후 줄을 계속 넘긴다"""
+        with self.lock:
+            for line in self.lines:
+                callback(line)
+            self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self._subscribers = [cb for cb in self._subscribers if cb != callback]
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.lines)
+
+    def clear(self):
+        with self.lock:
+            self.lines.clear()
+
+
+class LogPipeline:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    FLUSH_TIMEOUT = 2.0     # 종료·예외 때 큐가 비기를 기다리는 최대 시간(초)
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self, config_path=CONFIG_PATH):
+        config = self._load_config(config_path)
+
+        ui_format = logging.Formatter("[%(asctime)s] %(levelname)-7s %(message)s", DATE_FORMAT)
+
+        # 터미널
+        self.console = logging.StreamHandler(sys.stdout)
+        self.console.setFormatter(logging.Formatter("📘 [%(asctime)s] %(levelname)-7s %(message)s", DATE_FORMAT))
+        self.set_console(config["console"])
+
+        # 최근 줄 (UI)
+        self.tail = TailHandler(config["tail_lines"])
+        self.tail.setFormatter(ui_format)
+
+        handlers = [self.console, self.tail]
+
+        # 파일 (못 열면 파일 없이 계속)
+        self.file = None
+        log_dir = config["dir"]
+        if not os.path.isabs(log_dir):
+            log_dir = os.path.join(os.path.dirname(os.path.abspath(config_path)), log_dir)
+        try:
+            self.file = self._file_handler(config, os.path.join(log_dir, f"{LOGGER_NAME}.log"))
+            handlers.append(self.file)
+        except OSError as e:
+            print("[Log] File Error:", e)
+
+        # 부르는 쪽 → 큐 → 쓰기 스레드
+        self.queue = queue.Queue()
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.logger.setLevel(config["level"])
+        self.logger.propagate = False
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        self.logger.addHandler(self.queue_handler)
+
+        self._install_excepthooks()
+        atexit.register(self.stop)
+
+    @staticmethod
+    def _load_config(config_path):
+        config = dict(DEFAULTS)
+        try:
+            with open(config_path, encoding="utf-8") as f:
+                config.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print("[Log] Config Error:", e)
+
+        config["level"] = str(config["level"]).upper()
+        if not isinstance(logging.getLevelName(config["level"]), int):
+            print("[Log] Config Error: unknown level", config["level"])
+            config["level"] = DEFAULTS["level"]
+        return config
+
+    @staticmethod
+    def _file_handler(config, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if config["rotate"] == "daily":
+            handler = logging.handlers.TimedRotatingFileHandler(
+                path, when="midnight", backupCount=config["backup_count"], encoding="utf-8"
+            )
+        else:
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=config["max_bytes"], backupCount=config["backup_count"], encoding="utf-8"
+            )
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s.%(msecs)03d %(levelname)-7s [%(threadName)s] %(message)s", DATE_FORMAT
+        ))
+        return handler
+
+    # ─────────────────────────────────────
+    # 설정 변경
+    # ─────────────────────────────────────
+    def set_console(self, enabled: bool):
+        """터미널 출력 켜기/끄기 (파일·UI 로그는 그대로)"""
+        self.console.setLevel(logging.NOTSET if enabled else logging.CRITICAL + 1)
+
+    def set_level(self, level):
+        self.logger.setLevel(level)
+
+    # ─────────────────────────────────────
+    # 큐 비우기 / 종료
+    # ─────────────────────────────────────
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """지금까지 넣은 로그가 모두 처리될 때까지 (최대 timeout 초) 기다린다 — stop() 뒤에는 바로 반환"""
+        if not self._running:
+            return
+        with self.queue.all_tasks_done:
+            self.queue.all_tasks_done.wait_for(lambda: not self.queue.unfinished_tasks, timeout)
+
+    def stop(self):
+        """
+        남은 로그를 모두 쓰고 쓰기 스레드 정지 (여러 번 불러도 됨).
+        이후 로그는 stderr 로 바로 쓴다 — 멈춘 큐에 쌓여 사라지지 않게.
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        late = logging.StreamHandler(sys.stderr)
+        late.setFormatter(self.console.formatter)
+        self.logger.removeHandler(self.queue_handler)
+        self.logger.addHandler(late)
+
+        self.listener.stop()
+
+        # 정지 신호 뒤에 큐에 들어간 기록 (핸들러를 바꾸는 사이에 넣은 것)
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:      # QueueListener 의 정지 신호
+                late.handle(record)
+            self.queue.task_done()
+
+        if self.file is not None:
+            self.file.close()
+
+    def _install_excepthooks(self):
+        previous_hook = sys.excepthook
+        previous_thread_hook = threading.excepthook
+
+        def hook(kind, value, tb):
+            self.logger.critical("처리되지 않은 예외", exc_info=(kind, value, tb))
+            self.flush()
+            previous_hook(kind, value, tb)
+
+        def thread_hook(args):
+            name = args.thread.name if args.thread is not None else "?"
+            self.logger.critical(
+                f"처리되지 않은 예외 (스레드 {name})",
+                exc_info=(args.exc_type, args.exc_value, args.exc_traceback),
+            )
+            self.flush()
+            previous_thread_hook(args)
+
+        sys.excepthook = hook
+        threading.excepthook = thread_hook
@@ -1,4 +1,6 @@
-from datetime import datetime
+import logging
+
+from .log_pipeline import LogPipeline
 
 
 class LogService:
@@ -8,25 +10,27 @@ class LogService:
         # 싱글톤 — 모든 컨트롤러가 같은 인스턴스를 공유
         if cls._instance is None:
             cls._instance = super(LogService, cls).__new__(cls)
-            cls._instance.logs = []
+            cls._instance.pipeline = LogPipeline.instance()
         return cls._instance
 
     # ------------------------------------------------------
-    # 로그 추가
+    # 로그 추가 (LogPipeline → 파일·터미널·로그 페이지)
     # ------------------------------------------------------
-    def add(self, message: str):
-        time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.logs.append(f"[{time}] {message}")
-        print("📘 LOG:", self.logs[-1])   # 콘솔에도 출력
+    def add(self, message: str, level=logging.INFO):
+        self.pipeline.logger.log(level, message)
 
     # ------------------------------------------------------
-    # 로그 전체 반환 (문자열)
+    # 최근 로그 (메모리에는 최근 tail_lines 줄만 — 전체 기록은 logs/ 파일)
     # ------------------------------------------------------
+    @property
+    def logs(self):
+        return self.pipeline.tail.snapshot()
+
     def get_all(self) -> str:
         return "\n".join(self.logs)
 
     # ------------------------------------------------------
-    # 로그 삭제
+    # 로그 삭제 (메모리의 최근 줄만, 파일은 그대로)
     # ------------------------------------------------------
     def clear(self):
-        self.logs = []
+        self.pipeline.tail.clear()
@@ -0,0 +1,33 @@
+# PyQt_Service/Monitoring/downsample.py
+"""
+그래프용 점 줄이기 (numpy 벡터 연산).
+
+- minmax() : 점을 buckets 개 구간으로 나눠 구간마다 최솟값·최댓값 2점만 남긴다 (시간 순서 유지).
+             화면 가로 1픽셀에 구간 1개를 두면 선 모양·봉우리·골짜기가 원본과 같게 보인다.
+- 첫 점·마지막 점은 항상 남기고, 구간에 들어가지 못한 끝부분(가장 최근 샘플)은 줄이지 않고 그대로 붙인다.
+"""
+
+import numpy as np
+
+
+def minmax(x, y, buckets):
+    """
+    (x, y) → 줄인 (x, y). 점이 2 × buckets 이하이면 그대로 돌려준다.
+    x 는 정렬돼 있어야 한다 (시각).
+    """
+    n = len(y)
+    if buckets <= 0 or n <= 2 * buckets:
+        return x, y
+
+    size = n // buckets
+    body = np.asarray(y)[: buckets * size].reshape(buckets, size)
+    base = np.arange(buckets) * size
+
+    lo = base + body.argmin(axis=1)
+    hi = base + body.argmax(axis=1)
+    index = np.sort(np.column_stack((lo, hi)), axis=1).ravel()
+
+    # 첫 점 + 구간별 최소·최대 + 남은 끝부분 (없으면 마지막 점)
+    tail = np.arange(buckets * size, n) if n % buckets else [n - 1]
+    index = np.concatenate(([0], index, tail))
+    return np.asarray(x)[index], np.asarray(y)[index]
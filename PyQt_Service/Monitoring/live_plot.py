@@ -0,0 +1,309 @@
+# PyQt_Service/Monitoring/live_plot.py
+"""
+실시간 그래프 1개 — 축과 선을 한 번만 만들고 값만 바꾼다.
+
+    plot = create_plot(backend=None, figsize=(4, 3), x_formatter=format_time)
+    plot.line("voltage", color="#930B0D")
+    layout.addWidget(plot.canvas)
+    ...
+    plot.set_data("voltage", buf.view("ts"), buf.view("voltage"))
+    plot.refresh()
+
+백엔드 (같은 사용법) — plot.json 의 "backend" 로 고른다 (load_backend(), StackApp 이 두 컨트롤러에 넘김)
+- "pyqtgraph"  : PlotDataItem 에 배열을 그대로 넘긴다. 기본값 (설치돼 있지 않으면 matplotlib)
+- "matplotlib" : Line2D + blit. 축 범위가 그대로면 배경 복원 + 선만 다시 그리고,
+                 데이터가 범위를 벗어나거나 범위가 지나치게 넓어졌을 때만 여유(headroom)를 두고
+                 범위를 다시 잡아 draw_idle() 로 전체를 그린다.
+Benchmark/bench_plot_backend.py 를 offscreen(소프트웨어 그리기)으로 돌리면 점을 줄인 뒤에는
+matplotlib 이 프레임당 약 9~12 ms, pyqtgraph 가 약 21~25 ms 다. 실제 화면에서의 값이 아니므로
+키오스크 화면에서 재어 보고 matplotlib 이 빠르면 plot.json 만 바꾼다.
+set_data() 는 점이 그래프 가로 픽셀 수의 2배를 넘으면 구간별 최소·최대로 줄여서 넘긴다 (downsample.minmax)
+→ 하루치 1초 샘플도 수백 점 그리는 비용으로 그리고, 봉우리·골짜기는 그대로 보인다.
+GUI 스레드에서만 호출한다 (데이터는 RingBuffer 등에서 GUI 스레드로 가져와서 넘긴다).
+matplotlib / pyqtgraph 는 그래프를 만들 때 처음 import 한다 (고르지 않은 쪽은 import 하지 않음).
+"""
+
+import json
+import os
+
+import numpy as np
+
+from PyQt_Service.Log.log_manager import LogManager
+from .downsample import minmax
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "plot.json")
+
+BACKENDS = ("pyqtgraph", "matplotlib")
+DEFAULT_BACKEND = "pyqtgraph"
+
+# 색을 주지 않은 선에 차례로 쓰는 색 (matplotlib 기본 색 순서)
+PALETTE = (
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+)
+
+
+def load_backend(config_path=CONFIG_PATH):
+    """plot.json 의 "backend" (파일이 없거나 잘못되면 DEFAULT_BACKEND)"""
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            backend = json.load(f).get("backend", DEFAULT_BACKEND)
+    except FileNotFoundError:
+        return DEFAULT_BACKEND
+    except (OSError, ValueError, AttributeError) as e:
+        LogManager.instance().warning(f"[LivePlot] plot.json 읽기 실패 → {DEFAULT_BACKEND}: {e}")
+        return DEFAULT_BACKEND
+
+    if backend not in BACKENDS:
+        LogManager.instance().warning(f"[LivePlot] 알 수 없는 백엔드 '{backend}' → {DEFAULT_BACKEND}")
+        return DEFAULT_BACKEND
+    return backend
+
+
+def create_plot(backend=None, **kwargs):
+    """
+    backend 이름(None 이면 DEFAULT_BACKEND) → 그래프 객체. 없는 백엔드(pyqtgraph 미설치 등)면 matplotlib 으로.
+    kwargs: figsize, x_formatter(값, pos=None → 글자 — matplotlib Formatter 도 가능), x_ticks, labelsize
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "pyqtgraph":
+        try:
+            return PgLivePlot(**kwargs)
+        except ImportError as e:
+            LogManager.instance().warning(f"[LivePlot] pyqtgraph 사용 불가 → matplotlib: {e}")
+    elif backend != "matplotlib":
+        LogManager.instance().warning(f"[LivePlot] 알 수 없는 백엔드 '{backend}' → matplotlib")
+    return MplLivePlot(**kwargs)
+
+
+# ========================================
+# matplotlib (Line2D + blit)
+# ========================================
+class MplLivePlot:
+    """
+    - 선은 animated 로 만들어 배경(축·눈금·격자)에는 들어가지 않는다. 전체 그리기가 끝나면
+      (draw_event) 배경을 새로 떠 두고 선을 그 위에 그린다.
+    """
+
+    backend = "matplotlib"
+    HEADROOM = 0.2          # 범위를 다시 잡을 때 X축 오른쪽에 남길 여유 (데이터 폭 대비)
+    Y_PAD = 0.1             # Y축 위아래 여유 (데이터 폭 대비)
+
+    def __init__(self, figsize=(4, 3), x_formatter=None, x_ticks=5, labelsize=None):
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import MaxNLocator
+
+        self.fig = Figure(figsize=figsize)
+        self.canvas = FigureCanvas(self.fig)
+        self.ax = self.fig.add_subplot(111)
+
+        self.ax.grid(True)
+        self.ax.xaxis.set_major_locator(MaxNLocator(x_ticks))
+        if x_formatter is not None:
+            self.ax.xaxis.set_major_formatter(x_formatter)
+        if labelsize is not None:
+            self.ax.tick_params(axis="both", labelsize=labelsize)
+
+        self.lines = {}             # key → Line2D
+        self._background = None
+        self._layout_stale = True   # 다음 refresh 에서 전체 그리기
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ─────────────────────────────────────
+    # 선 관리
+    # ─────────────────────────────────────
+    def line(self, key, **style):
+        """key 의 선 (없으면 만든다)"""
+        line = self.lines.get(key)
+        if line is None:
+            style.setdefault("color", PALETTE[len(self.lines) % len(PALETTE)])
+            (line,) = self.ax.plot([], [], animated=True, **style)
+            self.lines[key] = line
+            self._layout_stale = True
+        return line
+
+    def remove(self, key):
+        line = self.lines.pop(key, None)
+        if line is not None:
+            line.remove()
+            self._layout_stale = True
+
+    def clear(self):
+        for key in list(self.lines):
+            self.remove(key)
+
+    def legend(self, **kwargs):
+        """label 이 있는 선으로 범례 (선 구성이 바뀐 뒤 1번, 없으면 범례 제거)"""
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        handles = [line for line in self.lines.values() if not line.get_label().startswith("_")]
+        if handles:
+            self.ax.legend(handles=handles, **kwargs)
+        self._layout_stale = True
+
+    def set_data(self, key, x, y):
+        """선 데이터 교체 — 바로 내부 배열로 옮겨 두므로 x, y 는 이후 바뀌어도 된다 (RingBuffer.view)"""
+        x, y = minmax(x, y, int(self.ax.bbox.width))
+        line = self.lines[key]
+        line.set_data(x, y)
+        line.recache(always=True)
+
+    # ─────────────────────────────────────
+    # 그리기
+    # ─────────────────────────────────────
+    def refresh(self):
+        """바뀐 데이터를 화면에 반영 (필요할 때만 전체 그리기)"""
+        if self._rescale() or self._layout_stale or self._background is None:
+            self._layout_stale = False
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.fig.bbox)
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line in self.lines.values():
+            self.ax.draw_artist(line)
+
+    def _rescale(self):
+        """데이터가 현재 범위를 벗어났으면 범위를 다시 잡고 True"""
+        bounds = [
+            (np.min(x), np.max(x), np.nanmin(y), np.nanmax(y))
+            for x, y in (line.get_data() for line in self.lines.values() if line.get_visible())
+            if len(x)
+        ]
+        if not bounds:
+            return False
+
+        x0, x1, y0, y1 = (f(b[k] for b in bounds) for k, f in enumerate((min, max, min, max)))
+        changed = False
+
+        # X: 시간이 흐르는 방향(오른쪽)으로 여유를 두어 매 샘플마다 다시 잡지 않게
+        lo, hi = self.ax.get_xlim()
+        span = (x1 - x0) or 1.0
+        if x0 < lo or x1 > hi or (hi - lo) > span * (1 + 2 * self.HEADROOM):
+            self.ax.set_xlim(x0, x1 + span * self.HEADROOM)
+            changed = True
+
+        # Y: 위아래 여유, 범위가 데이터의 2배 이상 넓어지면 좁힌다
+        lo, hi = self.ax.get_ylim()
+        span = (y1 - y0) or (abs(y1) * 0.1 or 1.0)
+        if y0 < lo or y1 > hi or (hi - lo) > 2 * span * (1 + 2 * self.Y_PAD):
+            self.ax.set_ylim(y0 - span * self.Y_PAD, y1 + span * self.Y_PAD)
+            changed = True
+
+        return changed
+
+
+# ========================================
+# pyqtgraph (PlotDataItem)
+# ========================================
+def _time_axis_class(pg):
+    class FormatterAxis(pg.AxisItem):
+        """눈금 글자를 x_formatter 로 (두 백엔드의 축 표기를 같게)"""
+
+        def __init__(self, formatter, **kwargs):
+            super().__init__(**kwargs)
+            self.formatter = formatter
+            self.enableAutoSIPrefix(False)      # epoch 초에 'G' 단위가 붙지 않게
+
+        def tickStrings(self, values, scale, spacing):
+            return [self.formatter(v * scale) for v in values]
+
+    return FormatterAxis
+
+
+class PgLivePlot:
+    """
+    - 선마다 PlotDataItem 1개. set_data() 가 배열을 넘기면 pyqtgraph 가 다음 화면 갱신 때 그린다.
+    - 축 범위는 pyqtgraph 자동 범위(데이터가 바뀔 때마다)로 맞춘다.
+    - 화면 밖은 그리지 않는다 (clipToView).
+    - 선 굵기는 PEN_WIDTH_MAX 로 제한 — Qt 래스터 엔진은 1px 보다 굵은 선을 약 3배 느리게 그린다.
+    - figsize 는 matplotlib 과 같은 크기 힌트(100 dpi 기준 최소 크기)로만 쓴다.
+    """
+
+    backend = "pyqtgraph"
+    PEN_WIDTH_MAX = 1.0
+
+    def __init__(self, figsize=(4, 3), x_formatter=None, x_ticks=5, labelsize=None):
+        import pyqtgraph as pg
+        from PyQt5 import QtGui
+
+        self._pg = pg
+        axis_items = {}
+        if x_formatter is not None:
+            axis_items["bottom"] = _time_axis_class(pg)(x_formatter, orientation="bottom")
+
+        self.canvas = pg.PlotWidget(background="w", axisItems=axis_items)
+        self.canvas.setMinimumSize(int(figsize[0] * 50), int(figsize[1] * 50))
+        self.item = self.canvas.getPlotItem()
+        self.item.showGrid(x=True, y=True, alpha=0.3)
+        self.item.setMenuEnabled(False)
+        self.item.hideButtons()
+
+        for name in ("bottom", "left"):
+            axis = self.item.getAxis(name)
+            axis.setPen("k")
+            axis.setTextPen("k")
+            if labelsize is not None:
+                font = QtGui.QFont()
+                font.setPointSize(labelsize)
+                axis.setStyle(tickFont=font)
+
+        self.lines = {}             # key → PlotDataItem
+        self._legend = None
+
+    def line(self, key, color=None, linewidth=1.0, label=None, **_):
+        """key 의 선 (없으면 만든다) — matplotlib 백엔드와 같은 color / linewidth / label"""
+        line = self.lines.get(key)
+        if line is None:
+            color = color or PALETTE[len(self.lines) % len(PALETTE)]
+            pen = self._pg.mkPen(color, width=min(linewidth, self.PEN_WIDTH_MAX))
+            line = self.item.plot([], [], pen=pen)
+            line.setClipToView(True)
+            line.label = label
+            self.lines[key] = line
+        return line
+
+    def remove(self, key):
+        line = self.lines.pop(key, None)
+        if line is not None:
+            if self._legend is not None:
+                self._legend.removeItem(line)
+            self.item.removeItem(line)
+
+    def clear(self):
+        for key in list(self.lines):
+            self.remove(key)
+
+    def legend(self, fontsize=None, **_):
+        """label 이 있는 선으로 범례 (없으면 범례 제거)"""
+        if self._legend is not None:
+            self._legend.clear()
+        handles = [line for line in self.lines.values() if line.label]
+        if not handles:
+            return
+
+        if self._legend is None:
+            self._legend = self.item.addLegend(offset=(10, -10), labelTextColor="k")
+            if fontsize is not None:
+                self._legend.setLabelTextSize(f"{fontsize}pt")
+        for line in handles:
+            self._legend.addItem(line, line.label)
+
+    def set_data(self, key, x, y):
+        """선 데이터 교체 — 사본을 넘기므로 x, y 는 이후 바뀌어도 된다 (RingBuffer.view)"""
+        x, y = minmax(x, y, int(self.item.getViewBox().width()))
+        self.lines[key].setData(np.array(x), np.array(y), skipFiniteCheck=True)
+
+    def refresh(self):
+        """pyqtgraph 는 set_data 때 알아서 다시 그린다 (인터페이스 맞춤용)"""
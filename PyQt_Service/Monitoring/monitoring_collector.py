@@ -0,0 +1,118 @@
+# PyQt_Service/Monitoring/monitoring_collector.py
+
+import time
+from typing import NamedTuple
+
+from PyQt5 import QtCore
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.binary_frames import VcMonFrame
+from PyQt_Service.Protocol.firmware_protocol import VcMonReading, parse_line, parse_vcmon_bytes
+
+
+class VcMonSample(NamedTuple):
+    """VC_MON 자동 송신 1건 (timestamp: epoch 초)"""
+    timestamp: float
+    voltage: float      # V
+    current: float      # A
+    power: float        # W
+    capacity: float     # Ah
+
+
+def parse_vcmon_line(line, timestamp=None):
+    """VC_MON Data 한 줄 → VcMonSample (형식이 다르면 None)"""
+    reading = parse_line(line)
+    if not isinstance(reading, VcMonReading):
+        return None
+
+    return VcMonSample(
+        timestamp if timestamp is not None else time.time(),
+        reading.voltage, reading.current, reading.power, reading.capacity,
+    )
+
+
+VCMON_PREFIX = b"VC_MON Data - "
+
+
+class MonitoringCollector(QtCore.QObject):
+    """
+    아두이노가 스스로 보내는 'VC_MON Data' 줄을 받아 샘플로 변환하는 수집기.
+
+    - SerialManager 의 raw 리스너로 등록되어 요청/응답이 아닌 푸시 데이터만 bytes 로 받는다.
+      바이너리 프레임 모드('$xe')의 VC_MON 프레임도 같은 샘플로 받는다.
+    - 자동 송신이 꺼져 있으면 AcquisitionScheduler 의 'vcmon' 채널('$k') 결과로 대신 채운다.
+    - sink(저장소 등)는 수신 스레드에서 바로 호출되고,
+      화면 갱신은 sample_received 시그널로 GUI 스레드에 전달된다.
+    """
+
+    sample_received = QtCore.pyqtSignal(object)     # VcMonSample
+
+    def __init__(self, serial_manager, scheduler=None, device_id=None):
+        super().__init__()
+        self.serial = serial_manager
+        self.scheduler = scheduler
+        self.device_id = device_id
+        self._sinks = []
+        self._last_push = 0.0       # 마지막 자동 송신 샘플 시각
+
+        self.serial.add_raw_listener(VCMON_PREFIX, self._on_raw)
+        self.serial.add_frame_listener(self._on_frame)
+        if self.scheduler is not None:
+            self.scheduler.result_ready.connect(self._on_polled)
+
+    def add_sink(self, callback):
+        """callback(sample) — 수신 스레드에서 호출되므로 오래 막히면 안 된다"""
+        if callback not in self._sinks:
+            self._sinks.append(callback)
+
+    def remove_sink(self, callback):
+        if callback in self._sinks:
+            self._sinks.remove(callback)
+
+    def stop(self):
+        self.serial.remove_raw_listener(VCMON_PREFIX, self._on_raw)
+        self.serial.remove_frame_listener(self._on_frame)
+        if self.scheduler is not None:
+            self.scheduler.result_ready.disconnect(self._on_polled)
+
+    # ---------------------------------------------------------
+    # 수신 스레드에서 호출
+    # ---------------------------------------------------------
+    def _on_raw(self, raw):
+        reading = parse_vcmon_bytes(raw)
+        if reading is None:
+            return
+
+        sample = VcMonSample(time.time(), reading.voltage, reading.current, reading.power, reading.capacity)
+        self._last_push = sample.timestamp
+        self._publish(sample)
+
+    def _on_frame(self, frame):
+        if not isinstance(frame, VcMonFrame):
+            return
+
+        sample = VcMonSample(time.time(), frame.voltage, frame.current, frame.power, frame.capacity)
+        self._last_push = sample.timestamp
+        self._publish(sample)
+
+    # ---------------------------------------------------------
+    # 주기 요청 결과 (GUI 스레드) — 자동 송신이 없을 때만 사용
+    # ---------------------------------------------------------
+    def _on_polled(self, device_id, name, reading):
+        if name != "vcmon" or device_id != self.device_id or reading is None:
+            return
+
+        now = time.time()
+        if now - self._last_push < 2 * self.scheduler.interval("vcmon", device_id):
+            return
+
+        self._publish(VcMonSample(now, reading.voltage, reading.current, reading.power, reading.capacity))
+
+    def _publish(self, sample):
+        for sink in list(self._sinks):
+            try:
+                sink(sample)
+            except Exception as e:
+                LogManager.instance().error(f"[Collector] 저장 대상 오류: {e}")
+
+        self.sample_received.emit(sample)
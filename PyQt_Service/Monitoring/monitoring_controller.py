@@ -1,52 +1,74 @@
 # PyQt_Service/Monitoring/monitoring_controller.py
 
-import random
 import time
+
+import numpy as np
 from PyQt5 import QtCore
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.ticker import MaxNLocator
+
+from .live_plot import create_plot
+from .ring_buffer import RingBuffer
+
+
+# X축: epoch 초 → 현지 시각 (matplotlib 은 (x, pos), pyqtgraph 축은 x 만 넘긴다)
+def format_time(x, pos=None):
+    return time.strftime("%H:%M:%S", time.localtime(x))
+
 
 class MonitoringController(QtCore.QObject):
-    def __init__(self, ui, system_state):
+    MAX_LEN = 86_400        # 그래프에 유지할 최근 샘플 수 (1초 주기로 24시간 — 그릴 때는 픽셀 폭에 맞게 줄임)
+    MAX_GAP = 60.0          # 이 시간(초) 이상 끊긴 구간은 전력량 적분에서 제외
+    RING_FIELDS = ("voltage", "current", "power", "capacity")   # 최근 샘플 링 파일 필드 (restore)
+    REDRAW_INTERVAL = 250   # 그래프 갱신 주기(ms) — 새 데이터가 있을 때만
+
+    # 그래프 (버퍼 필드, 선 색, 넣을 UI frame)
+    GRAPHS = (
+        ("voltage", "#930B0D", "frame"),
+        ("current", "#0C6AA4", "frame_3"),
+        ("power", "#4C934C", "frame_2"),
+        ("energy", "#740399", "frame_4"),       # 누적 전력량
+    )
+
+    def __init__(self, ui, collector, plot_backend=None):
+        """
+        collector : MonitoringCollector — 수신·저장은 페이지와 관계없이 StackApp 에서 먼저 시작되고,
+                    이 컨트롤러(그래프)는 페이지를 처음 열 때 만들어진다.
+        """
         super().__init__()
         self.ui = ui
-        self.system_state = system_state
 
         # -------------------------------
-        # 그래프 데이터 버퍼
+        # 그래프 데이터 버퍼 (시각 + 전압·전류·전력·누적 전력량, 최근 MAX_LEN 개)
         # -------------------------------
-        self.times = []       # 시간
-        self.voltages = []    # 전압
-        self.currents = []    # 전류
-        self.powers = []      # 전력
+        self.buffer = RingBuffer(self.MAX_LEN, ("voltage", "current", "power", "energy"))
         self.energy = 0       # 누적 전력(Wh 단위)
-        self.energy_list = [] # 그래프용
+        self.last_ts = None   # 직전 샘플 시각 (적분용)
 
         # -------------------------------
-        # Matplotlib 그래프 4개 생성
+        # 그래프 4개 생성 (pyqtgraph / matplotlib — 축·선은 한 번만 만들고 데이터만 교체)
         # -------------------------------
-        self.fig_voltage = Figure(figsize=(4, 3))
-        self.fig_current = Figure(figsize=(4, 3))
-        self.fig_power = Figure(figsize=(4, 3))
-        self.fig_energy = Figure(figsize=(4, 3))
-
-        self.canvas_voltage = FigureCanvas(self.fig_voltage)
-        self.canvas_current = FigureCanvas(self.fig_current)
-        self.canvas_power = FigureCanvas(self.fig_power)
-        self.canvas_energy = FigureCanvas(self.fig_energy)
+        self.plots = {}
+        for name, color, _ in self.GRAPHS:
+            plot = create_plot(plot_backend, figsize=(4, 3), x_formatter=format_time, x_ticks=4)
+            plot.line(name, color=color)
+            self.plots[name] = plot
 
         self._setup_canvas()
 
         # -------------------------------
-        # 30초마다 난수 생성 타이머
+        # VC_MON 샘플 (GUI 스레드로 전달된 것)
         # -------------------------------
+        self.collector = collector
+        self.collector.sample_received.connect(self.on_sample)
+
+        # 그래프는 새 데이터가 있을 때만 REDRAW_INTERVAL 주기로 다시 그림
+        # (페이지가 가려지면 deactivate() 로 타이머를 멈추고 데이터만 계속 받는다)
+        self.active = True
+        self._dirty = False
         self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.generate_random_data)
-        self.timer.start(30000)  # 30초
+        self.timer.timeout.connect(self._redraw_if_dirty)
+        self.timer.start(self.REDRAW_INTERVAL)
 
-        # 첫 데이터 생성
-        self.generate_random_data()
+        self.update_graphs()
 
     # ---------------------------------------------------------
     # UI Frame에 Canvas 집어넣기
@@ -54,93 +76,77 @@ class MonitoringController(QtCore.QObject):
     def _setup_canvas(self):
         from PyQt5.QtWidgets import QVBoxLayout
 
-        layout = QVBoxLayout(self.ui.frame)
-        layout.addWidget(self.canvas_voltage)
-
-        layout = QVBoxLayout(self.ui.frame_3)
-        layout.addWidget(self.canvas_current)
-
-        layout = QVBoxLayout(self.ui.frame_2)
-        layout.addWidget(self.canvas_power)
+        for name, _, frame in self.GRAPHS:
+            layout = QVBoxLayout(getattr(self.ui, frame))
+            layout.addWidget(self.plots[name].canvas)
 
-        layout = QVBoxLayout(self.ui.frame_4)
-        layout.addWidget(self.canvas_energy)
+    # ---------------------------------------------------------
+    # VC_MON 샘플 수신 (GUI 스레드)
+    # ---------------------------------------------------------
+    def on_sample(self, sample):
+        # restore() 로 이미 채운 샘플 (링 파일 기록 → 시그널 전달 사이에 복원한 경우)
+        if self.last_ts is not None and sample.timestamp <= self.last_ts:
+            return
+
+        power = sample.power
+
+        # 누적 전력량(Wh): 실제 샘플 간격으로 적분
+        if self.last_ts is not None:
+            dt = sample.timestamp - self.last_ts
+            if 0 < dt < self.MAX_GAP:
+                self.energy += power * (dt / 3600)
+        self.last_ts = sample.timestamp
+
+        # 시계열 데이터 저장 (가득 차면 가장 오래된 샘플을 덮어씀)
+        self.buffer.append(sample.timestamp, sample.voltage, sample.current, power, self.energy)
+
+        self._dirty = True
+
+    def restore(self, ring):
+        """
+        최근 샘플 링 파일(TelemetryRing, RING_FIELDS)에 남아 있는 샘플로 그래프를 채운다.
+        (링 파일 기록은 StackApp 이 collector sink 로 — 페이지를 열기 전 샘플도 여기서 복원된다)
+        """
+        records = ring.recent(self.MAX_LEN)
+        if len(records):
+            ts, power = records["ts"], records["power"]
+            dt = np.diff(ts, prepend=ts[0] if self.last_ts is None else self.last_ts)
+            energy = self.energy + np.cumsum(
+                np.where((dt > 0) & (dt < self.MAX_GAP), power * dt / 3600, 0.0)
+            )
+            self.buffer.extend(ts, records["voltage"], records["current"], power, energy)
+
+            self.energy = float(energy[-1])
+            self.last_ts = float(ts[-1])
+            self._dirty = True
+        self._redraw_if_dirty()
 
     # ---------------------------------------------------------
-    # 할로겐 상태 기반 난수 생성
+    # 페이지 표시 / 숨김 (StackApp.change_page)
     # ---------------------------------------------------------
-    def generate_random_data(self):
-        halogen_on = self.system_state.get("halogen", False)
-
-        if halogen_on:
-            voltage = random.uniform(17.0, 22.0)
-            current = random.uniform(0.06, 0.15)
-        else:
-            voltage = random.uniform(0.0, 2.0)
-            current = random.uniform(0, 0.02)
-
-        power = voltage * current
-
-        # 누적 전력(Wh) 계산: 30초 = 0.00833시간
-        self.energy += power * (30 / 3600)
-        self.energy_list.append(self.energy)
-
-        # 시계열 데이터 저장
-        current_time = time.strftime("%H:%M:%S")
-        self.times.append(current_time)
-        self.voltages.append(voltage)
-        self.currents.append(current)
-        self.powers.append(power)
-        self.system_state["last_power"] = power
-
-        # 리스트 길이 제한(예: 최근 200개)
-        MAX_LEN = 200
-        if len(self.times) > MAX_LEN:
-            self.times.pop(0)
-            self.voltages.pop(0)
-            self.currents.pop(0)
-            self.powers.pop(0)
-            self.energy_list.pop(0)
-
-        # 그래프 업데이트
-        self.update_graphs()
+    def activate(self):
+        """페이지가 보일 때 — 숨어 있는 동안 쌓인 샘플을 한 번에 그리고 갱신 재개"""
+        if self.active:
+            return
+        self.active = True
+        self._redraw_if_dirty()
+        self.timer.start(self.REDRAW_INTERVAL)
+
+    def deactivate(self):
+        """페이지가 가려질 때 — 그리기만 멈춘다 (수신·저장·전력량 적분은 계속)"""
+        self.active = False
+        self.timer.stop()
+
+    def _redraw_if_dirty(self):
+        if self._dirty and self.active:
+            self._dirty = False
+            self.update_graphs()
 
     # ---------------------------------------------------------
-    # 그래프 4개 업데이트
+    # 그래프 4개 업데이트 (선 데이터만 교체)
     # ---------------------------------------------------------
     def update_graphs(self):
-        # 전압
-        self.fig_voltage.clear()
-        ax = self.fig_voltage.add_subplot(111)
-        ax.plot(self.times, self.voltages, color="#930B0D")
-        ax.grid(True)
-        ax.xaxis.set_major_locator(MaxNLocator(5))
-        ax.tick_params(axis="x", rotation=0)   # ⭐ X축 세로 회전
-        self.canvas_voltage.draw()
-
-        # 전류
-        self.fig_current.clear()
-        ax = self.fig_current.add_subplot(111)
-        ax.plot(self.times, self.currents, color="#0C6AA4")
-        ax.grid(True)
-        ax.xaxis.set_major_locator(MaxNLocator(5))
-        ax.tick_params(axis="x", rotation=0)   # ⭐ X축 세로 회전
-        self.canvas_current.draw()
-
-        # 전력
-        self.fig_power.clear()
-        ax = self.fig_power.add_subplot(111)
-        ax.plot(self.times, self.powers, color="#4C934C")
-        ax.grid(True)
-        ax.xaxis.set_major_locator(MaxNLocator(5))
-        ax.tick_params(axis="x", rotation=0)   # ⭐ X축 세로 회전
-        self.canvas_power.draw()
-
-        # 누적 전력량
-        self.fig_energy.clear()
-        ax = self.fig_energy.add_subplot(111)
-        ax.plot(self.times, self.energy_list, color="#740399")
-        ax.grid(True)
-        ax.xaxis.set_major_locator(MaxNLocator(5))
-        ax.tick_params(axis="x", rotation=0)   # ⭐ X축 세로 회전
-        self.canvas_energy.draw()
\ No newline at end of file
+        times = self.buffer.view("ts")
+        for name, plot in self.plots.items():
+            plot.set_data(name, times, self.buffer.view(name))
+            plot.refresh()
@@ -0,0 +1,270 @@
+# PyQt_Service/Monitoring/monitoring_repository.py
+
+import threading
+import time
+from collections import deque
+
+from PyQt_Service.Database.db import Database
+from PyQt_Service.Log.log_manager import LogManager
+from .monitoring_collector import VcMonSample
+
+
+class MonitoringRepository:
+    """
+    VC_MON 샘플 저장·조회 (measurement 테이블).
+
+    - add() 는 큐에 넣고 바로 반환한다 → 수신 스레드가 디스크·네트워크를 기다리지 않는다.
+    - 쓰기 스레드 1개가 FLUSH_INTERVAL 동안(또는 BATCH_SIZE 개가 찰 때까지) 모은 샘플을
+      executemany 한 번 + commit 한 번으로 넣는다.
+    - DB 오류가 나면 연결을 다시 열고 같은 배치를 재시도한다 (대기 RETRY_MIN → RETRY_MAX).
+      그동안 큐가 MAX_PENDING 을 넘으면 새 샘플은 버리고 stats["dropped"] 로 센다.
+    - 배치 훅(add_batch_hook)이 만든 추가 쓰기(집계 등)는 같은 트랜잭션으로 함께 커밋한다.
+      훅에는 실제로 새로 들어간 행만 넘긴다 (이미 저장된 같은 보드·시각은 빼고, stats["duplicates"] 로 센다).
+      훅을 부른 배치를 결국 쓰지 못하면(종료 중 버림, 훅 오류) 훅의 discard() 로 메모리 상태를 버리게 한다.
+    """
+
+    BATCH_SIZE = 500            # 한 번에 넣을 최대 행 수
+    FLUSH_INTERVAL = 1.0        # 배치를 모으는 최대 시간(초)
+    MAX_PENDING = 100_000       # 큐 최대 길이 (DB 장애 시 메모리 상한)
+    RETRY_MIN = 0.5
+    RETRY_MAX = 30.0
+
+    COLUMNS = ("device_id", "ts", "voltage", "current", "power", "capacity")
+
+    def __init__(self, db=None):
+        self.db = db if db is not None else Database.from_config()
+        self.stats = {"written": 0, "batches": 0, "dropped": 0, "duplicates": 0, "errors": 0}
+
+        ph = ", ".join([self.db.placeholder] * len(self.COLUMNS))
+        self._insert_sql = (
+            f"{self.db.insert_ignore} INTO measurement ({', '.join(self.COLUMNS)}) VALUES ({ph})"
+        )
+
+        self._queue = deque()
+        self._batch_hooks = []      # (hook, discard)
+        self._cond = threading.Condition()
+        self._conn = None
+        self._busy = False          # 배치를 쓰는 중
+        self._force = False         # flush() 요청 — 모으지 말고 바로 쓰기
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ========================================
+    # 쓰기 (수신 스레드 등 어디서든 호출, 막히지 않음)
+    # ========================================
+    def add(self, device_id, sample):
+        if not self._running or len(self._queue) >= self.MAX_PENDING:
+            self.stats["dropped"] += 1
+            return
+
+        self._queue.append((
+            device_id, sample.timestamp,
+            sample.voltage, sample.current, sample.power, sample.capacity,
+        ))
+        if len(self._queue) == self.BATCH_SIZE:
+            with self._cond:
+                self._cond.notify()
+
+    def sink(self, device_id):
+        """MonitoringCollector.add_sink() 에 넘길 콜백"""
+        return lambda sample: self.add(device_id, sample)
+
+    def add_batch_hook(self, hook, discard=None):
+        """
+        hook(batch, cursor) → [(sql, rows), ...] — 쓰기 스레드에서 배치마다 1번 호출.
+        batch 는 이번에 새로 들어가는 행(COLUMNS 순서의 튜플) 리스트, cursor 로 같은 연결에서 조회할 수 있다.
+        돌려준 쓰기는 측정값과 같은 트랜잭션으로 실행된다 (재시도 때는 훅을 다시 부르지 않음).
+        discard() — hook 을 부른 배치가 저장되지 못했을 때 호출 (hook 이 메모리에 반영한 것을 버린다).
+        """
+        if all(h != hook for h, _ in self._batch_hooks):
+            self._batch_hooks.append((hook, discard))
+
+    def flush(self, timeout=5.0):
+        """큐에 남은 샘플을 바로 쓰고, 다 쓰면 True"""
+        with self._cond:
+            self._force = True
+            self._cond.notify()
+
+        deadline = time.time() + timeout
+        while (self._queue or self._busy) and time.time() < deadline:
+            time.sleep(0.01)
+        return not (self._queue or self._busy)
+
+    def close(self, timeout=5.0):
+        """남은 샘플을 쓰고 쓰기 스레드 정지"""
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    # ========================================
+    # 조회 (호출한 스레드에서 연결을 따로 연다)
+    # ========================================
+    def query(self, device_id, start, end=None):
+        """[start, end) 구간 샘플 (시간순) → VcMonSample 리스트"""
+        ph = self.db.placeholder
+        sql = (
+            "SELECT ts, voltage, current, power, capacity FROM measurement "
+            f"WHERE device_id = {ph} AND ts >= {ph} AND ts < {ph} ORDER BY ts"
+        )
+        rows = self.fetch(sql, (device_id, start, end if end is not None else time.time() + 1))
+        return [VcMonSample(*row) for row in rows]
+
+    def latest(self, device_id, count):
+        """최근 count 개 샘플 (시간순)"""
+        ph = self.db.placeholder
+        sql = (
+            "SELECT ts, voltage, current, power, capacity FROM measurement "
+            f"WHERE device_id = {ph} ORDER BY ts DESC LIMIT {int(count)}"
+        )
+        rows = self.fetch(sql, (device_id,))
+        return [VcMonSample(*row) for row in reversed(rows)]
+
+    def fetch(self, sql, params):
+        """조회 SQL 실행 → 행 리스트 (오류면 빈 리스트)"""
+        try:
+            conn = self.db.connect()
+        except Exception as e:
+            LogManager.instance().error(f"[Repository] DB 연결 실패: {e}")
+            return []
+
+        try:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            cur.close()
+            return rows
+        except Exception as e:
+            LogManager.instance().error(f"[Repository] 조회 실패: {e}")
+            return []
+        finally:
+            conn.close()
+
+    # ========================================
+    # 쓰기 스레드
+    # ========================================
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._running and not self._force and len(self._queue) < self.BATCH_SIZE:
+                    self._cond.wait(self.FLUSH_INTERVAL)
+                if not self._queue:
+                    self._force = False
+                    if not self._running:
+                        break
+                    continue
+                self._busy = True
+
+            batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.BATCH_SIZE))]
+            self._write(batch)
+            self._busy = False
+
+        self._close_conn()
+
+    def _write(self, batch):
+        delay = self.RETRY_MIN
+        new_rows = None         # 실제로 새로 들어가는 행 (첫 시도에서 정하고 재시도 때는 그대로)
+        extra = None
+        while True:
+            try:
+                if self._conn is None:
+                    self._conn = self.db.connect()
+                    self.db.init_schema(self._conn)
+
+                cur = self._conn.cursor()
+                if new_rows is None:
+                    new_rows = self._insert_new(cur, batch)
+                elif new_rows:
+                    cur.executemany(self._insert_sql, new_rows)
+                if extra is None:
+                    extra = self._run_hooks(new_rows, cur) if new_rows else []
+                for sql, rows in extra:
+                    if rows:
+                        cur.executemany(sql, rows)
+                self._conn.commit()
+                cur.close()
+
+                self.stats["written"] += len(new_rows)
+                self.stats["duplicates"] += len(batch) - len(new_rows)
+                self.stats["batches"] += 1
+                return
+
+            except Exception as e:
+                self.stats["errors"] += 1
+                self._close_conn()
+
+                if not self._running:
+                    LogManager.instance().error(f"[Repository] 저장 실패 → 종료 중이라 {len(batch)} 행 버림: {e}")
+                    self.stats["dropped"] += len(batch)
+                    if extra:
+                        self._discard_hooks()
+                    return
+
+                LogManager.instance().error(f"[Repository] 저장 실패 ({len(batch)} 행, {delay:.1f}s 후 재시도): {e}")
+
+                with self._cond:
+                    self._cond.wait(delay)
+                delay = min(delay * 2, self.RETRY_MAX)
+
+    def _insert_new(self, cur, batch):
+        """
+        batch 를 넣고 실제로 새로 들어간 행만 돌려준다.
+        INSERT IGNORE 가 건너뛴 행(이미 저장된 같은 보드·시각, 배치 안 중복)이 있으면
+        되돌리고 새 행만 다시 넣는다 — 중복이 없으면 executemany 1번으로 끝.
+        """
+        cur.executemany(self._insert_sql, batch)
+        if cur.rowcount == len(batch):
+            return batch
+
+        self._conn.rollback()
+        ph = self.db.placeholder
+        stamps = {}
+        for row in batch:
+            stamps.setdefault(row[0], []).append(row[1])
+
+        seen = set()
+        for device_id, ts in stamps.items():
+            cur.execute(
+                f"SELECT ts FROM measurement WHERE device_id = {ph} AND ts >= {ph} AND ts <= {ph}",
+                (device_id, min(ts), max(ts)),
+            )
+            seen.update((device_id, stored) for (stored,) in cur.fetchall())
+
+        rows = []
+        for row in batch:
+            if row[:2] not in seen:
+                seen.add(row[:2])
+                rows.append(row)
+        if rows:
+            cur.executemany(self._insert_sql, rows)
+        return rows
+
+    def _run_hooks(self, batch, cur):
+        writes = []
+        for hook, discard in list(self._batch_hooks):
+            try:
+                writes.extend(hook(batch, cur))
+            except Exception as e:
+                LogManager.instance().error(f"[Repository] 집계 갱신 실패: {e}")
+                if discard is not None:
+                    discard()
+        return writes
+
+    def _discard_hooks(self):
+        for _, discard in list(self._batch_hooks):
+            if discard is not None:
+                discard()
+
+    def _close_conn(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
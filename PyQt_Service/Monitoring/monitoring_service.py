@@ -0,0 +1,316 @@
+# PyQt_Service/Monitoring/monitoring_service.py
+"""
+VC_MON 측정값의 주기별(1분 / 1시간 / 1일) 집계와 조회.
+
+- 집계는 샘플이 저장될 때 MonitoringRepository 쓰기 스레드에서 배치 단위로 갱신된다
+  (수신 스레드·GUI 스레드는 관여하지 않음). 결과는 measurement_rollup 테이블에 같은 트랜잭션으로 기록.
+  measurement 에 실제로 새로 들어간 행만 집계한다 (중복 시각은 빼고, 못 쓴 배치는 메모리 버킷도 버림).
+- 버킷마다 n, 전압·전류·전력의 min / max / sum / last, 전력량(Wh) 합, 마지막 용량을 둔다.
+  평균은 sum / n — 합을 저장하므로 배치를 나눠 이어 붙여도 값이 같다.
+- 주·월 단위 그래프는 series() 로 원본 대신 집계 버킷을 읽는다.
+- backfill() 은 이미 쌓인 원본을 묶음 단위(numpy 벡터 연산)로 다시 집계한다.
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+
+PERIODS = {"1m": 60, "1h": 3600, "1d": 86400}
+
+MAX_GAP = 60.0                  # 이 시간(초) 이상 끊긴 구간은 전력량 적분에서 제외 (MonitoringController 와 동일)
+_OFFSET = -time.timezone        # 1일 버킷을 현지 자정에 맞추기 위한 UTC 오프셋(초)
+
+# 버킷 값 순서 (measurement_rollup 의 device_id, period, bucket 다음 열)
+ROLLUP_COLUMNS = (
+    "n",
+    "voltage_min", "voltage_max", "voltage_sum", "voltage_last",
+    "current_min", "current_max", "current_sum", "current_last",
+    "power_min", "power_max", "power_sum", "power_last",
+    "energy", "capacity", "last_ts",
+)
+
+# 두 버킷 값을 합칠 때 열마다 쓰는 규칙 (뒤쪽 값이 더 최근)
+_MERGE = (
+    ("sum",)
+    + ("min", "max", "sum", "last") * 3
+    + ("sum", "last", "last")
+)
+
+
+def bucket_start(ts, period):
+    """샘플 시각 → 버킷 시작 시각 (스칼라·배열 모두 가능)"""
+    return np.floor((np.asarray(ts) + _OFFSET) / period) * period - _OFFSET
+
+
+def _merge(old, new):
+    return [
+        a + b if rule == "sum" else min(a, b) if rule == "min" else max(a, b) if rule == "max" else b
+        for rule, a, b in zip(_MERGE, old, new)
+    ]
+
+
+def _aggregate(ts, v, i, p, c, energy, period):
+    """시간순 배열 → (버킷 시작 배열, 버킷별 값 행렬[ROLLUP_COLUMNS 순서])"""
+    keys = bucket_start(ts, period)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(ts)] - 1
+
+    columns = [np.diff(np.r_[starts, len(ts)])]
+    for values in (v, i, p):
+        columns += [
+            np.minimum.reduceat(values, starts),
+            np.maximum.reduceat(values, starts),
+            np.add.reduceat(values, starts),
+            values[ends],
+        ]
+    columns += [np.add.reduceat(energy, starts), c[ends], ts[ends]]
+
+    return keys[starts], np.column_stack(columns)
+
+
+class RollupEngine:
+    """
+    보드별로 열려 있는 버킷 상태를 들고 있다가 새 샘플 묶음을 합쳐
+    바뀐 버킷의 전체 값을 돌려준다 (REPLACE 로 그대로 덮어쓰면 된다).
+
+    loader(device_id, period, bucket) → 저장된 버킷 값 (없으면 None)
+    을 주면 처음 보는 버킷은 DB 값에 이어서 집계한다 (프로그램 재시작 후 같은 날 등).
+    """
+
+    def __init__(self, periods=tuple(PERIODS.values())):
+        self.periods = periods
+        self._open = {}         # (device_id, period) → (bucket, 값 리스트)
+        self._last_ts = {}      # device_id → 마지막 샘플 시각 (전력량 적분용)
+
+    def reset(self):
+        """들고 있는 버킷·시각을 버린다 → 다음 update() 는 loader 로 DB 에 저장된 값부터 이어 간다"""
+        self._open.clear()
+        self._last_ts.clear()
+
+    def update(self, device_id, ts, v, i, p, c, loader=None):
+        """한 보드의 샘플 배열 → [(device_id, period, bucket, *값), ...]"""
+        order = np.argsort(ts, kind="stable")
+        ts, v, i, p, c = (np.asarray(a, dtype=float)[order] for a in (ts, v, i, p, c))
+        if not len(ts):
+            return []
+
+        prev = self._last_ts.get(device_id)
+        if prev is None and loader is not None:
+            stored = loader(device_id, self.periods[0], float(bucket_start(ts[0], self.periods[0])))
+            if stored is not None:
+                prev = stored[-1]
+
+        # 전력량(Wh) = 이번 샘플 전력 × 직전 샘플과의 간격
+        dt = np.diff(ts, prepend=ts[0] if prev is None else prev)
+        energy = np.where((dt > 0) & (dt < MAX_GAP), p * dt / 3600, 0.0)
+        self._last_ts[device_id] = max(float(ts[-1]), prev or 0.0)
+
+        rows = []
+        for period in self.periods:
+            buckets, values = _aggregate(ts, v, i, p, c, energy, period)
+            key = (device_id, period)
+
+            for bucket, row in zip(buckets.tolist(), values.tolist()):
+                opened = self._open.get(key)
+                if opened is not None and opened[0] == bucket:
+                    row = _merge(opened[1], row)
+                elif loader is not None:
+                    stored = loader(device_id, period, bucket)
+                    if stored is not None:
+                        row = _merge(stored, row)
+
+                row[0] = int(row[0])
+                if opened is None or bucket >= opened[0]:
+                    self._open[key] = (bucket, row)
+                rows.append((device_id, period, bucket, *row))
+
+        return rows
+
+
+class Series(NamedTuple):
+    """series() 결과 — 모두 같은 길이의 numpy 배열 (period 0 이면 원본 샘플)"""
+    period: int
+    ts: np.ndarray
+    voltage: np.ndarray         # 평균 (원본이면 값 그대로)
+    voltage_min: np.ndarray
+    voltage_max: np.ndarray
+    current: np.ndarray
+    current_min: np.ndarray
+    current_max: np.ndarray
+    power: np.ndarray
+    power_min: np.ndarray
+    power_max: np.ndarray
+    energy: np.ndarray          # 버킷(또는 샘플 간격)별 전력량 Wh — 누적은 np.cumsum
+
+
+class MonitoringService:
+    """
+    주기별 데이터 리샘플링·반환 서비스.
+
+        service = MonitoringService(repository)     # 저장 배치마다 집계 갱신 시작
+        week = service.series("KIT-1", now - 7 * 86400, now)   # 1시간 버킷 168개
+    """
+
+    RAW_SPAN = 2 * 3600         # 이보다 짧은 구간은 원본 샘플을 그대로 반환
+    BACKFILL_ROWS = 200_000     # backfill 1회 조회 행 수
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.db = repository.db
+        self.engine = RollupEngine()
+
+        ph = self.db.placeholder
+        columns = ("device_id", "period", "bucket") + ROLLUP_COLUMNS
+        self._replace_sql = (
+            f"REPLACE INTO measurement_rollup ({', '.join(columns)}) "
+            f"VALUES ({', '.join([ph] * len(columns))})"
+        )
+        self._load_sql = (
+            f"SELECT {', '.join(ROLLUP_COLUMNS)} FROM measurement_rollup "
+            f"WHERE device_id = {ph} AND period = {ph} AND bucket = {ph}"
+        )
+
+        # 배치를 못 쓰면(종료 중 버림 등) 메모리 버킷을 버리고 DB 값부터 다시 — 저장된 원본과 집계가 어긋나지 않게
+        repository.add_batch_hook(self._on_batch, self.engine.reset)
+
+    # ========================================
+    # 실시간 집계 (MonitoringRepository 쓰기 스레드)
+    # ========================================
+    def _on_batch(self, batch, cur):
+        def loader(device_id, period, bucket):
+            cur.execute(self._load_sql, (device_id, period, bucket))
+            rows = cur.fetchall()
+            return list(rows[0]) if rows else None
+
+        by_device = {}
+        for row in batch:
+            by_device.setdefault(row[0], []).append(row[1:])
+
+        rows = []
+        for device_id, samples in by_device.items():
+            ts, v, i, p, c = np.array(samples, dtype=float).T
+            rows += self.engine.update(device_id, ts, v, i, p, c, loader)
+
+        return [(self._replace_sql, rows)]
+
+    # ========================================
+    # 조회
+    # ========================================
+    def pick_period(self, start, end, max_points=2000):
+        """구간 길이에 맞는 버킷 크기 (원본이면 0)"""
+        span = end - start
+        if span <= self.RAW_SPAN:
+            return 0
+        for period in sorted(PERIODS.values()):
+            if span / period <= max_points:
+                return period
+        return max(PERIODS.values())
+
+    def series(self, device_id, start, end=None, period=None, max_points=2000):
+        """[start, end) 구간 시계열 → Series (period 를 주지 않으면 구간 길이로 결정)"""
+        end = time.time() if end is None else end
+        if period is None:
+            period = self.pick_period(start, end, max_points)
+
+        if period == 0:
+            return self._raw_series(device_id, start, end)
+
+        ph = self.db.placeholder
+        sql = (
+            "SELECT bucket, n, voltage_min, voltage_max, voltage_sum, "
+            "current_min, current_max, current_sum, power_min, power_max, power_sum, energy "
+            "FROM measurement_rollup "
+            f"WHERE device_id = {ph} AND period = {ph} AND bucket >= {ph} AND bucket < {ph} "
+            "ORDER BY bucket"
+        )
+        rows = self.repository.fetch(sql, (device_id, period, float(bucket_start(start, period)), end))
+        a = np.array(rows, dtype=float).reshape(-1, 12)
+        n = np.maximum(a[:, 1], 1)
+
+        return Series(
+            period, a[:, 0],
+            a[:, 4] / n, a[:, 2], a[:, 3],
+            a[:, 7] / n, a[:, 5], a[:, 6],
+            a[:, 10] / n, a[:, 8], a[:, 9],
+            a[:, 11],
+        )
+
+    def _raw_series(self, device_id, start, end):
+        samples = self.repository.query(device_id, start, end)
+        a = np.array(samples, dtype=float).reshape(-1, 5)
+        ts, v, i, p = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+
+        dt = np.diff(ts, prepend=ts[:1])
+        energy = np.where((dt > 0) & (dt < MAX_GAP), p * dt / 3600, 0.0)
+        return Series(0, ts, v, v, v, i, i, i, p, p, p, energy)
+
+    # ========================================
+    # 원본으로부터 다시 집계
+    # ========================================
+    def backfill(self, device_id=None, start=None, end=None, progress=None):
+        """
+        measurement 원본을 BACKFILL_ROWS 개씩 읽어 집계를 다시 만든다.
+        start 는 1일 버킷 경계로 내려 맞춘다 (그 날의 버킷은 모두 처음부터 다시 계산).
+        실행 중인 프로그램이 쓰고 있는 현재 버킷과 겹치지 않게, 프로그램을 끈 상태나 지난 구간에 쓴다.
+        progress(device_id, rows_done) 를 주면 묶음마다 호출한다.
+        → 기록한 버킷 행 수
+        """
+        conn = self.db.connect()
+        try:
+            self.db.init_schema(conn)
+            cur = conn.cursor()
+
+            if device_id is None:
+                cur.execute("SELECT DISTINCT device_id FROM measurement")
+                devices = [row[0] for row in cur.fetchall()]
+            else:
+                devices = [device_id]
+
+            written = 0
+            for device in devices:
+                written += self._backfill_device(conn, cur, device, start, end, progress)
+
+            cur.close()
+            return written
+        finally:
+            conn.close()
+
+    def _backfill_device(self, conn, cur, device_id, start, end, progress):
+        ph = self.db.placeholder
+
+        if start is None:
+            cur.execute(f"SELECT MIN(ts) FROM measurement WHERE device_id = {ph}", (device_id,))
+            start = cur.fetchall()[0][0]
+            if start is None:
+                return 0
+        start = float(bucket_start(start, max(PERIODS.values())))
+        end = time.time() + 1 if end is None else end
+
+        sql = (
+            "SELECT ts, voltage, current, power, capacity FROM measurement "
+            f"WHERE device_id = {ph} AND ts > {ph} AND ts < {ph} ORDER BY ts LIMIT {self.BACKFILL_ROWS}"
+        )
+        engine = RollupEngine(self.engine.periods)
+        cursor_ts = start - 1e-9
+        done = written = 0
+
+        while True:
+            cur.execute(sql, (device_id, cursor_ts, end))
+            rows = cur.fetchall()
+            if not rows:
+                break
+
+            ts, v, i, p, c = np.array(rows, dtype=float).T
+            buckets = engine.update(device_id, ts, v, i, p, c)
+            cur.executemany(self._replace_sql, buckets)
+            conn.commit()
+
+            cursor_ts = float(ts[-1])
+            done += len(rows)
+            written += len(buckets)
+            if progress is not None:
+                progress(device_id, done)
+
+        return written
@@ -0,0 +1,100 @@
+# PyQt_Service/Monitoring/ring_buffer.py
+"""
+그래프용 고정 크기 열(column) 링 버퍼.
+
+- 시각(ts)과 채널별 값을 numpy 배열에 담는다. append() 는 O(1) — list.pop(0) 처럼 앞을 당기지 않는다.
+- 배열 하나(행 = capacity 의 2배, 열 = 필드, 열 우선 저장)에 같은 행을 i, i + capacity 두 곳에 쓴다
+  → 최근 n 개는 항상 한 덩어리 구간이라 view() 가 복사 없이 잘라낸 연속 뷰를 돌려준다.
+- append / extend / snapshot 은 잠금으로 보호 → 수신 스레드에서 쓰고 GUI 스레드에서 읽어도 된다.
+  view() 는 다음 append 전까지만 유효하므로 쓰는 스레드와 같은 스레드(GUI)에서 바로 그릴 때 쓰고,
+  다른 스레드에서 읽을 때는 snapshot() (복사본) 을 쓴다.
+"""
+
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+        buf = RingBuffer(200, ("voltage", "current"))
+        buf.append(ts, 18.2, 0.15)
+        ax.plot(buf.view("ts"), buf.view("voltage"))
+    """
+
+    def __init__(self, capacity, fields, dtype=float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.fields = ("ts",) + tuple(fields)
+        self._index = {name: k for k, name in enumerate(self.fields)}
+        self._data = np.zeros((2 * capacity, len(self.fields)), dtype=dtype, order="F")
+        self._count = 0                 # 지금까지 넣은 샘플 수
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def total(self):
+        """지금까지 넣은 샘플 수 (버려진 것 포함)"""
+        return self._count
+
+    # ─────────────────────────────────────
+    # 쓰기
+    # ─────────────────────────────────────
+    def append(self, ts, *values):
+        """샘플 1개 (values 는 fields 순서)"""
+        with self._lock:
+            i = self._count % self.capacity
+            row = (ts, *values)
+            self._data[i] = row
+            self._data[i + self.capacity] = row
+            self._count += 1
+
+    def extend(self, ts, *columns):
+        """샘플 여러 개를 배열로 한 번에 (복원 등)"""
+        ts = np.asarray(ts, dtype=float)
+        n = len(ts)
+        if not n:
+            return
+
+        with self._lock:
+            keep = min(n, self.capacity)
+            slots = (self._count + np.arange(n - keep, n)) % self.capacity
+            rows = np.column_stack((ts, *columns))[n - keep:]
+            self._data[slots] = rows
+            self._data[slots + self.capacity] = rows
+            self._count += n
+
+    def clear(self):
+        with self._lock:
+            self._count = 0
+
+    # ─────────────────────────────────────
+    # 읽기
+    # ─────────────────────────────────────
+    def _window(self, last):
+        n = len(self) if last is None else min(last, len(self))
+        end = self._count % self.capacity
+        if self._count >= self.capacity:
+            end += self.capacity
+        return end - n, end
+
+    def view(self, name, last=None):
+        """최근 last 개(기본 전체)의 복사 없는 뷰 — 다음 append 전까지 유효"""
+        start, end = self._window(last)
+        return self._data[start:end, self._index[name]]
+
+    def snapshot(self, last=None):
+        """최근 last 개를 {필드: 배열 사본} 으로 (다른 스레드에서 읽을 때)"""
+        with self._lock:
+            start, end = self._window(last)
+            return {name: self._data[start:end, k].copy() for name, k in self._index.items()}
+
+    def last(self, name, default=None):
+        """가장 최근 값"""
+        if not self._count:
+            return default
+        return self._data[(self._count - 1) % self.capacity, self._index[name]].item()
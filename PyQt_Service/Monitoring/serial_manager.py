@@ -2,18 +2,25 @@
 
 import serial
 import threading
-import time
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.binary_frames import FrameDecoder
 
 
 class SerialManager:
+    READ_TIMEOUT = 0.05     # 1회 읽기 대기 시간(초)
+
     def __init__(self, port="COM3", baud=115200):
         try:
-            self.ser = serial.Serial(port, baud, timeout=1)
-            print(f"✅ Serial connected: {port}")
+            self.ser = serial.Serial(port, baud, timeout=self.READ_TIMEOUT)
+            LogManager.instance().log(f"✅ Serial connected: {port}")
         except Exception as e:
-            print(f"❌ Serial Connect Failed: {e}")
+            LogManager.instance().error(f"❌ Serial Connect Failed: {e}")
             self.ser = None
 
+        self._buffer = bytearray()
+        self._decoder = FrameDecoder()
+
         self.running = True
         self.thread = threading.Thread(target=self.read_loop, daemon=True)
         self.thread.start()
@@ -23,15 +30,23 @@ class SerialManager:
         if self.ser:
             self.ser.close()
 
-    # 단순 read loop
+    # 받은 만큼 한 번에 읽어 버퍼에서 줄 단위로 분리
     def read_loop(self):
-        while self.running:
+        while self.running and self.ser:
             try:
-                if self.ser and self.ser.in_waiting > 0:
-                    line = self.ser.readline().decode(errors="ignore").strip()
-                    if line:
-                        print("📥 Serial:", line)
+                chunk = self.ser.read(self.ser.in_waiting or 1)
             except Exception as e:
-                print("Serial Error:", e)
+                LogManager.instance().error(f"Serial Error: {e}")
+                return
+
+            if chunk:
+                self._buffer += chunk
+                self._decoder.decode(self._buffer, self._on_line, self._on_frame)
+
+    def _on_line(self, raw):
+        line = raw.decode(errors="ignore").strip()
+        if line:
+            LogManager.instance().log(f"📥 Serial: {line}")
 
-            time.sleep(0.05)
+    def _on_frame(self, frame):
+        LogManager.instance().log(f"📥 Serial: {frame}")
@@ -0,0 +1,168 @@
+# PyQt_Service/Protocol/binary_frames.py
+"""
+KIT_Solar_3.ino 바이너리 프레임 모드('$xe' 켜기 / '$ye' 끄기)의 프레임 디코더.
+
+프레임 형식 (정수는 little-endian):
+
+    A5 5A | LEN(1) | TYPE(1) | PAYLOAD(LEN) | CRC16(2)
+
+- CRC16 은 CRC-CCITT (다항식 0x1021, 초기값 0xFFFF) — LEN ~ PAYLOAD 범위에 대해 계산
+- TYPE 0x01 VC_MON 샘플 (14 바이트):
+      seq u16 | 전압 u16 (0.01V) | 전류 u16 (0.001A) | 전력 u32 (0.01W) | 용량 u32 (0.001Ah)
+  ASCII 'VC_MON Data - ...' 줄(약 55 바이트)이 20 바이트 프레임으로 줄어든다.
+
+바이너리 모드에서도 명령 응답은 기존처럼 텍스트 줄로 오므로
+FrameDecoder 는 한 수신 버퍼에서 텍스트 줄과 프레임을 함께 골라낸다.
+"""
+
+import binascii
+import struct
+from typing import NamedTuple
+
+
+SYNC = b"\xa5\x5a"
+HEADER_SIZE = 4         # SYNC(2) + LEN(1) + TYPE(1)
+CRC_SIZE = 2
+
+FRAME_VCMON = 0x01
+
+
+class VcMonFrame(NamedTuple):
+    """VC_MON 샘플 프레임 (값은 V / A / W / Ah 로 환산된 상태)"""
+    seq: int
+    voltage: float
+    current: float
+    power: float
+    capacity: float
+
+
+_VCMON = struct.Struct("<HHHII")
+
+
+def _decode_vcmon(buf, offset):
+    seq, v, i, p, c = _VCMON.unpack_from(buf, offset)
+    return VcMonFrame(seq, v / 100, i / 1000, p / 100, c / 1000)
+
+
+# TYPE → (PAYLOAD 길이, 디코더)
+FRAME_TYPES = {
+    FRAME_VCMON: (_VCMON.size, _decode_vcmon),
+}
+
+
+def crc16(data, crc=0xFFFF):
+    """CRC-CCITT (0x1021) — 펌웨어 crc16() 과 같은 값"""
+    return binascii.crc_hqx(data, crc)
+
+
+def encode_frame(frame_type, payload):
+    """프레임 만들기 (가상 장치·시험용)"""
+    body = bytes((len(payload), frame_type)) + payload
+    return SYNC + body + struct.pack("<H", crc16(body))
+
+
+def encode_vcmon(seq, voltage, current, power, capacity):
+    payload = _VCMON.pack(
+        seq & 0xFFFF,
+        round(voltage * 100), round(current * 1000),
+        round(power * 100), round(capacity * 1000),
+    )
+    return encode_frame(FRAME_VCMON, payload)
+
+
+class FrameDecoder:
+    """
+    수신 bytearray 에서 텍스트 줄과 프레임을 골라내는 디코더.
+
+    - 프레임의 CRC·필드는 버퍼에서 바로 읽는다 (memoryview / unpack_from, 복사 없음).
+    - 텍스트 줄은 줄마다 bytearray 사본(buf[pos:stop])으로 넘긴다 — memoryview 조각을 넘기면
+      콜백이 들고 있는 동안 버퍼 크기를 바꿀 수 없어 아래 앞부분 지우기(del buf[:pos])가 막히기 때문.
+      사본은 줄 길이만큼의 작은 복사이고, decode()/strip() 을 거친 새 문자열보다 싸다.
+    - 처리한 만큼은 마지막에 버퍼 앞에서 한 번에 지운다.
+    - 헤더(TYPE·LEN)나 CRC 가 틀리면 동기 바이트 1개만 건너뛰고 다시 찾는다.
+    - stats: frames(정상), crc_errors, bad_type(모르는 TYPE·길이의 헤더),
+             lost(seq 가 건너뛴 프레임 수), skipped_bytes(버린 바이트)
+    """
+
+    def __init__(self):
+        self.stats = {"frames": 0, "crc_errors": 0, "bad_type": 0, "lost": 0, "skipped_bytes": 0}
+        self._last_seq = None
+
+    def reset_stats(self):
+        for key in self.stats:
+            self.stats[key] = 0
+        self._last_seq = None
+
+    def decode(self, buf, on_line, on_frame):
+        """
+        buf(bytearray) 에서 완성된 줄·프레임을 꺼내 콜백으로 넘기고 그만큼 버퍼에서 지운다.
+        on_line(bytearray) — 줄 끝 '\\r\\n' 을 뺀 한 줄의 사본 / on_frame(record)
+        """
+        pos = 0
+        end = len(buf)
+        find = buf.find
+        sync = find(SYNC)       # 다음 동기 바이트 위치 (지나쳤을 때만 다시 찾는다)
+
+        while pos < end:
+            if 0 <= sync < pos:
+                sync = find(SYNC, pos)
+
+            # 텍스트 줄이 먼저 끝나면 줄로 처리
+            newline = find(b"\n", pos, sync if sync >= 0 else end)
+            if newline >= 0:
+                stop = newline - 1 if newline > pos and buf[newline - 1] == 0x0D else newline
+                on_line(buf[pos:stop])
+                pos = newline + 1
+                continue
+
+            if sync < 0:
+                break       # 줄이 아직 덜 옴
+
+            if sync > pos:
+                # 줄바꿈 없이 프레임 앞에 남은 조각 — 깨진 줄로 보고 버림
+                self.stats["skipped_bytes"] += sync - pos
+                pos = sync
+
+            if end - pos < HEADER_SIZE:
+                break
+
+            # 모르는 TYPE·길이면 (텍스트 속 우연한 A5 5A 포함) 본문을 기다리지 않고 바로 재동기
+            length = buf[pos + 2]
+            decoder = FRAME_TYPES.get(buf[pos + 3])
+            if decoder is None or decoder[0] != length:
+                self.stats["bad_type"] += 1
+                self.stats["skipped_bytes"] += 1
+                pos += 1
+                continue
+
+            frame_end = pos + HEADER_SIZE + length + CRC_SIZE
+            if frame_end > end:
+                break       # 프레임이 아직 덜 옴
+
+            # CRC·필드는 버퍼를 복사하지 않고 바로 읽는다
+            # (memoryview 는 임시로만 쓴다 — 남아 있으면 버퍼를 줄일 수 없음)
+            expected = buf[frame_end - 2] | (buf[frame_end - 1] << 8)
+            if crc16(memoryview(buf)[pos + 2:frame_end - CRC_SIZE]) != expected:
+                self.stats["crc_errors"] += 1
+                self.stats["skipped_bytes"] += 1
+                pos += 1
+                continue
+
+            frame = decoder[1](buf, pos + HEADER_SIZE)
+            pos = frame_end
+            self._count(frame)
+            on_frame(frame)
+
+        if pos:
+            del buf[:pos]
+
+    def _count(self, frame):
+        self.stats["frames"] += 1
+        seq = getattr(frame, "seq", None)
+        if seq is None:
+            return
+        if self._last_seq is not None:
+            gap = (seq - self._last_seq - 1) & 0xFFFF
+            if gap < 0x8000:        # 장치 재부팅 등으로 크게 뒤로 간 경우는 제외
+                self.stats["lost"] += gap
+        self._last_seq = seq
@@ -0,0 +1,402 @@
+# PyQt_Service/Protocol/firmware_protocol.py
+"""
+KIT_Solar_3.ino 가 Serial 로 출력하는 모든 줄 형식을 타입이 있는 레코드로 변환한다.
+
+- 한 줄 파싱(parse_line)은 줄 앞 2글자로 처리 함수를 바로 찾는 표(_DISPATCH)를 쓴다.
+  정규식 없이 partition/split + float() 로 필요한 필드만 잘라낸다.
+- '$j' / '$k' / '$t' / '$u' 처럼 여러 줄로 오는 응답은 parse_reply / parse_*_block 으로 처리한다.
+- '$w' 스냅샷은 모든 채널을 'SNAP,...' 한 줄로 보내므로 parse_line 하나로 Snapshot 이 된다.
+- 줄은 SerialManager 가 strip() 한 상태(앞뒤 공백·CR 제거)로 들어온다고 가정한다.
+- 자동 송신 'VC_MON Data' 줄은 parse_vcmon_bytes 로 str 디코딩 없이 bytes 에서 바로 숫자만 꺼낼 수 있다.
+"""
+
+from typing import NamedTuple, Optional
+
+
+# ========================================
+# 레코드 타입
+# ========================================
+class VoltageReading(NamedTuple):
+    """배터리 전압 센서 1채널 ('1S' / '2S' / '3S' / 'TOTAL')"""
+    channel: str
+    adc: int
+    voltage: float
+
+
+class VcMonReading(NamedTuple):
+    """VC_MON_LC 측정값 (자동 송신 줄에는 energy 가 없다)"""
+    voltage: float
+    current: float
+    power: float
+    capacity: float
+    energy: Optional[float] = None
+
+
+class OutputEvent(NamedTuple):
+    """출력 상태 변경 응답 — device: pilot / fan_commercial / fan_battery / halogen"""
+    device: str
+    state: object       # pilot 은 'OFF'/'GREEN'/'RED', 나머지는 bool
+
+
+class SafetyNotice(NamedTuple):
+    """
+    인터락·안전 관련 알림.
+    kind: interlock(한쪽 선풍기 강제 OFF) / safety(두 선풍기 동시 ON 차단)
+          / switch(전원 자동 전환) / reset(두 버튼 동시 입력)
+    """
+    kind: str
+    text: str
+
+
+class BatteryStatus(NamedTuple):
+    """자동 제어의 배터리 상태 변경 알림 ('Battery Status: OK (12.34V >= 10V)')"""
+    ok: bool
+    voltage: float
+
+
+class CommandAck(NamedTuple):
+    """값이 없는 명령 응답 (VC Monitor Auto Send Start 등)"""
+    text: str
+
+
+class SystemStatus(NamedTuple):
+    """'$u' 시스템 상태 블록"""
+    solar_voltage: Optional[float] = None
+    solar_current: Optional[float] = None
+    max_current: Optional[float] = None
+    solar_power: Optional[float] = None
+    cumulative_energy: Optional[float] = None
+    cell_1s: Optional[float] = None
+    cell_2s: Optional[float] = None
+    cell_3s: Optional[float] = None
+    total: Optional[float] = None
+    battery_ok: Optional[bool] = None
+    fan_commercial: Optional[bool] = None
+    fan_battery: Optional[bool] = None
+    interlock_ok: Optional[bool] = None
+    pilot: Optional[str] = None
+    halogen: Optional[bool] = None
+
+
+# 파일럿 램프 — 펌웨어 상태 → 실제 점등 색 (릴레이 배선이 반대라 GREEN/RED 가 뒤바뀜,
+# 설정 페이지 버튼도 같은 기준: 'Red' 버튼이 '$be' 를 보내고 상태를 RED 로 둔다)
+PILOT_LAMP_COLOR = {"OFF": "OFF", "GREEN": "RED", "RED": "GREEN"}
+
+
+class Snapshot(NamedTuple):
+    """'$w' 전체 채널 스냅샷 한 줄"""
+    cell_1s: float
+    cell_2s: float
+    cell_3s: float
+    total: float
+    vcmon: Optional[VcMonReading]     # VC_MON_LC 데이터가 없으면 None
+    max_current: float
+    cumulative_energy: float
+    pilot: str                        # 펌웨어 기준 'OFF' / 'GREEN' / 'RED'
+    fan_commercial: bool
+    fan_battery: bool
+    halogen: bool
+    battery_ok: bool
+
+    def cells(self):
+        return {"1S": self.cell_1s, "2S": self.cell_2s, "3S": self.cell_3s, "TOTAL": self.total}
+
+    def as_state(self):
+        """system_state.update() 한 번으로 반영할 값 (DeviceState — 여러 필드를 한 번에)"""
+        state = {
+            "latest_voltage": self.total,
+            "cell_voltages": self.cells(),
+            "battery_ok": self.battery_ok,
+            "pilot": PILOT_LAMP_COLOR[self.pilot],
+            "fan_commercial": self.fan_commercial,
+            "fan_battery": self.fan_battery,
+            "halogen": self.halogen,
+            "max_current": self.max_current,
+            "cumulative_energy": self.cumulative_energy,
+        }
+        if self.vcmon is not None:
+            state["last_power"] = self.vcmon.power
+        return state
+
+    def as_status(self):
+        """'$u' 응답과 같은 SystemStatus 로 변환"""
+        vc = self.vcmon
+        return SystemStatus(
+            solar_voltage=vc.voltage if vc else None,
+            solar_current=vc.current if vc else None,
+            max_current=self.max_current if vc else None,
+            solar_power=vc.power if vc else None,
+            cumulative_energy=self.cumulative_energy if vc else None,
+            cell_1s=self.cell_1s, cell_2s=self.cell_2s, cell_3s=self.cell_3s, total=self.total,
+            battery_ok=self.battery_ok,
+            fan_commercial=self.fan_commercial,
+            fan_battery=self.fan_battery,
+            interlock_ok=not (self.fan_commercial and self.fan_battery),
+            pilot=self.pilot,
+            halogen=self.halogen,
+        )
+
+
+# ========================================
+# 한 줄 파서
+# ========================================
+_CHANNELS = {
+    "A0 (1S)": "1S", "A1 (2S)": "2S", "A2 (3S)": "3S", "A3 (Total)": "TOTAL",
+    "1S Battery": "1S", "2S Battery": "2S", "3S Battery": "3S", "Total Battery": "TOTAL",
+}
+
+
+def _parse_voltage(line):
+    # "A3 (Total) - ADC: 512 | Voltage: 12.500V"  ($o~$r, $j)
+    head, sep, rest = line.partition(" - ADC: ")
+    if sep:
+        adc, _, volt = rest.partition(" | Voltage: ")
+        return VoltageReading(_CHANNELS[head], int(adc), float(volt.rstrip("V")))
+
+    # "A3 (Total): 12.500V (ADC: 512)"  ($t)
+    head, _, rest = line.partition(":")
+    volt, _, adc = rest.strip().partition("V (ADC: ")
+    return VoltageReading(_CHANNELS[head], int(adc.rstrip(")")), float(volt))
+
+
+def _parse_vcmon(line):
+    # "VC_MON Data - V:24.01V, I:0.000A, P:1.59W, C:0.000Ah"
+    v, i, p, c = line[16:].split(", ")
+    return VcMonReading(float(v[:-1]), float(i[2:-1]), float(p[2:-1]), float(c[2:-2]))
+
+
+def parse_vcmon_bytes(raw):
+    """
+    수신 bytes 한 줄 → VcMonReading (형식이 다르면 None).
+    float() 는 bytes 를 그대로 받으므로 줄 전체를 디코딩하지 않는다.
+    """
+    if not raw.startswith(b"VC_MON Data - "):
+        return None
+    try:
+        v, i, p, c = raw[16:].split(b", ")
+        return VcMonReading(float(v[:-1]), float(i[2:-1]), float(p[2:-1]), float(c[2:-2]))
+    except ValueError:
+        return None
+
+
+# 펌웨어 convertToVoltage() 와 같은 환산 (ADC 1칸 = 5V / 1024 × 분배비 5)
+_VOLT_PER_ADC = 5.0 / 1024 * 5.0
+_PILOT_NAMES = ("OFF", "GREEN", "RED")
+
+
+def _parse_snapshot(line):
+    # "SNAP,503,168,336,503,1,24.01,0.125,3.00,0.412,0.130,0.015,1,0,1,0,1"
+    f = line.split(",")
+    if len(f) != 17:
+        raise ValueError(line)
+
+    a1, a2, a3, at = (round(int(x) * _VOLT_PER_ADC, 3) for x in f[1:5])
+    vcmon = None
+    if f[5] == "1":
+        vcmon = VcMonReading(float(f[6]), float(f[7]), float(f[8]), float(f[9]))
+
+    return Snapshot(
+        a1, a2, a3, at, vcmon,
+        float(f[10]), float(f[11]),
+        _PILOT_NAMES[int(f[12])],
+        f[13] == "1", f[14] == "1", f[15] == "1", f[16] == "1",
+    )
+
+
+def _parse_pilot(line):
+    # "Pilot Lamp GREEN (NO Contact)"
+    return OutputEvent("pilot", line[11:].split(" ", 1)[0])
+
+
+def _output(device, offset):
+    def parse(line):
+        return OutputEvent(device, line[offset:offset + 2] == "ON")
+    return parse
+
+
+def _parse_button(line):
+    # "Green Button Pressed - Halogen Lamp ON"
+    return OutputEvent("halogen", line.endswith("ON"))
+
+
+def _parse_battery_status(line):
+    # "Battery Status: OK (12.34V >= 10V)"
+    state, _, rest = line[16:].partition(" (")
+    return BatteryStatus(state == "OK", float(rest.split("V", 1)[0]))
+
+
+def _notice(kind):
+    def parse(line):
+        return SafetyNotice(kind, line)
+    return parse
+
+
+def _ack(line):
+    return CommandAck(line)
+
+
+# 줄 앞 2글자 → ((접두어, 처리 함수), ...)
+# 같은 2글자를 쓰는 형식은 접두어로 한 번 더 구분한다 (긴 접두어 먼저)
+_DISPATCH = {}
+
+
+def _register(prefix, handler):
+    _DISPATCH.setdefault(prefix[:2], []).append((prefix, handler))
+
+
+for _prefix in _CHANNELS:
+    _register(_prefix, _parse_voltage)
+
+_register("VC_MON Data - ", _parse_vcmon)
+_register("VC Monitor ", _ack)
+_register("Pilot Lamp ", _parse_pilot)
+_register("Commercial Fan turned OFF due to interlock", _notice("interlock"))
+_register("Battery Fan turned OFF due to interlock", _notice("interlock"))
+_register("Commercial Fan ", _output("fan_commercial", 15))
+_register("Battery Status: ", _parse_battery_status)
+_register("Battery Fan ", _output("fan_battery", 12))
+_register("Halogen Lamp ", _output("halogen", 13))
+_register("Green Button Pressed", _parse_button)
+_register("Red Button Pressed", _parse_button)
+_register("Both Buttons Pressed", _notice("reset"))
+_register("SAFETY:", _notice("safety"))
+_register("Switching from ", _notice("switch"))
+_register("Solar Power Data Reset", _ack)
+_register("SNAP,", _parse_snapshot)
+
+_DISPATCH = {
+    key: tuple(sorted(entries, key=lambda e: -len(e[0])))
+    for key, entries in _DISPATCH.items()
+}
+
+
+def parse_line(line):
+    """
+    펌웨어 출력 한 줄 → 레코드 (모르는 형식·깨진 줄이면 None).
+    블록 안의 줄('Voltage: 24.01 V' 등)은 문맥이 필요하므로 parse_reply 를 사용한다.
+    """
+    entries = _DISPATCH.get(line[:2])
+    if entries is None:
+        return None
+
+    for prefix, handler in entries:
+        if line.startswith(prefix):
+            try:
+                return handler(line)
+            except (ValueError, IndexError, KeyError):
+                return None
+
+    return None
+
+
+# ========================================
+# 여러 줄 응답 블록
+# ========================================
+def _value(line):
+    """'Voltage: 24.01 V' → 24.01"""
+    return float(line.partition(":")[2].split()[0])
+
+
+def parse_vcmon_block(lines):
+    """'$k' 응답 → VcMonReading (유효 데이터 없으면 None)"""
+    fields = {}
+    for line in lines:
+        name, sep, _ = line.partition(":")
+        if sep and name in ("Voltage", "Current", "Power", "Capacity", "Energy"):
+            try:
+                fields[name.lower()] = _value(line)
+            except (ValueError, IndexError):
+                pass
+
+    if len(fields) < 4:
+        return None
+
+    return VcMonReading(
+        fields["voltage"], fields["current"], fields["power"],
+        fields["capacity"], fields.get("energy"),
+    )
+
+
+_STATUS_KEYS = {
+    (1, "Voltage"): "solar_voltage",
+    (1, "Current"): "solar_current",
+    (1, "Max Current"): "max_current",
+    (1, "Power"): "solar_power",
+    (1, "Cumulative Energy"): "cumulative_energy",
+    (2, "1S"): "cell_1s",
+    (2, "2S"): "cell_2s",
+    (2, "3S"): "cell_3s",
+    (2, "Total"): "total",
+}
+
+
+def parse_status_block(lines):
+    """'$u' 응답 → SystemStatus"""
+    values = {}
+    section = 0
+
+    for line in lines:
+        if line.startswith("【"):
+            section = int(line[1]) if line[1:2].isdigit() else 0
+            continue
+
+        if "INTERLOCK VIOLATION" in line:
+            values["interlock_ok"] = False
+            continue
+        if "Interlock OK" in line:
+            values["interlock_ok"] = True
+            continue
+
+        name, sep, rest = line.partition(":")
+        if not sep:
+            continue
+        rest = rest.strip()
+
+        try:
+            key = _STATUS_KEYS.get((section, name))
+            if key is not None:
+                values[key] = float(rest.split()[0])
+                if key == "total":
+                    values["battery_ok"] = rest.endswith("(OK)")
+            elif section == 3 and name == "Commercial Power":
+                values["fan_commercial"] = rest == "ON"
+            elif section == 3 and name == "Battery Power":
+                values["fan_battery"] = rest == "ON"
+            elif section == 4 and name == "Status":
+                values["pilot"] = rest
+            elif section == 5 and name == "Status":
+                values["halogen"] = rest == "ON"
+        except (ValueError, IndexError):
+            pass
+
+    return SystemStatus(**values)
+
+
+def parse_voltage_block(lines):
+    """'$j' / '$t' 응답 → {'1S': VoltageReading, ...}"""
+    readings = {}
+    for line in lines:
+        record = parse_line(line)
+        if isinstance(record, VoltageReading):
+            readings[record.channel] = record
+    return readings
+
+
+def parse_reply(char, lines):
+    """
+    명령 문자와 SerialManager 가 모은 응답 줄 → 레코드
+      j, t        → {'1S': VoltageReading, ...}
+      k           → VcMonReading
+      u           → SystemStatus
+      w           → Snapshot
+      그 외       → 마지막 줄의 parse_line 결과
+    """
+    if not lines:
+        return None
+    if char in ("j", "t"):
+        return parse_voltage_block(lines)
+    if char == "k":
+        return parse_vcmon_block(lines)
+    if char == "u":
+        return parse_status_block(lines)
+    return parse_line(lines[-1])
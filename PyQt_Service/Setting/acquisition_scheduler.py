@@ -0,0 +1,409 @@
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from PyQt5 import QtCore
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.firmware_protocol import parse_reply
+
+
+# ========================================
+# 텔레메트리 채널 (요청 명령 + 기본 주기 + 응답 해석)
+# ========================================
+def _total_voltage(lines):
+    reading = parse_reply("r", lines)
+    return reading.voltage if reading is not None else None
+
+
+def _cell_voltages(lines):
+    readings = parse_reply("j", lines)
+    return {ch: r.voltage for ch, r in readings.items()} if readings else None
+
+
+def _status_cells(status):
+    cells = {"1S": status.cell_1s, "2S": status.cell_2s, "3S": status.cell_3s, "TOTAL": status.total}
+    return {ch: v for ch, v in cells.items() if v is not None} or None
+
+
+class Channel(NamedTuple):
+    char: str               # 요청 명령 ('$<char>e')
+    interval: float         # 기본 주기(초) — 0 이면 요청하지 않음
+    parse: object           # 응답 줄 → 값
+    covers: dict = {}       # 이 응답으로 함께 갱신할 수 있는 채널 → 값 추출 함수
+
+
+CHANNELS = {
+    "total_voltage": Channel("r", 60.0, _total_voltage),
+    "cell_voltages": Channel("j", 300.0, _cell_voltages, {
+        "total_voltage": lambda cells: cells.get("TOTAL"),
+    }),
+    "vcmon": Channel("k", 5.0, lambda lines: parse_reply("k", lines)),
+    "system_status": Channel("u", 30.0, lambda lines: parse_reply("u", lines), {
+        "total_voltage": lambda status: status.total,
+        "cell_voltages": _status_cells,
+    }),
+    # '$w' 한 줄 응답으로 위 채널을 모두 채운다 (이 채널을 0 으로 두면 개별 명령으로 요청)
+    "snapshot": Channel("w", 5.0, lambda lines: parse_reply("w", lines), {
+        "total_voltage": lambda snap: snap.total,
+        "cell_voltages": lambda snap: snap.cells(),
+        "vcmon": lambda snap: snap.vcmon,
+        "system_status": lambda snap: snap.as_status(),
+    }),
+}
+
+# 주기 설정 파일 — 프로그램 실행 중에 고쳐도 CONFIG_CHECK 초 안에 반영된다
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "polling.json")
+
+
+class _Poll:
+    """보드 1대 × 채널 1개의 다음 실행 일정"""
+
+    def __init__(self, device_id, name, interval, due):
+        self.device_id = device_id
+        self.name = name
+        self.interval = interval
+        self.due = due              # 다음 실행 시각 (힙의 오래된 항목 구분용)
+
+
+class _Link:
+    """보드 1대의 시리얼 링크 — 스케줄러 요청은 한 번에 1개씩만 보낸다"""
+
+    def __init__(self):
+        self.ready = deque()        # 실행 시각이 된 채널 이름 (전송 대기)
+        self.busy = False           # 응답 대기 중
+        self.next_free = 0.0        # 다음 요청을 보낼 수 있는 시각
+
+
+class AcquisitionScheduler(QtCore.QObject):
+    """
+    모든 보드의 텔레메트리 채널을 스레드 1개로 주기 요청하는 스케줄러.
+
+    - 채널마다 주기가 따로 있다 (CHANNELS 기본값 → polling.json → set_interval() 순으로 덮어씀)
+    - 같은 보드에는 요청을 1개씩, LINK_GAP 간격을 두고 보낸다 (링크에서 응답이 겹치지 않음)
+    - 한 응답으로 다른 채널도 채울 수 있으면 (예: '$u' → 총전압·셀 전압)
+      곧 실행될 그 채널은 따로 요청하지 않고 함께 갱신한다.
+      채울 수 있는 채널이 같거나 더 짧은 주기로 돌고 있으면 항상 그 채널로 요청한다 (예: '$w')
+    - 요청은 send_request() 로 보내고 응답을 기다리지 않는다.
+      결과는 result_ready 시그널로 GUI 스레드에 전달된다 (응답이 없으면 값은 None)
+    """
+
+    LINK_GAP = 0.05         # 같은 보드에 연속 요청 사이 최소 간격(초)
+    STAGGER = 0.25          # 채널·보드별 첫 실행 시각 차이(초)
+    COALESCE_WINDOW = 2.0   # 이 시간 안에 실행될 채널은 다른 요청에 묶는다(초)
+    CONFIG_CHECK = 2.0      # 설정 파일 변경 확인 주기(초)
+    REPLY_TIMEOUT = 2.0
+
+    result_ready = QtCore.pyqtSignal(str, str, object)   # (장치 ID, 채널 이름, 값)
+
+    def __init__(self, registry, config_path=CONFIG_PATH):
+        super().__init__()
+        self.registry = registry
+        self.config_path = config_path
+
+        self._intervals = {name: ch.interval for name, ch in CHANNELS.items()}
+        self._device_intervals = {}         # 장치 ID → {채널: 주기}
+        self._config_mtime = None
+        self._next_config_check = 0.0
+
+        self._polls = {}                    # (장치 ID, 채널) → _Poll
+        self._links = {}                    # 장치 ID → _Link
+        self._heap = []                     # (실행 시각, 순번, 키)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = True
+
+        self._load_config()
+
+        self.registry.devices_changed.connect(self._sync_devices)
+        self._sync_devices()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ─────────────────────────────────────
+    # 주기 조정 (실행 중 변경 가능)
+    # ─────────────────────────────────────
+    def interval(self, name, device_id=None):
+        overrides = self._device_intervals.get(device_id, {})
+        return overrides.get(name, self._intervals[name])
+
+    def set_interval(self, name, seconds, device_id=None):
+        """채널 주기 변경 (device_id 생략 시 모든 보드) — 0 이면 요청 중지"""
+        if name not in CHANNELS:
+            raise KeyError(name)
+
+        with self._cond:
+            if device_id is None:
+                self._intervals[name] = float(seconds)
+            else:
+                self._device_intervals.setdefault(device_id, {})[name] = float(seconds)
+            self._apply_intervals()
+
+    def intervals(self):
+        return dict(self._intervals)
+
+    def trigger(self, device_id, name):
+        """다음 주기를 기다리지 않고 바로 실행"""
+        with self._cond:
+            if (device_id, name) in self._polls:
+                self._schedule((device_id, name), time.monotonic())
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+
+    # ─────────────────────────────────────
+    # 보드 목록 반영 (GUI 스레드)
+    # ─────────────────────────────────────
+    def _sync_devices(self):
+        ids = self.registry.ids()
+        now = time.monotonic()
+
+        with self._cond:
+            for index, device_id in enumerate(ids):
+                if device_id in self._links:
+                    continue
+                self._links[device_id] = _Link()
+                for offset, name in enumerate(CHANNELS):
+                    # 보드·채널마다 첫 실행 시각을 어긋나게 둔다
+                    due = now + (index + offset) * self.STAGGER
+                    interval = self.interval(name, device_id)
+                    self._polls[(device_id, name)] = _Poll(device_id, name, interval, due)
+                    self._schedule((device_id, name), due)
+
+            for device_id in [d for d in self._links if d not in ids]:
+                del self._links[device_id]
+                for name in CHANNELS:
+                    self._polls.pop((device_id, name), None)
+
+            self._apply_intervals()
+
+    def _apply_intervals(self):
+        """_cond 잠근 상태에서 호출 — 주기가 짧아진 채널은 새 주기 안에 실행되도록 당긴다"""
+        now = time.monotonic()
+        for key, poll in self._polls.items():
+            interval = self.interval(poll.name, poll.device_id)
+            if interval == poll.interval:
+                continue
+
+            was_off = poll.interval <= 0
+            poll.interval = interval
+            if interval > 0 and (was_off or poll.due > now + interval):
+                self._schedule(key, now if was_off else now + interval)
+        self._cond.notify()
+
+    # ─────────────────────────────────────
+    # 설정 파일 (polling.json)
+    # ─────────────────────────────────────
+    def _load_config(self):
+        """
+        {"link_gap": 0.05,
+         "channels": {"total_voltage": 60, "vcmon": 5, ...},
+         "devices": {"KIT-2": {"vcmon": 10}}}
+        """
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            return
+        if mtime == self._config_mtime:
+            return
+        self._config_mtime = mtime
+
+        try:
+            with open(self.config_path, encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            LogManager.instance().warning(f"[Scheduler] 주기 설정 읽기 실패: {e}")
+            return
+
+        intervals = {name: ch.interval for name, ch in CHANNELS.items()}
+        for name, seconds in config.get("channels", {}).items():
+            if name in intervals:
+                intervals[name] = float(seconds)
+
+        with self._cond:
+            self.LINK_GAP = float(config.get("link_gap", AcquisitionScheduler.LINK_GAP))
+            self._intervals = intervals
+            self._device_intervals = {
+                device_id: {n: float(s) for n, s in channels.items() if n in CHANNELS}
+                for device_id, channels in config.get("devices", {}).items()
+            }
+            self._apply_intervals()
+
+        LogManager.instance().log(f"[Scheduler] 주기 설정 적용: {self._intervals}")
+
+    # ─────────────────────────────────────
+    # 스케줄러 스레드
+    # ─────────────────────────────────────
+    def _schedule(self, key, when):
+        self._polls[key].due = when
+        heapq.heappush(self._heap, (when, next(self._seq), key))
+        self._cond.notify()
+
+    def _run(self):
+        while True:
+            now = time.monotonic()
+            if now >= self._next_config_check:
+                self._next_config_check = now + self.CONFIG_CHECK
+                self._load_config()
+
+            with self._cond:
+                if not self._running:
+                    return
+
+                now = time.monotonic()
+                self._collect_due(now)
+                requests = self._take_requests(now)
+
+                if not requests:
+                    self._cond.wait(self._wait_time(now))
+                    continue
+
+            for device_id, name, covered in requests:
+                self._fire(device_id, name, covered)
+
+    def _collect_due(self, now):
+        """실행 시각이 된 채널을 보드별 전송 대기열로 옮기고 다음 주기 예약"""
+        while self._heap and self._heap[0][0] <= now:
+            when, _, key = heapq.heappop(self._heap)
+            poll = self._polls.get(key)
+            if poll is None or poll.due != when:
+                continue    # 삭제됐거나 일정이 바뀐 채널
+            if poll.interval <= 0:
+                continue    # 꺼진 채널 — 주기를 다시 켜면 _apply_intervals 가 예약
+
+            link = self._links[poll.device_id]
+            if poll.name not in link.ready:
+                link.ready.append(poll.name)
+
+            # 밀린 주기는 건너뛰고 다음 주기 예약 (일정한 간격 유지)
+            next_due = when + poll.interval
+            self._schedule(key, next_due if next_due > now else now + poll.interval)
+
+    def _take_requests(self, now):
+        """보낼 수 있는 보드마다 요청 1개씩 선택 (묶을 수 있는 채널은 함께)"""
+        requests = []
+        for device_id, link in self._links.items():
+            if link.busy or not link.ready or now < link.next_free:
+                continue
+
+            first = link.ready.popleft()
+            name = self._coalesce(device_id, first, now)
+            covered = self._absorb(device_id, name, link, now)
+            if name != first and first not in covered:
+                covered.append(first)
+
+            link.busy = True
+            requests.append((device_id, name, covered))
+        return requests
+
+    def _coalesce(self, device_id, name, now):
+        """
+        name 을 채워 주는 채널이 대기 중이거나 곧 실행되거나
+        name 보다 자주 실행되는 채널이면 그 채널을 대신 요청 (여럿이면 가장 많이 채우는 채널)
+        """
+        link = self._links[device_id]
+        interval = self._polls[(device_id, name)].interval
+
+        best = None
+        for other, channel in CHANNELS.items():
+            if name not in channel.covers:
+                continue
+
+            poll = self._polls[(device_id, other)]
+            if poll.interval <= 0:
+                continue
+
+            if (other in link.ready or poll.due - now <= self._window(poll)
+                    or poll.interval <= interval):
+                if best is None or len(channel.covers) > len(CHANNELS[best].covers):
+                    best = other
+
+        if best is None:
+            return name
+
+        if best in link.ready:
+            link.ready.remove(best)
+        else:
+            self._schedule((device_id, best), now + self._polls[(device_id, best)].interval)
+        return best
+
+    def _absorb(self, device_id, name, link, now):
+        """name 요청의 응답으로 채울 채널 중 대기 중이거나 곧 실행될 것 → 일정에서 제외"""
+        covered = []
+        for other in CHANNELS[name].covers:
+            poll = self._polls[(device_id, other)]
+            if poll.interval <= 0:
+                continue
+
+            if other in link.ready:
+                link.ready.remove(other)
+            elif poll.due - now <= self._window(poll):
+                self._schedule((device_id, other), now + poll.interval)
+            else:
+                continue
+            covered.append(other)
+        return covered
+
+    def _window(self, poll):
+        return min(self.COALESCE_WINDOW, poll.interval * 0.25)
+
+    def _wait_time(self, now):
+        wake = self._heap[0][0] if self._heap else now + self.CONFIG_CHECK
+        for link in self._links.values():
+            if link.ready and not link.busy:
+                wake = min(wake, link.next_free)
+        wake = min(wake, self._next_config_check)
+        return max(0.0, wake - now)
+
+    # ─────────────────────────────────────
+    # 요청 전송 / 결과 전달
+    # ─────────────────────────────────────
+    def _fire(self, device_id, name, covered):
+        device = self.registry.get(device_id)
+        future = None
+        if device is not None and device.is_connected:
+            future = device.serial.send_request(CHANNELS[name].char, self.REPLY_TIMEOUT)
+
+        if future is None:
+            self._release(device_id)
+            return
+
+        future.add_done_callback(lambda f: self._deliver(device_id, name, covered, f))
+
+    def _deliver(self, device_id, name, covered, future):
+        """수신 스레드에서 호출 — 파싱 후 시그널로 GUI 스레드에 전달"""
+        self._release(device_id)
+
+        channel = CHANNELS[name]
+        try:
+            value = channel.parse(future.result())
+        except Exception as e:
+            LogManager.instance().warning(f"[Scheduler] {device_id}/{name} 응답 처리 실패: {e}")
+            value = None
+
+        self.result_ready.emit(device_id, name, value)
+
+        for other in covered:
+            try:
+                extra = channel.covers[other](value) if value is not None else None
+            except Exception as e:
+                LogManager.instance().warning(f"[Scheduler] {device_id}/{other} 응답 처리 실패: {e}")
+                extra = None
+            self.result_ready.emit(device_id, other, extra)
+
+    def _release(self, device_id):
+        with self._cond:
+            link = self._links.get(device_id)
+            if link is not None:
+                link.busy = False
+                link.next_free = time.monotonic() + self.LINK_GAP
+            self._cond.notify()
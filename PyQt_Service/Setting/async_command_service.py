@@ -0,0 +1,155 @@
+import asyncio
+import threading
+
+from PyQt_Service.Protocol.firmware_protocol import parse_reply
+from .async_serial_manager import AsyncSerialManager
+
+
+class AsyncCommandService:
+    """
+    CommandService 의 asyncio 버전 — await 로 호출하고 파싱된 값을 돌려받는다.
+
+        serial = AsyncSerialManager()
+        await serial.connect("/dev/ttyACM0")
+        command = AsyncCommandService(serial)
+        voltage = await command.read_total()            # 12.345 (float) / None
+
+    여러 보드는 보드마다 AsyncSerialManager 를 만들고 asyncio.gather 로 동시에 호출한다.
+    모든 호출은 timeout 을 받으며, 호출 태스크를 취소하면 대기 중인 요청도 정리된다.
+    """
+
+    REPLY_TIMEOUT = 2.0
+
+    def __init__(self, serial_manager: AsyncSerialManager):
+        self.serial = serial_manager
+
+    async def _send(self, char: str, timeout: float = REPLY_TIMEOUT) -> bool:
+        """제어 명령 — 아두이노 응답을 받았으면 True"""
+        return await self.serial.request(char, timeout) is not None
+
+    # ─────────────────────────────────────
+    # 파일럿 램프 / 선풍기 / 할로겐
+    # ─────────────────────────────────────
+    async def pilot_off(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("a", timeout)
+
+    async def pilot_green(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("b", timeout)
+
+    async def pilot_red(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("c", timeout)
+
+    async def fan_commercial_on(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("d", timeout)
+
+    async def fan_commercial_off(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("e", timeout)
+
+    async def fan_battery_on(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("f", timeout)
+
+    async def fan_battery_off(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("g", timeout)
+
+    async def halogen_on(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("h", timeout)
+
+    async def halogen_off(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("i", timeout)
+
+    # ─────────────────────────────────────
+    # VC_MON_LC 제어
+    # ─────────────────────────────────────
+    async def reset_vcmon_data(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("l", timeout)
+
+    async def start_vcmon_auto(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("m", timeout)
+
+    async def stop_vcmon_auto(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("n", timeout)
+
+    async def binary_mode_on(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("x", timeout)
+
+    async def binary_mode_off(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("y", timeout)
+
+    async def reset_solar_data(self, timeout: float = REPLY_TIMEOUT) -> bool:
+        return await self._send("v", timeout)
+
+    # ─────────────────────────────────────
+    # 전압 읽기 (V, float) — 응답이 없으면 None
+    # ─────────────────────────────────────
+    async def _read_voltage(self, char, timeout):
+        reading = parse_reply(char, await self.serial.request(char, timeout))
+        return reading.voltage if reading is not None else None
+
+    async def read_1s(self, timeout: float = REPLY_TIMEOUT):
+        return await self._read_voltage("o", timeout)
+
+    async def read_2s(self, timeout: float = REPLY_TIMEOUT):
+        return await self._read_voltage("p", timeout)
+
+    async def read_3s(self, timeout: float = REPLY_TIMEOUT):
+        return await self._read_voltage("q", timeout)
+
+    async def read_total(self, timeout: float = REPLY_TIMEOUT):
+        return await self._read_voltage("r", timeout)
+
+    async def read_all_voltages(self, timeout: float = REPLY_TIMEOUT):
+        """'$j' → {'1S': VoltageReading, '2S': ..., '3S': ..., 'TOTAL': ...}"""
+        return parse_reply("j", await self.serial.request("j", timeout))
+
+    # ─────────────────────────────────────
+    # VC_MON_LC 데이터 ($k) → VcMonReading
+    # ─────────────────────────────────────
+    async def read_vcmon(self, timeout: float = REPLY_TIMEOUT):
+        return parse_reply("k", await self.serial.request("k", timeout))
+
+    # ─────────────────────────────────────
+    # 시스템 상태 ($u) → SystemStatus
+    # ─────────────────────────────────────
+    async def read_system_status(self, timeout: float = REPLY_TIMEOUT):
+        return parse_reply("u", await self.serial.request("u", timeout))
+
+    # ─────────────────────────────────────
+    # 전체 채널 스냅샷 ($w) → Snapshot (한 번 왕복으로 전압·VC_MON·출력 상태)
+    # ─────────────────────────────────────
+    async def read_snapshot(self, timeout: float = REPLY_TIMEOUT):
+        return parse_reply("w", await self.serial.request("w", timeout))
+
+
+# ========================================
+# Qt 앱에서 사용하기 위한 이벤트 루프 연결
+# ========================================
+def install_qt_event_loop(app):
+    """
+    qasync 로 Qt 이벤트 루프 위에서 asyncio 를 돌린다.
+    이후 슬롯에서 asyncio.ensure_future(command.read_total()) 처럼 바로 호출할 수 있다.
+    """
+    import qasync
+
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+class AsyncLoopThread:
+    """
+    qasync 가 없을 때의 대안 — 별도 스레드 하나에서 이벤트 루프를 돌리고
+    submit(coro) 로 concurrent.futures.Future 를 돌려받는다.
+    (CommandExecutor.submit 에 그대로 넘기면 완료가 Qt 시그널로 전달된다)
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1.0)
@@ -0,0 +1,183 @@
+import asyncio
+import serial
+import serial.tools.list_ports
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.binary_frames import FrameDecoder
+from .serial_manager import ReplyRouter
+
+
+class AsyncSerialManager:
+    """
+    asyncio 기반 시리얼 전송 계층 (SerialManager 의 비동기 버전).
+
+    - 수신 스레드 없이 이벤트 루프의 add_reader 로 포트를 감시한다.
+      → 한 이벤트 루프에서 여러 보드(포트)를 동시에 다룰 수 있다.
+    - 실제 USB 포트뿐 아니라 pty 경로(/dev/pts/N)도 그대로 열 수 있다.
+    - add_reader 를 지원하지 않는 루프(Windows 등)에서는 짧은 주기의
+      폴링 태스크로 대신 읽는다.
+    """
+
+    POLL_INTERVAL = 0.01    # add_reader 미지원 시 폴링 주기(초)
+    REPLY_TIMEOUT = 2.0     # 기본 응답 대기 시간(초)
+
+    def __init__(self):
+        self.port = None
+        self.is_connected = False
+
+        self._router = ReplyRouter()
+        self._decoder = FrameDecoder()
+        self._buffer = bytearray()
+        self._loop = None
+        self._poll_task = None
+
+    # ========================================
+    # 사용 가능한 포트 목록 가져오기
+    # ========================================
+    def list_ports(self):
+        return list(serial.tools.list_ports.comports())
+
+    # ========================================
+    # 포트 연결 / 해제
+    # ========================================
+    async def connect(self, port_name) -> bool:
+        if self.port is not None:
+            await self.disconnect()
+
+        self._loop = asyncio.get_running_loop()
+
+        try:
+            # timeout=0 → read() 가 즉시 반환 (논블로킹)
+            self.port = serial.Serial(
+                port_name,
+                115200,
+                timeout=0,
+                dsrdtr=False,
+                rtscts=False
+            )
+        except Exception as e:
+            LogManager.instance().warning(f"[AsyncSerial] {port_name} 연결 실패: {e}")
+            self.port = None
+            self.is_connected = False
+            return False
+
+        self._buffer = bytearray()
+        self._router.open()
+        self.is_connected = True
+
+        try:
+            self._loop.add_reader(self.port.fileno(), self._on_readable)
+        except (NotImplementedError, AttributeError, ValueError):
+            self._poll_task = self._loop.create_task(self._poll_loop())
+
+        return True
+
+    async def disconnect(self):
+        self._close()
+
+    def _close(self):
+        self.is_connected = False
+
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        elif self.port is not None and self._loop is not None:
+            try:
+                self._loop.remove_reader(self.port.fileno())
+            except Exception:
+                pass
+
+        if self.port and self.port.is_open:
+            self.port.close()
+        self.port = None
+        self._router.close()
+
+    # ========================================
+    # 송신 / 요청
+    # ========================================
+    def send(self, cmd: str) -> bool:
+        if not self.is_connected or self.port is None:
+            LogManager.instance().debug("[AsyncSerial] 전송 안 함 (포트 미연결)")
+            return False
+
+        try:
+            self.port.write(f"{cmd}\n".encode())
+            return True
+        except Exception as e:
+            LogManager.instance().warning(f"[AsyncSerial] 전송 실패: {e}")
+            self._lost()
+            return False
+
+    async def request(self, char: str, timeout: float = REPLY_TIMEOUT):
+        """
+        '$<char>e' 전송 후 응답 줄 리스트 반환 (전송 실패·무응답이면 None).
+        호출한 태스크가 취소되면 대기 중인 요청도 함께 정리된다.
+        """
+        pending = self._router.add(char, timeout)
+        if pending is None:
+            return None
+
+        if not self.send(f"${char}e"):
+            self._router.discard(pending)
+            return None
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(pending.future), timeout)
+        except asyncio.TimeoutError:
+            return pending.lines or None
+        finally:
+            self._router.discard(pending)
+
+    # ========================================
+    # 요청과 무관한 수신 줄 구독 (자동 송신 데이터 등)
+    # ========================================
+    def add_listener(self, callback):
+        """callback(line) 은 이벤트 루프에서 호출된다"""
+        self._router.add_listener(callback)
+
+    def remove_listener(self, callback):
+        self._router.remove_listener(callback)
+
+    def add_raw_listener(self, prefix: bytes, callback):
+        """prefix 로 시작하는 줄을 디코딩 없이 bytes 로 받는다 (SerialManager.add_raw_listener 참고)"""
+        self._router.add_raw_listener(prefix, callback)
+
+    def remove_raw_listener(self, prefix: bytes, callback):
+        self._router.remove_raw_listener(prefix, callback)
+
+    def add_frame_listener(self, callback):
+        """callback(frame) — '$xe' 바이너리 모드 프레임 (이벤트 루프에서 호출)"""
+        self._router.add_frame_listener(callback)
+
+    def remove_frame_listener(self, callback):
+        self._router.remove_frame_listener(callback)
+
+    @property
+    def frame_stats(self):
+        return dict(self._decoder.stats)
+
+    # ========================================
+    # 수신 처리
+    # ========================================
+    def _on_readable(self):
+        try:
+            chunk = self.port.read(self.port.in_waiting or 1)
+        except Exception as e:
+            LogManager.instance().warning(f"[AsyncSerial] 읽기 오류 → 연결 끊김: {e}")
+            self._lost()
+            return
+
+        if not chunk:
+            return
+
+        self._buffer += chunk
+        self._decoder.decode(self._buffer, self._router.dispatch_bytes, self._router.dispatch_frame)
+
+    async def _poll_loop(self):
+        while self.is_connected:
+            self._on_readable()
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    def _lost(self):
+        """읽기/쓰기 오류 → 포트를 닫고 대기 중인 요청을 무응답 처리"""
+        self._close()
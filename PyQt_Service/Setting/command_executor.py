@@ -0,0 +1,96 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from PyQt5 import QtCore
+
+
+# ========================================
+# Future 연결 도우미
+# ========================================
+def chain(future, fn):
+    """future 결과에 fn 을 적용한 새 Future 반환 (대기 스레드 없이 콜백으로 처리)"""
+    result = Future()
+
+    def _done(f):
+        try:
+            result.set_result(fn(f.result()))
+        except Exception as e:
+            result.set_exception(e)
+
+    future.add_done_callback(_done)
+    return result
+
+
+def completed(value):
+    """이미 완료된 Future 반환"""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class CommandExecutor(QtCore.QObject):
+    """
+    아두이노 명령을 GUI 스레드 밖에서 실행하는 실행기.
+
+    - 작업 스레드 1개가 submit() 순서대로 명령을 전송한다 (버튼 클릭 순서 보장).
+    - 작업 함수가 Future 를 돌려주면 응답을 기다리지 않고 다음 명령을 바로 전송한다.
+      (응답은 SerialManager 리더 스레드가 Future 를 완료시킴 → 명령이 파이프라인으로 겹쳐 실행)
+    - 완료 결과는 finished / failed 시그널로 GUI 스레드에 전달된다.
+    """
+
+    finished = QtCore.pyqtSignal(str, object)   # (작업 이름, 결과)
+    failed = QtCore.pyqtSignal(str, str)        # (작업 이름, 오류 메시지)
+
+    def __init__(self):
+        super().__init__()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="command")
+
+    # ─────────────────────────────────────
+    # 작업 제출
+    # ─────────────────────────────────────
+    def submit(self, name: str, fn, *args):
+        """fn(*args) 를 작업 스레드에서 실행하고 결과 Future 를 즉시 반환"""
+        result = Future()
+
+        def _run():
+            try:
+                value = fn(*args)
+            except Exception as e:
+                result.set_exception(e)
+                return
+
+            if isinstance(value, Future):
+                value.add_done_callback(lambda f: self._copy(f, result))
+            else:
+                result.set_result(value)
+
+        result.add_done_callback(lambda f: self._report(name, f))
+
+        try:
+            self._pool.submit(_run)
+        except RuntimeError as e:
+            # shutdown 이후 제출된 작업
+            result.set_exception(e)
+
+        return result
+
+    def shutdown(self):
+        """프로그램 종료 시 대기 중인 작업 취소"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ─────────────────────────────────────
+    # 내부 처리
+    # ─────────────────────────────────────
+    @staticmethod
+    def _copy(source, target):
+        try:
+            target.set_result(source.result())
+        except Exception as e:
+            target.set_exception(e)
+
+    def _report(self, name, future):
+        """작업/리더 스레드에서 호출 → 시그널은 GUI 스레드 슬롯으로 큐잉된다"""
+        try:
+            value = future.result()
+        except Exception as e:
+            self.failed.emit(name, str(e))
+            return
+        self.finished.emit(name, value)
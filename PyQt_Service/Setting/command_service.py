@@ -1,5 +1,5 @@
 from PyQt_Service.Log.log_manager import LogManager
-import time
+from .command_executor import chain, completed
 
 
 class CommandService:
@@ -34,44 +34,44 @@ class CommandService:
             "s": "전압 보정값 출력",
             "t": "모든 전압 출력",
             "u": "시스템 상태 출력",
-            "v": "태양광 데이터 리셋"
+            "v": "태양광 데이터 리셋",
+            "w": "전체 상태 스냅샷",
+            "x": "바이너리 프레임 모드 ON",
+            "y": "바이너리 프레임 모드 OFF"
         }
 
     # ─────────────────────────────────────
     # 내부 송신 함수 + 아두이노 응답 읽기(Log 출력)
     # ─────────────────────────────────────
     def _send(self, char: str) -> bool:
-        packet = f"${char}e"
+        """전송 후 응답 로그까지 끝난 뒤 반환 (블로킹)"""
+        return self.send_async(char).result()
+
+    def send_async(self, char: str):
+        """
+        명령 전송 후 바로 Future 반환 (블로킹 없음).
+        응답이 오거나(최대 2초) 시간이 지나면 응답 로그 출력 후 True 로 완료,
+        포트 미연결로 전송하지 못했으면 False.
+        """
         label = self.command_label.get(char, f"명령 {char}")
 
-        ok = self.serial.send(packet)
+        reply = self.serial.send_request(char, timeout=2.0)
 
         # 명령 전송 로그
-        if ok:
+        if reply is not None:
             LogManager.instance().log(f"{label} → 전송됨")
         else:
-            LogManager.instance().log(f"{label} → 실패 (포트 미연결)")
-            return False
+            LogManager.instance().warning(f"{label} → 실패 (포트 미연결)")
+            return completed(False)
 
-        # 0.15초 대기 (아두이노 반응 시간)
-        time.sleep(0.15)
+        return chain(reply, lambda lines: self._log_reply(label, lines))
 
-        # 아두이노 응답 읽기 (최대 2초)
-        deadline = time.time() + 2.0
-        response_lines = []
-        while time.time() < deadline:
-            line = self.serial.read_line()
-            if not line:
-                continue
-
-            response_lines.append(line)
-
-        # 로그 출력
+    def _log_reply(self, label, response_lines) -> bool:
         if response_lines:
             for line in response_lines:
                 LogManager.instance().log(f"[응답] {line}")
         else:
-            LogManager.instance().log(f"[응답 없음] ({label})")
+            LogManager.instance().warning(f"[응답 없음] ({label})")
 
         return True
 
@@ -132,6 +132,13 @@ class CommandService:
     def stop_vcmon_auto(self) -> bool:
         return self._send("n")
 
+    def binary_mode_on(self) -> bool:
+        """자동 송신 VC_MON 데이터를 CRC 바이너리 프레임으로 받기"""
+        return self._send("x")
+
+    def binary_mode_off(self) -> bool:
+        return self._send("y")
+
     # ─────────────────────────────────────
     # 개별 전압
     # ─────────────────────────────────────
@@ -161,3 +168,6 @@ class CommandService:
 
     def reset_solar_data(self) -> bool:
         return self._send("v")
+
+    def print_snapshot(self) -> bool:
+        return self._send("w")
@@ -0,0 +1,161 @@
+import threading
+
+from PyQt5 import QtCore
+
+from PyQt_Service.Log.log_manager import LogManager
+
+from .serial_manager import SerialManager
+from .command_service import CommandService
+from .device_state import DeviceState
+
+
+# ========================================
+# 보드 1대 (포트 + 명령 + 상태)
+# ========================================
+class Device:
+    """
+    KIT 보드 1대.
+
+    - serial  : 보드 전용 SerialManager (수신 스레드 1개)
+    - command : 보드 전용 CommandService
+    - state   : 보드별 시스템 상태 DeviceState (pilot, halogen, fan_*, latest_voltage, last_power ...)
+    """
+
+    def __init__(self, device_id, state=None):
+        self.device_id = device_id
+        self.serial = SerialManager()
+        self.command = CommandService(self.serial)
+        self.state = state if state is not None else DeviceRegistry.default_state()
+
+    @property
+    def port_name(self):
+        return self.serial.port_name
+
+    @property
+    def is_connected(self):
+        return self.serial.is_connected
+
+
+class DeviceRegistry(QtCore.QObject):
+    """
+    여러 보드를 장치 ID 로 관리하는 목록.
+
+    보드마다 SerialManager 가 따로 있으므로 포트를 동시에 열고 읽을 수 있다.
+    주기적인 데이터 요청은 보드별 스레드가 아니라 AcquisitionScheduler 하나가 맡는다.
+    """
+
+    PRIMARY = "KIT-1"
+
+    devices_changed = QtCore.pyqtSignal()
+    connection_changed = QtCore.pyqtSignal(str, str)   # (장치 ID, SerialManager 상태)
+    state_changed = QtCore.pyqtSignal(str, object)     # (장치 ID, 바뀐 키 frozenset) — GUI 스레드
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._devices = {}
+
+    @staticmethod
+    def default_state():
+        return DeviceState()
+
+    # ─────────────────────────────────────
+    # 등록 / 삭제 / 조회
+    # ─────────────────────────────────────
+    def add(self, device_id=None, state=None):
+        """보드 등록 (ID 를 주지 않으면 KIT-N 으로 자동 부여)"""
+        with self._lock:
+            if device_id is None:
+                device_id = self._next_id()
+            if device_id in self._devices:
+                return self._devices[device_id]
+
+            device = Device(device_id, state)
+            device.serial.add_state_listener(
+                lambda s, d=device_id: self.connection_changed.emit(d, s)
+            )
+            device.state.changed.connect(
+                lambda keys, _, d=device_id: self.state_changed.emit(d, keys)
+            )
+            self._devices[device_id] = device
+
+        self.devices_changed.emit()
+        return device
+
+    def remove(self, device_id):
+        with self._lock:
+            device = self._devices.pop(device_id, None)
+        if device is None:
+            return
+
+        device.serial.disconnect()
+        self.devices_changed.emit()
+
+    def get(self, device_id):
+        with self._lock:
+            return self._devices.get(device_id)
+
+    def ids(self):
+        with self._lock:
+            return list(self._devices)
+
+    def devices(self):
+        with self._lock:
+            return list(self._devices.values())
+
+    def find_by_port(self, port_name):
+        for device in self.devices():
+            if device.port_name == port_name and (device.is_connected or device.serial.is_reconnecting):
+                return device
+        return None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._devices)
+
+    def _next_id(self):
+        n = len(self._devices) + 1
+        while f"KIT-{n}" in self._devices:
+            n += 1
+        return f"KIT-{n}"
+
+    # ─────────────────────────────────────
+    # 연결
+    # ─────────────────────────────────────
+    def connect(self, device_id, port_name):
+        """보드를 포트에 연결 (같은 포트를 다른 보드가 쓰고 있으면 실패)"""
+        device = self.get(device_id)
+        if device is None:
+            return False
+
+        owner = self.find_by_port(port_name)
+        if owner is not None and owner is not device:
+            LogManager.instance().warning(f"[Registry] {port_name} 은 {owner.device_id} 가 사용 중")
+            return False
+
+        return device.serial.connect(port_name)
+
+    def disconnect_all(self):
+        for device in self.devices():
+            if device.is_connected or device.serial.is_reconnecting:
+                device.serial.disconnect()
+
+    # ─────────────────────────────────────
+    # 여러 보드 합산 상태 (대시보드 '전체' 보기)
+    # ─────────────────────────────────────
+    def aggregate_state(self):
+        devices = self.devices()
+        states = [d.state.snapshot() for d in devices]
+        voltages = [s["latest_voltage"] for s in states if s.get("latest_voltage")]
+
+        return {
+            "count": len(devices),
+            "connected": sum(1 for d in devices if d.is_connected),
+            "reconnecting": sum(1 for d in devices if d.serial.is_reconnecting),
+            "latest_voltage": sum(voltages) / len(voltages) if voltages else 0.0,
+            "last_power": sum(s.get("last_power") or 0.0 for s in states),
+            "pilot_green": sum(1 for s in states if s.get("pilot") == "GREEN"),
+            "halogen": sum(1 for s in states if s.get("halogen")),
+            "fan_commercial": sum(1 for s in states if s.get("fan_commercial")),
+            "fan_battery": sum(1 for s in states if s.get("fan_battery")),
+        }
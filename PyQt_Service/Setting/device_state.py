@@ -1,5 +1,161 @@
-class DeviceState:
-    pilot = "OFF"
-    halogen = False
-    fan_commercial = False
-    fan_battery = False
\ No newline at end of file
+# PyQt_Service/Setting/device_state.py
+"""
+보드 1대의 시스템 상태 저장소 (pilot, halogen, fan_*, latest_voltage, last_power ...).
+
+- 필드와 타입은 FIELDS 로 고정 — 모르는 키는 KeyError, 값은 타입에 맞게 변환해서 저장한다.
+- update() 로 여러 필드를 한 번에 바꾼다 (잠금 안에서 새 스냅샷을 만들어 통째로 교체).
+  바뀐 값이 있을 때만 version 이 1 오르고 변경 알림이 나간다.
+- 읽기는 snapshot() — 변경 불가 StateSnapshot (version 포함). 쓰기마다 미리 만들어 두므로
+  읽는 쪽은 참조 하나만 가져간다 → 스레드 사이에서 일부만 바뀐 상태를 읽는 일이 없다.
+  state["pilot"] / state.get("pilot") 도 현재 스냅샷에서 읽는다 (dict 와 같은 사용법).
+- 변경 알림
+  · changed(keys, snapshot) Qt 시그널 — GUI 스레드에서 전달 (다른 스레드에서 써도 큐로 넘어온다)
+  · 알림은 GUI 스레드에서 써도 항상 큐를 거치고, 스냅샷을 바꾼 잠금 안에서 큐에 넣는다
+    → 여러 스레드가 동시에 써도 version 순서대로 전달된다 (새 값 뒤에 옛 값이 오지 않음)
+  · subscribe(keys, callback) — callback(snapshot, changed_keys), 지정한 키가 바뀔 때만 GUI 스레드에서 호출
+"""
+
+import threading
+from collections.abc import Mapping
+
+from PyQt5 import QtCore
+
+from PyQt_Service.Log.log_manager import LogManager
+
+
+PILOT_STATES = ("RED", "GREEN", "OFF")
+
+
+class StateSnapshot(Mapping):
+    """한 시점의 상태 (읽기 전용 Mapping + version)"""
+
+    __slots__ = ("version", "_data")
+
+    def __init__(self, version, data):
+        self.version = version
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"StateSnapshot(v{self.version}, {self._data!r})"
+
+
+class DeviceState(QtCore.QObject):
+    # 필드 → 타입 (None 이면 변환 없이 그대로 — 파싱 결과 객체 등)
+    FIELDS = {
+        "pilot": str,
+        "halogen": bool,
+        "fan_commercial": bool,
+        "fan_battery": bool,
+        "battery_ok": bool,
+        "latest_voltage": float,
+        "last_power": float,
+        "max_current": float,
+        "cumulative_energy": float,
+        "cell_voltages": None,
+    }
+
+    DEFAULTS = {
+        "pilot": "RED",          # 기본 RED
+        "halogen": False,
+        "fan_commercial": False,
+        "fan_battery": False,
+    }
+
+    changed = QtCore.pyqtSignal(object, object)     # (바뀐 키 frozenset, StateSnapshot)
+    _queued = QtCore.pyqtSignal(object, object)     # 쓴 스레드 → GUI 스레드
+
+    def __init__(self, values=None):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._subscribers = []      # (키 frozenset, callback)
+
+        data = dict(self.DEFAULTS)
+        data.update(self._coerce(values or {}))
+        self._snapshot = StateSnapshot(0, data)
+
+        self._queued.connect(self._dispatch, QtCore.Qt.QueuedConnection)
+
+    # ─────────────────────────────────────
+    # 읽기
+    # ─────────────────────────────────────
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def get(self, key, default=None):
+        return self._snapshot.get(key, default)
+
+    def __getitem__(self, key):
+        return self._snapshot[key]
+
+    def __contains__(self, key):
+        return key in self._snapshot
+
+    # ─────────────────────────────────────
+    # 쓰기 (어느 스레드에서든)
+    # ─────────────────────────────────────
+    def update(self, values=None, **kwargs):
+        """여러 필드를 한 번에 반영 → 실제로 바뀐 키 frozenset (없으면 빈 집합)"""
+        values = self._coerce({**(values or {}), **kwargs})
+
+        with self._lock:
+            current = self._snapshot
+            keys = frozenset(k for k, v in values.items() if k not in current or current[k] != v)
+            if not keys:
+                return keys
+
+            data = dict(current._data)
+            data.update((k, values[k]) for k in keys)
+            snapshot = self._snapshot = StateSnapshot(current.version + 1, data)
+            # 잠금 안에서 큐에 넣어야 version 순서 = 전달 순서 (큐에 넣기만 하므로 콜백은 여기서 안 돈다)
+            self._queued.emit(keys, snapshot)
+
+        return keys
+
+    def __setitem__(self, key, value):
+        self.update({key: value})
+
+    def _coerce(self, values):
+        out = {}
+        for key, value in values.items():
+            if key not in self.FIELDS:
+                raise KeyError(f"unknown state field: {key}")
+            kind = self.FIELDS[key]
+            if kind is not None and value is not None:
+                value = kind(value)
+            if key == "pilot" and value not in PILOT_STATES:
+                raise ValueError(f"invalid pilot state: {value}")
+            out[key] = value
+        return out
+
+    # ─────────────────────────────────────
+    # 변경 알림 (GUI 스레드)
+    # ─────────────────────────────────────
+    def subscribe(self, keys, callback):
+        """keys 중 하나라도 바뀌면 callback(snapshot, changed_keys) (keys 가 None 이면 모든 변경)"""
+        keys = None if keys is None else frozenset([keys] if isinstance(keys, str) else keys)
+        self._subscribers.append((keys, callback))
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(k, cb) for k, cb in self._subscribers if cb != callback]
+
+    def _dispatch(self, keys, snapshot):
+        for wanted, callback in list(self._subscribers):
+            if wanted is None or wanted & keys:
+                try:
+                    callback(snapshot, keys)
+                except Exception as e:
+                    LogManager.instance().error(f"[DeviceState] 구독자 오류: {e}")
+        self.changed.emit(keys, snapshot)
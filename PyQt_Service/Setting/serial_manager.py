@@ -1,12 +1,276 @@
+import os
 import serial
 import serial.tools.list_ports
+import threading
 import time
+from concurrent.futures import Future
+
+from PyQt_Service.Log.log_manager import LogManager
+from PyQt_Service.Protocol.binary_frames import FrameDecoder
+
+
+# ========================================
+# 명령별 응답 판별 규칙
+# ========================================
+class ReplyMatcher:
+    """
+    아두이노가 명령 하나에 돌려주는 응답 줄을 골라내는 규칙.
+
+    - starts : 응답 첫 줄의 시작 문자열. '=' 로 시작하는 줄이면
+               '=' 만으로 된 구분선이 나올 때까지 여러 줄을 응답으로 묶는다.
+    - extra  : 최종 응답 전에 먼저 올 수 있는 줄 (예: 선풍기 인터락 알림)
+    """
+
+    def __init__(self, starts, extra=()):
+        self.starts = tuple(starts)
+        self.extra = tuple(extra)
+
+
+# KIT_Solar_3.ino 의 Serial.println 출력 기준
+REPLY_MATCHERS = {
+    "a": ReplyMatcher(("Pilot Lamp OFF",)),
+    "b": ReplyMatcher(("Pilot Lamp GREEN",)),
+    "c": ReplyMatcher(("Pilot Lamp RED",)),
+    "d": ReplyMatcher(("Commercial Fan ON",),
+                      extra=("Battery Fan turned OFF due to interlock",)),
+    "e": ReplyMatcher(("Commercial Fan OFF",)),
+    "f": ReplyMatcher(("Battery Fan ON",),
+                      extra=("Commercial Fan turned OFF due to interlock",)),
+    "g": ReplyMatcher(("Battery Fan OFF",)),
+    "h": ReplyMatcher(("Halogen Lamp ON",)),
+    "i": ReplyMatcher(("Halogen Lamp OFF",)),
+    "j": ReplyMatcher(("=== Battery Voltage Readings",)),
+    "k": ReplyMatcher(("=== VC_MON_LC Data", "VC_MON_LC: No valid data")),
+    "l": ReplyMatcher(("VC Monitor Data Reset",)),
+    "m": ReplyMatcher(("VC Monitor Auto Send Start",)),
+    "n": ReplyMatcher(("VC Monitor Auto Send Stop",)),
+    "o": ReplyMatcher(("A0 (1S)",)),
+    "p": ReplyMatcher(("A1 (2S)",)),
+    "q": ReplyMatcher(("A2 (3S)",)),
+    "r": ReplyMatcher(("A3 (Total)",)),
+    "s": ReplyMatcher(("=== Voltage Sensor Calibration",)),
+    "t": ReplyMatcher(("=== Real-time Voltage Monitor",)),
+    "u": ReplyMatcher(("=================== SYSTEM STATUS",)),
+    "v": ReplyMatcher(("Solar Power Data Reset",)),
+    "w": ReplyMatcher(("SNAP,",)),
+    "x": ReplyMatcher(("Binary Frame Mode ON",)),
+    "y": ReplyMatcher(("Binary Frame Mode OFF",)),
+}
+
+
+class _PendingReply:
+    """응답을 기다리는 요청 1건 (리더 스레드가 줄을 채워 넣는다)"""
+
+    def __init__(self, matcher, deadline):
+        self.matcher = matcher
+        self.deadline = deadline
+        self.lines = []
+        self.in_block = False
+        self.done = False
+        self.future = Future()
+
+    def feed(self, line) -> bool:
+        """이 요청의 응답이면 받아들이고 True 반환"""
+        if self.in_block:
+            self.lines.append(line)
+            if not line.strip("="):
+                self.done = True
+            return True
+
+        if self.matcher is None:
+            return False
+
+        if line.startswith(self.matcher.extra):
+            self.lines.append(line)
+            return True
+
+        if line.startswith(self.matcher.starts):
+            self.lines.append(line)
+            if line.startswith("="):
+                self.in_block = True
+            else:
+                self.done = True
+            return True
+
+        return False
+
+    def finish(self):
+        """수집된 응답으로 Future 완료 (응답이 없으면 None)"""
+        if not self.future.done():
+            self.future.set_result(self.lines or None)
+
+
+class ReplyRouter:
+    """
+    수신 줄을 응답 대기 중인 요청에 나눠 주는 라우터.
+    (동기 SerialManager / asyncio AsyncSerialManager 가 같이 사용)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = []          # 응답 대기 중인 요청 (송신 순서)
+        self._listeners = []        # 요청과 무관한 줄을 받을 콜백
+        self._frame_listeners = []  # 바이너리 프레임을 받을 콜백
+        self._raw_listeners = []    # (접두어 bytes, 콜백) — 디코딩 없이 bytes 줄을 받을 콜백
+        self.closed = True
+
+    def open(self):
+        with self._lock:
+            self.closed = False
+
+    def add(self, char, timeout):
+        """대기 요청 등록 (닫혀 있으면 None)"""
+        pending = _PendingReply(REPLY_MATCHERS.get(char), time.time() + timeout)
+        with self._lock:
+            if self.closed:
+                return None
+            self._pending.append(pending)
+        return pending
+
+    def discard(self, pending):
+        with self._lock:
+            if pending in self._pending:
+                self._pending.remove(pending)
+
+    def close(self):
+        """남은 대기 요청은 모두 무응답 처리"""
+        with self._lock:
+            self.closed = True
+            pending, self._pending = self._pending, []
+        for p in pending:
+            p.finish()
+
+    # ─────────────────────────────────────
+    # 요청과 무관한 수신 줄 구독
+    # ─────────────────────────────────────
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add_raw_listener(self, prefix, callback):
+        """prefix(bytes) 로 시작하는 줄은 str 로 바꾸지 않고 bytes 그대로 callback 에 넘긴다"""
+        if (prefix, callback) not in self._raw_listeners:
+            self._raw_listeners.append((prefix, callback))
+
+    def remove_raw_listener(self, prefix, callback):
+        if (prefix, callback) in self._raw_listeners:
+            self._raw_listeners.remove((prefix, callback))
+
+    def add_frame_listener(self, callback):
+        if callback not in self._frame_listeners:
+            self._frame_listeners.append(callback)
+
+    def remove_frame_listener(self, callback):
+        if callback in self._frame_listeners:
+            self._frame_listeners.remove(callback)
+
+    # ─────────────────────────────────────
+    # 줄 분배 / 시간 초과 처리
+    # ─────────────────────────────────────
+    def dispatch(self, line):
+        """대기 중인 요청에 줄을 넘기고, 아무도 안 받으면 리스너에 전달"""
+        if self._feed(line):
+            return
+
+        for callback in list(self._listeners):
+            try:
+                callback(line)
+            except Exception as e:
+                LogManager.instance().error(f"[Serial] 수신 리스너 오류: {e}")
+
+    def _feed(self, line):
+        """대기 중인 요청이 줄을 받았으면 True"""
+        finished = None
+        consumed = False
+
+        with self._lock:
+            for p in self._pending:
+                if p.feed(line):
+                    consumed = True
+                    if p.done:
+                        self._pending.remove(p)
+                        finished = p
+                    break
+
+        if finished is not None:
+            finished.finish()
+
+        return consumed
+
+    def dispatch_bytes(self, raw):
+        """
+        FrameDecoder 가 꺼낸 텍스트 줄(bytes) 처리.
+        raw 리스너 접두어와 맞는 줄(자동 송신 데이터)은 대기 요청이 없으면 디코딩 없이 바로 넘긴다.
+        """
+        raw_callbacks = [cb for prefix, cb in self._raw_listeners if raw.startswith(prefix)]
+        if raw_callbacks and not self._pending:
+            self._call_raw(raw_callbacks, raw)
+            return
+
+        line = raw.decode(errors="ignore").strip()
+        if not line:
+            return
+
+        if not raw_callbacks:
+            self.dispatch(line)
+        elif not self._feed(line):
+            self._call_raw(raw_callbacks, raw)
+
+    def _call_raw(self, callbacks, raw):
+        for callback in callbacks:
+            try:
+                callback(raw)
+            except Exception as e:
+                LogManager.instance().error(f"[Serial] 수신 리스너 오류: {e}")
+
+    def dispatch_frame(self, frame):
+        for callback in list(self._frame_listeners):
+            try:
+                callback(frame)
+            except Exception as e:
+                LogManager.instance().error(f"[Serial] 프레임 리스너 오류: {e}")
+
+    def expire(self):
+        now = time.time()
+        with self._lock:
+            expired = [p for p in self._pending if p.deadline <= now]
+            for p in expired:
+                self._pending.remove(p)
+        for p in expired:
+            p.finish()
 
 
 class SerialManager:
+    READ_TIMEOUT = 0.05     # 리더 스레드 1회 읽기 대기 시간(초)
+    REPLY_TIMEOUT = 2.0     # 기본 응답 대기 시간(초)
+
+    # 연결 감시 (케이블 분리·재연결)
+    PRESENCE_INTERVAL = 0.05    # 포트 경로(/dev/...) 존재 확인 주기(초)
+    ENUM_INTERVAL = 0.5         # 포트 목록(COMx 등) 확인 주기(초)
+    RECONNECT_MIN = 0.1         # 재연결 대기 시작값(초) — 실패할 때마다 2배
+    RECONNECT_MAX = 5.0         # 재연결 대기 최대값(초)
+
+    # 연결 상태 알림 값
+    CONNECTED = "connected"         # 사용자가 연결
+    LOST = "lost"                   # 케이블 분리·읽기 오류 → 자동 재연결 대기
+    RECONNECTED = "reconnected"     # 자동 재연결 성공
+    DISCONNECTED = "disconnected"   # 사용자가 해제
+
     def __init__(self):
         self.port = None            # pyserial 객체
         self.is_connected = False   # 연결 상태 Boolean
+        self.port_name = None       # 마지막으로 연결한 포트 (재연결 대상)
+
+        self._write_lock = threading.Lock()
+        self._router = ReplyRouter()
+        self._decoder = FrameDecoder()
+        self._state_listeners = []
+        self._running = False
+        self._reader = None
 
     # ========================================
     # 사용 가능한 포트 목록 가져오기
@@ -19,91 +283,258 @@ class SerialManager:
     # 포트 연결
     # ========================================
     def connect(self, port_name):
-        """포트 연결 시도"""
-        try:
-            self.port = serial.Serial(
-                port_name,
-                115200,
-                timeout=1,
-                dsrdtr=False,
-                rtscts=False
-            )
-            time.sleep(0.2)
-
-            self.is_connected = True
-            return True
+        """포트 연결 시도 + 수신·연결 감시 스레드 시작"""
+        if self._reader is not None or self.port is not None:
+            self.disconnect()
 
-        except Exception as e:
-            print("[Serial] Connection Error:", e)
-            self.port = None
+        port = self._open(port_name)
+        if port is None:
             self.is_connected = False
             return False
 
+        self.port = port
+        self.port_name = port_name
+        self._running = True
+        self.is_connected = True
+        self._router.open()
+        self._reader = threading.Thread(
+            target=self._supervise, args=(port_name,), daemon=True
+        )
+        self._reader.start()
+
+        self._notify(self.CONNECTED)
+        return True
+
     # ========================================
     # 포트 해제
     # ========================================
     def disconnect(self):
-        if self.port and self.port.is_open:
-            self.port.close()
-        self.port = None
-        self.is_connected = False
+        was_running = self._running
+
+        self._running = False
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1.0)
+        self._reader = None
+
+        self._close_port()
+        self._router.close()
+
+        if was_running:
+            self._notify(self.DISCONNECTED)
+
+    @property
+    def is_reconnecting(self):
+        """케이블이 빠져 자동 재연결을 기다리는 중인지"""
+        return self._running and not self.is_connected
 
     # ========================================
     # 텍스트 명령 전송 (기존 방식)
     # ========================================
     def send(self, cmd: str):
         """'$ue' → '$ue\\n' 자동 변환 후 전송"""
-        if not self.is_connected or self.port is None:
-            print("[Serial] Not connected")
+        port = self.port
+        if not self.is_connected or port is None:
+            LogManager.instance().debug("[Serial] 전송 안 함 (포트 미연결)")
             return False
 
         try:
             packet = f"{cmd}\n".encode()
-            self.port.write(packet)
-            self.port.flush()
+            with self._write_lock:
+                port.write(packet)
+                port.flush()
             return True
 
         except Exception as e:
-            print("[Serial] Send Error:", e)
+            # 연결 끊김 처리는 수신 스레드가 읽기 오류로 감지해 담당
+            LogManager.instance().warning(f"[Serial] 전송 실패: {e}")
             return False
 
     # ========================================
-    # 한 줄 읽기
+    # 명령 전송 + 응답 대기
     # ========================================
-    def read_line(self):
-        """시리얼의 한 줄 읽어 UTF-8 문자열로 반환 (읽을 게 없으면 '')"""
-        try:
-            if self.port and self.port.is_open:
-                line = self.port.readline().decode(errors="ignore").strip()
-                return line
-        except:
-            return ""
-        return ""
+    def send_request(self, char: str, timeout: float = REPLY_TIMEOUT):
+        """
+        '$<char>e' 전송 후 응답을 받을 Future 반환 (전송 실패·연결 끊김 시 None).
+        Future 결과는 응답 줄 리스트, 시간 안에 응답이 없으면 None.
+        """
+        pending = self._router.add(char, timeout)
+        if pending is None:
+            return None
+
+        if not self.send(f"${char}e"):
+            self._router.discard(pending)
+            return None
+
+        return pending.future
+
+    def request(self, char: str, timeout: float = REPLY_TIMEOUT):
+        """응답 줄 리스트 반환 (전송 실패·무응답이면 None)"""
+        future = self.send_request(char, timeout)
+        if future is None:
+            return None
+        return future.result()
+
+    # ========================================
+    # 요청과 무관한 수신 줄 구독 (자동 송신 데이터 등)
+    # ========================================
+    def add_listener(self, callback):
+        """callback(line) 은 수신 스레드에서 호출된다"""
+        self._router.add_listener(callback)
+
+    def remove_listener(self, callback):
+        self._router.remove_listener(callback)
+
+    def add_raw_listener(self, prefix: bytes, callback):
+        """
+        prefix 로 시작하는 줄을 bytes 로 받는다 (수신 스레드에서 호출, 줄 끝 '\r\n' 제외).
+        str 디코딩을 건너뛰므로 초당 수백 줄씩 오는 자동 송신 데이터에 쓴다.
+        이 줄들은 add_listener 콜백에는 전달되지 않는다.
+        """
+        self._router.add_raw_listener(prefix, callback)
+
+    def remove_raw_listener(self, prefix: bytes, callback):
+        self._router.remove_raw_listener(prefix, callback)
 
     # ========================================
-    # ⭐ DashboardController 호환을 위한 추가 메서드
+    # 바이너리 프레임 구독 ('$xe' 바이너리 모드)
     # ========================================
+    def add_frame_listener(self, callback):
+        """callback(frame) 은 수신 스레드에서 호출된다 (binary_frames.VcMonFrame 등)"""
+        self._router.add_frame_listener(callback)
+
+    def remove_frame_listener(self, callback):
+        self._router.remove_frame_listener(callback)
+
+    @property
+    def frame_stats(self):
+        """프레임 수신 통계 (frames / crc_errors / bad_type / lost / skipped_bytes)"""
+        return dict(self._decoder.stats)
+
+    # ========================================
+    # 연결 상태 구독
+    # ========================================
+    def add_state_listener(self, callback):
+        """callback(state) — CONNECTED / LOST / RECONNECTED / DISCONNECTED"""
+        if callback not in self._state_listeners:
+            self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback):
+        if callback in self._state_listeners:
+            self._state_listeners.remove(callback)
 
-    def reset_input_buffer(self):
-        """Dashboard에서 사용하는 버퍼 삭제 함수"""
-        if self.port and self.port.is_open:
+    def _notify(self, state):
+        for callback in list(self._state_listeners):
             try:
-                self.port.reset_input_buffer()
-            except:
-                pass
+                callback(state)
+            except Exception as e:
+                LogManager.instance().error(f"[Serial] 상태 리스너 오류: {e}")
+
+    # ========================================
+    # 포트 열기 / 닫기 / 존재 확인
+    # ========================================
+    def _open(self, port_name):
+        try:
+            return serial.Serial(
+                port_name,
+                115200,
+                timeout=self.READ_TIMEOUT,
+                dsrdtr=False,
+                rtscts=False
+            )
+        except Exception as e:
+            LogManager.instance().warning(f"[Serial] {port_name} 연결 실패: {e}")
+            return None
 
-    def write(self, data: bytes):
-        """Dashboard에서 raw bytes 직접 전송하는 write 함수"""
-        if self.port and self.port.is_open:
+    def _close_port(self):
+        port, self.port = self.port, None
+        self.is_connected = False
+        if port is not None:
             try:
-                self.port.write(data)
-            except:
+                port.close()
+            except Exception:
                 pass
 
-    def flush(self):
-        """Dashboard에서 사용하는 flush 함수"""
-        if self.port and self.port.is_open:
+    def _port_present(self, port_name):
+        """장치 파일(/dev/...)은 경로로, COMx 는 포트 목록으로 확인"""
+        if os.path.isabs(port_name):
+            return os.path.exists(port_name)
+        return any(p.device == port_name for p in serial.tools.list_ports.comports())
+
+    # ========================================
+    # 수신·연결 감시 스레드 (포트를 읽는 유일한 곳, 포트당 1개)
+    # ========================================
+    def _supervise(self, port_name):
+        try:
+            while self._running:
+                if self.port is not None:
+                    self._read_loop(self.port, port_name)
+                if self._running:
+                    self._reconnect(port_name)
+        finally:
+            self._router.close()
+
+    def _read_loop(self, port, port_name):
+        """정상 수신 — 포트가 끊기거나 disconnect() 되면 반환"""
+        buffer = bytearray()
+        interval = self.PRESENCE_INTERVAL if os.path.isabs(port_name) else self.ENUM_INTERVAL
+        next_check = time.time() + interval
+
+        while self._running:
             try:
-                self.port.flush()
-            except:
-                pass
+                chunk = port.read(port.in_waiting or 1)
+            except Exception as e:
+                LogManager.instance().warning(f"[Serial] {port_name} 읽기 오류 → 연결 끊김: {e}")
+                self._lost()
+                return
+
+            if chunk:
+                buffer += chunk
+                self._decoder.decode(
+                    buffer, self._router.dispatch_bytes, self._router.dispatch_frame
+                )
+
+            self._router.expire()
+
+            # 읽기 오류 없이 사라지는 포트 대비 (일부 드라이버)
+            now = time.time()
+            if now >= next_check:
+                next_check = now + interval
+                if not self._port_present(port_name):
+                    LogManager.instance().warning(f"[Serial] {port_name} 포트 사라짐 → 연결 끊김")
+                    self._lost()
+                    return
+
+    def _lost(self):
+        """연결 끊김 → 대기 중인 요청은 즉시 무응답 처리, 새 요청은 바로 실패"""
+        self._close_port()
+        self._router.close()
+        self._notify(self.LOST)
+
+    def _reconnect(self, port_name):
+        """
+        포트가 다시 나타나면 즉시, 그 밖에는 지수 백오프 간격으로 재연결 시도.
+        성공하거나 disconnect() 될 때까지 반환하지 않는다.
+        """
+        interval = self.PRESENCE_INTERVAL if os.path.isabs(port_name) else self.ENUM_INTERVAL
+        delay = self.RECONNECT_MIN
+        next_try = time.time() + delay
+        was_present = self._port_present(port_name)
+
+        while self._running:
+            present = self._port_present(port_name)
+            now = time.time()
+
+            if present and (not was_present or now >= next_try):
+                port = self._open(port_name)
+                if port is not None:
+                    self.port = port
+                    self.is_connected = True
+                    self._router.open()
+                    self._notify(self.RECONNECTED)
+                    return
+
+                delay = min(delay * 2, self.RECONNECT_MAX)
+                next_try = now + delay
+
+            was_present = present
+            time.sleep(interval)
@@ -1,10 +1,21 @@
 from PyQt5.QtWidgets import QMessageBox
 from .serial_manager import SerialManager
-from .command_service import CommandService
+from .command_executor import CommandExecutor
+from .device_registry import DeviceRegistry
 from PyQt_Service.Log.log_manager import LogManager
 
 
 class SettingController:
+    # 명령 성공 시 반영할 시스템 상태 (작업 이름 → (키, 값))
+    STATE_ON_SUCCESS = {
+        "halogen_on": ("halogen", True),
+        "halogen_off": ("halogen", False),
+        "fan_commercial_on": ("fan_commercial", True),
+        "fan_commercial_off": ("fan_commercial", False),
+        "fan_battery_on": ("fan_battery", True),
+        "fan_battery_off": ("fan_battery", False),
+    }
+
     def __init__(self, ui, system_state):
         self.ui = ui
         self.system_state = system_state
@@ -12,22 +23,32 @@ class SettingController:
         # StackApp 에서 대시보드 컨트롤러 주입 예정
         self.dashboard = None
 
-        # Serial
-        self.serial = SerialManager()
-        self.command = CommandService(self.serial)
+        # 보드 목록 — 첫 보드(KIT-1)의 상태는 system_state 를 그대로 사용
+        self.devices = DeviceRegistry()
+        primary = self.devices.add(DeviceRegistry.PRIMARY, state=system_state)
+        self.serial = primary.serial
+        self.command = primary.command
+
+        # 버튼 명령을 보낼 보드
+        self.active_id = DeviceRegistry.PRIMARY
+
+        # 케이블 분리·자동 재연결 알림 (수신 스레드 → GUI 스레드)
+        self.devices.connection_changed.connect(self._on_connection_changed)
+        self.devices.devices_changed.connect(self.refresh_boards)
+
+        # 명령은 GUI 스레드 밖에서 실행 → 완료는 시그널로 수신
+        self.executor = CommandExecutor()
+        self.executor.finished.connect(self._on_command_finished)
+        self.executor.failed.connect(self._on_command_failed)
 
         self._connect_ui()
         self.refresh_ports()
+        self.refresh_boards()
 
-    # ─────────────────────────────────────
-    # 대시보드에 UI 갱신 요청
-    # ─────────────────────────────────────
-    def _notify_dashboard(self):
-        if self.dashboard is not None:
-            try:
-                self.dashboard.update_ui()
-            except Exception as e:
-                LogManager.instance().log(f"대시보드 갱신 오류: {e}")
+    @property
+    def device(self):
+        """현재 선택된 보드"""
+        return self.devices.get(self.active_id)
 
     # ─────────────────────────────────────
     # UI 연결
@@ -38,6 +59,10 @@ class SettingController:
         self.ui.btn_refresh_port.clicked.connect(self.refresh_ports)
         self.ui.connect_button.clicked.connect(self.connect_serial)
 
+        # 보드 선택 / 추가
+        self.ui.board_combo.currentTextChanged.connect(self.select_board)
+        self.ui.btn_add_board.clicked.connect(self.add_board)
+
         # 파일럿 램프
         self.ui.btn_pilot_green.clicked.connect(self.pilot_green)
         self.ui.btn_pilot_red.clicked.connect(self.pilot_red)
@@ -56,14 +81,114 @@ class SettingController:
         self.ui.chk_fan_battery_off.clicked.connect(self.fan_battery_off)
 
         # ⭐ 로그가 필요한 버튼 3개 (j, k, u)
-        self.ui.btn_battery_voltage.clicked.connect(self.command.print_battery_voltage)
-        self.ui.btn_vcmon_data.clicked.connect(self.command.print_vcmon_data)
-        self.ui.btn_system_status.clicked.connect(self.command.print_system_status)
+        self.ui.btn_battery_voltage.clicked.connect(lambda: self._submit("print_battery_voltage", "j"))
+        self.ui.btn_vcmon_data.clicked.connect(lambda: self._submit("print_vcmon_data", "k"))
+        self.ui.btn_system_status.clicked.connect(lambda: self._submit("print_system_status", "u"))
 
         # VC_MON_LC 제어
-        self.ui.btn_data_reset.clicked.connect(self.command.reset_vcmon_data)
-        self.ui.btn_auto_send_start.clicked.connect(self.command.start_vcmon_auto)
-        self.ui.btn_auto_send_stop.clicked.connect(self.command.stop_vcmon_auto)
+        self.ui.btn_data_reset.clicked.connect(lambda: self._submit("reset_vcmon_data", "l"))
+        self.ui.btn_auto_send_start.clicked.connect(lambda: self._submit("start_vcmon_auto", "m"))
+        self.ui.btn_auto_send_stop.clicked.connect(lambda: self._submit("stop_vcmon_auto", "n"))
+
+    # ─────────────────────────────────────
+    # 명령 실행 (작업 스레드) + 완료 처리 (GUI 스레드)
+    # ─────────────────────────────────────
+    def _submit(self, name, char):
+        """버튼 클릭은 즉시 반환 — 전송·응답 대기는 CommandExecutor 가 처리"""
+        device = self.device
+        return self.executor.submit(f"{device.device_id}/{name}", device.command.send_async, char)
+
+    def _on_command_finished(self, name, ok):
+        device_id, _, name = name.rpartition("/")
+        update = self.STATE_ON_SUCCESS.get(name)
+        device = self.devices.get(device_id)
+        if update is None or not ok or device is None:
+            return
+
+        key, value = update
+        device.state[key] = value
+
+    def _on_command_failed(self, name, error):
+        LogManager.instance().error(f"명령 실행 오류 ({name}): {error}")
+
+    # ─────────────────────────────────────
+    # 연결 상태 변화 (GUI 스레드)
+    # ─────────────────────────────────────
+    def _on_connection_changed(self, device_id, state):
+        device = self.devices.get(device_id)
+        if device is None:
+            return
+
+        if state == SerialManager.LOST:
+            LogManager.instance().warning(f"[{device_id}] 포트 연결 끊김 ({device.port_name}) – 재연결 대기")
+        elif state == SerialManager.RECONNECTED:
+            LogManager.instance().log(f"[{device_id}] 포트 재연결 성공 ({device.port_name})")
+
+        if device_id == self.active_id:
+            self._update_connect_status()
+
+        if self.dashboard is not None:
+            try:
+                self.dashboard.on_connection_changed(device_id, state)
+            except Exception as e:
+                LogManager.instance().error(f"대시보드 갱신 오류: {e}")
+
+    def _update_connect_status(self):
+        serial = self.device.serial
+        if serial.is_connected:
+            text, style = "연결됨", "color:#0B930F;"
+        elif serial.is_reconnecting:
+            text, style = "재연결 중", "color:#930B0D;"
+        else:
+            text, style = "연결 X", "color:#930B0D;"
+
+        self.ui.label_connect_status.setText(text)
+        self.ui.label_connect_status.setStyleSheet(style)
+
+    # =====================
+    # 보드 선택 / 추가
+    # =====================
+    def refresh_boards(self):
+        combo = self.ui.board_combo
+        combo.blockSignals(True)
+        combo.clear()
+        for device_id in self.devices.ids():
+            combo.addItem(device_id)
+        combo.setCurrentText(self.active_id)
+        combo.blockSignals(False)
+
+    def select_board(self, device_id):
+        if self.devices.get(device_id) is None:
+            return
+
+        self.active_id = device_id
+        self._update_connect_status()
+
+    def add_board(self):
+        """선택한 포트에 새 보드(KIT-N)를 등록하고 연결"""
+        port = self._selected_port()
+        if port is None:
+            return
+
+        device = self.devices.add()
+        if not self.devices.connect(device.device_id, port):
+            self.devices.remove(device.device_id)
+            LogManager.instance().warning(f"보드 추가 실패 ({port})")
+            return
+
+        LogManager.instance().log(f"[{device.device_id}] 보드 추가 ({port})")
+        self.active_id = device.device_id
+        self.refresh_boards()
+        self._update_connect_status()
+
+    def _selected_port(self):
+        selected = self.ui.port_combo.currentText()
+
+        if selected == "포트 없음":
+            LogManager.instance().warning("포트 연결 실패 – 선택된 포트 없음")
+            return None
+
+        return selected.split(" ")[0]
 
     # =====================
     # USB 포트 새로고침
@@ -74,7 +199,7 @@ class SettingController:
 
         if not ports:
             self.ui.port_combo.addItem("포트 없음")
-            LogManager.instance().log("포트 없음 – 검색 결과 0개")
+            LogManager.instance().warning("포트 없음 – 검색 결과 0개")
             return
 
         for p in ports:
@@ -88,81 +213,59 @@ class SettingController:
     # USB 연결
     # =====================
     def connect_serial(self):
-        selected = self.ui.port_combo.currentText()
-
-        if selected == "포트 없음":
-            LogManager.instance().log("포트 연결 실패 – 선택된 포트 없음")
-            self.ui.label_connect_status.setText("연결 X")
-            self.ui.label_connect_status.setStyleSheet("color:#930B0D;")
+        """선택한 보드를 선택한 포트에 연결"""
+        port = self._selected_port()
+        if port is None:
+            self._update_connect_status()
             return
 
-        port = selected.split(" ")[0]
-        ok = self.serial.connect(port)
+        ok = self.devices.connect(self.active_id, port)
 
         if ok:
-            self.ui.label_connect_status.setText("연결됨")
-            self.ui.label_connect_status.setStyleSheet("color:#0B930F;")
-            LogManager.instance().log(f"포트 연결 성공 ({port})")
+            LogManager.instance().log(f"[{self.active_id}] 포트 연결 성공 ({port})")
         else:
-            self.ui.label_connect_status.setText("연결 X")
-            self.ui.label_connect_status.setStyleSheet("color:#930B0D;")
-            LogManager.instance().log(f"포트 연결 실패 ({port})")
+            LogManager.instance().warning(f"[{self.active_id}] 포트 연결 실패 ({port})")
 
-        self._notify_dashboard()
+        self._update_connect_status()
 
     # =====================
     # 파일럿 램프 (소프트웨어 상태만 변경)
     # =====================
     def pilot_green(self):
-        self.command.pilot_green()
-        self.system_state["pilot"] = "RED"
-        self._notify_dashboard()
+        self._submit("pilot_green", "b")
+        self.device.state["pilot"] = "RED"
 
     def pilot_red(self):
-        self.command.pilot_red()
-        self.system_state["pilot"] = "GREEN"
-        self._notify_dashboard()
+        self._submit("pilot_red", "c")
+        self.device.state["pilot"] = "GREEN"
 
     def pilot_off(self):
-        self.command.pilot_off()
-        self.system_state["pilot"] = "OFF"
-        self._notify_dashboard()
+        self._submit("pilot_off", "a")
+        self.device.state["pilot"] = "OFF"
 
     # =====================
-    # 할로겐
+    # 할로겐 (응답 후 _on_command_finished 에서 상태 반영)
     # =====================
     def halogen_on(self):
-        if self.command.halogen_on():
-            self.system_state["halogen"] = True
-            self._notify_dashboard()
+        self._submit("halogen_on", "h")
 
     def halogen_off(self):
-        if self.command.halogen_off():
-            self.system_state["halogen"] = False
-            self._notify_dashboard()
+        self._submit("halogen_off", "i")
 
     # =====================
     # 상용 선풍기
     # =====================
     def fan_commercial_on(self):
-        if self.command.fan_commercial_on():
-            self.system_state["fan_commercial"] = True
-            self._notify_dashboard()
+        self._submit("fan_commercial_on", "d")
 
     def fan_commercial_off(self):
-        if self.command.fan_commercial_off():
-            self.system_state["fan_commercial"] = False
-            self._notify_dashboard()
+        self._submit("fan_commercial_off", "e")
 
     # =====================
     # 배터리 선풍기
     # =====================
     def fan_battery_on(self):
-        if self.command.fan_battery_on():
-            self.system_state["fan_battery"] = True
-            self._notify_dashboard()
+        self._submit("fan_battery_on", "f")
 
     def fan_battery_off(self):
-        if self.command.fan_battery_off():
-            self.system_state["fan_battery"] = False
-            self._notify_dashboard()
+        self._submit("fan_battery_off", "g")
@@ -0,0 +1,595 @@
+# Simulator/virtual_kit.py
+"""
+KIT_Solar_3.ino 가상 장치 — Linux pty 위에서 실제 아두이노처럼 동작한다.
+
+    python Simulator/virtual_kit.py --latency 0.02 --auto-interval 0.1
+    → 출력된 /dev/pts/N 경로를 SerialManager.connect() 에 그대로 넣으면 된다.
+
+- '$<char>e' 명령 a ~ y 를 펌웨어와 같은 문구·소수점 자리수로 응답한다.
+  (명령 분리도 펌웨어처럼 readStringUntil('e') 방식을 따른다 → '$ee' 는 펌웨어와 같이 무시됨)
+- 0.5초 주기 자동 제어(배터리 10V 기준 선풍기 전원 전환)와 선풍기 인터락을 재현한다.
+- VC_MON_LC 는 1초마다 'VC_MON Data' 줄을 보내고, '$m' 이후에는 auto_interval 주기로 보낸다.
+  '$x' 바이너리 프레임 모드에서는 같은 데이터를 20 바이트 CRC 프레임으로 보낸다.
+- 응답 지연(latency), 전송 속도(baud), 초당 줄 수 제한(line_rate),
+  바이트 유실(drop_rate), 바이트 변조(noise_rate)를 설정할 수 있다.
+- unplug() / replug() 로 USB 케이블 분리·재연결을 흉내 낸다.
+  (link 경로를 주면 재연결 후에도 같은 경로로 접속할 수 있다)
+"""
+
+import argparse
+import binascii
+import os
+import random
+import select
+import struct
+import threading
+import time
+import tty
+from collections import deque
+
+
+# 펌웨어 상수
+VOLTAGE_SENSOR_RATIO = 5.0
+ARDUINO_REF_VOLTAGE = 5.0
+ADC_RESOLUTION = 1024
+BATTERY_THRESHOLD_VOLTAGE = 10.0
+AUTO_CONTROL_INTERVAL = 0.5
+RS232_INTERVAL = 1.0
+
+PILOT_NAMES = {0: "OFF", 1: "GREEN", 2: "RED"}
+
+
+def to_adc(voltage):
+    adc = int(voltage / (ARDUINO_REF_VOLTAGE * VOLTAGE_SENSOR_RATIO) * ADC_RESOLUTION)
+    return max(0, min(ADC_RESOLUTION - 1, adc))
+
+
+def to_voltage(adc):
+    return adc * (ARDUINO_REF_VOLTAGE / ADC_RESOLUTION) * VOLTAGE_SENSOR_RATIO
+
+
+class VirtualKit:
+    def __init__(
+        self,
+        latency=0.0,            # 명령 수신 → 응답 시작까지 지연(초)
+        baud=115200,            # 0 이면 전송 속도 제한 없음
+        line_rate=None,         # 초당 최대 출력 줄 수 (None: 제한 없음)
+        drop_rate=0.0,          # 바이트별 유실 확률
+        noise_rate=0.0,         # 바이트별 변조 확률
+        auto_interval=0.2,      # '$m' 자동 송신 주기(초)
+        vcmon=True,             # VC_MON_LC 연결 여부 (False 면 'No valid data')
+        auto_control=True,      # 0.5초 자동 선풍기 제어
+        cell_voltages=(4.1, 8.2, 12.3),
+        seed=None,
+        link=None,              # pty 경로에 만들 심볼릭 링크 (예: /tmp/ttyKIT)
+    ):
+        self.latency = latency
+        self.baud = baud
+        self.line_rate = line_rate
+        self.drop_rate = drop_rate
+        self.noise_rate = noise_rate
+        self.auto_interval = auto_interval
+        self.vcmon_attached = vcmon
+        self.auto_control = auto_control
+        self.random = random.Random(seed)
+        self.link = link
+
+        # 출력 상태 (펌웨어 전역 변수와 같은 의미)
+        self.pilot = 0
+        self.fan_commercial = False
+        self.fan_battery = False
+        self.halogen = False
+
+        # 배터리 전압 (1S, 2S, 3S) — Total 은 3S 와 같은 값으로 둔다
+        self.cells = list(cell_voltages)
+        self.battery_ok = False
+
+        # VC_MON_LC
+        self.vc_voltage = 0.0
+        self.vc_current = 0.0
+        self.vc_power = 0.0
+        self.vc_capacity = 0.0
+        self.vc_valid = False
+        self.auto_send = False
+        self.binary = False         # 바이너리 프레임 모드 ($x / $y)
+        self._frame_seq = 0
+        self.max_current = 0.0
+        self.cumulative_energy = 0.0
+        self._prev_vc_time = None
+
+        # 통계
+        self.stats = {"commands": 0, "lines": 0, "bytes": 0, "dropped": 0, "corrupted": 0}
+
+        self._master = None
+        self._slave = None
+        self.port = None
+        self._in = ""
+        self._out = deque()         # (출력 가능 시각, bytes)
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    # ========================================
+    # 시작 / 정지
+    # ========================================
+    def start(self):
+        """pty 를 열고 장치 스레드 시작 → 클라이언트가 열 포트 경로 반환"""
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+
+        if self.link:
+            if os.path.islink(self.link):
+                os.remove(self.link)
+            os.symlink(self.port, self.link)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        self._emit("Arduino System with VC_MON_LC Initialized")
+        self._emit("RS232 Communication Ready on D0/D1")
+        return self.link or self.port
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+
+        if self.link and os.path.islink(self.link):
+            os.remove(self.link)
+
+    # ========================================
+    # USB 케이블 분리 / 재연결
+    # ========================================
+    def unplug(self):
+        """pty 를 닫고 링크를 지운다 → 클라이언트는 읽기 오류를 받는다"""
+        self.stop()
+        self._in = ""
+        with self._lock:
+            self._out.clear()
+
+    def replug(self):
+        """
+        새 pty 로 다시 연결 (실제 보드처럼 재부팅되어 자동 송신은 꺼진다)
+        → 링크(또는 새 pty) 경로 반환
+        """
+        self.auto_send = False
+        self.binary = False
+        self._prev_vc_time = None
+        return self.start()
+
+    # ========================================
+    # 장치 루프 (펌웨어 loop() 에 해당)
+    # ========================================
+    def _run(self):
+        now = time.monotonic()
+        next_control = now + AUTO_CONTROL_INTERVAL
+        next_poll = now + RS232_INTERVAL
+        next_auto = now + self.auto_interval
+        next_write = now
+
+        while self._running:
+            now = time.monotonic()
+
+            # 다음 일정까지 대기하면서 입력 수신
+            wake = min(next_control, next_poll, next_auto if self.auto_send else next_poll)
+            if self._out:
+                wake = min(wake, max(self._out[0][0], next_write))
+            try:
+                readable, _, _ = select.select([self._master], [], [], max(0.0, min(wake - now, 0.05)))
+                if readable:
+                    self._receive(os.read(self._master, 4096))
+            except OSError:
+                break
+
+            now = time.monotonic()
+
+            if self.auto_control and now >= next_control:
+                self._automatic_control()
+                next_control = now + AUTO_CONTROL_INTERVAL
+
+            # 펌웨어가 1초마다 'R' 요청 → VC_MON_LC 응답
+            if now >= next_poll:
+                self._vcmon_update(now)
+                next_poll = now + RS232_INTERVAL
+
+            # 자동 송신 모드면 VC_MON_LC 가 스스로 계속 보낸다
+            if self.auto_send and now >= next_auto:
+                self._vcmon_update(now)
+                next_auto = now + self.auto_interval
+
+            next_write = self._flush(now, next_write)
+
+    # ========================================
+    # 입력: readStringUntil('e') 와 같은 방식으로 명령 분리
+    # ========================================
+    def _receive(self, data):
+        self._in += data.decode(errors="ignore")
+        while "e" in self._in:
+            chunk, self._in = self._in.split("e", 1)
+            if len(chunk) > 1:
+                first = chunk.find("$")
+                command = chunk[first + 1:first + 4]
+                if command:
+                    self.stats["commands"] += 1
+                    self._command(command[0])
+
+    def _command(self, char):
+        handler = getattr(self, f"_cmd_{char}", None)
+        if handler is not None:
+            handler()
+
+    # ========================================
+    # 출력: 지연·속도 제한·유실·변조 적용
+    # ========================================
+    def _emit(self, text, delay=0.0):
+        self._emit_bytes((text + "\r\n").encode(), delay)
+
+    def _emit_bytes(self, data, delay=0.0):
+        with self._lock:
+            self._out.append((time.monotonic() + delay, data))
+
+    def _reply(self, *lines):
+        for line in lines:
+            self._emit(line, self.latency)
+
+    def _flush(self, now, next_write):
+        while self._out and self._out[0][0] <= now and next_write <= now:
+            with self._lock:
+                _, data = self._out.popleft()
+
+            data = self._impair(data)
+            try:
+                os.write(self._master, data)
+            except OSError:
+                return next_write
+
+            self.stats["lines"] += 1
+            self.stats["bytes"] += len(data)
+
+            # 다음 줄을 보낼 수 있는 시각 (baud: 10 bit/byte)
+            gap = 0.0
+            if self.baud:
+                gap = max(gap, len(data) * 10 / self.baud)
+            if self.line_rate:
+                gap = max(gap, 1.0 / self.line_rate)
+            next_write = max(next_write, now) + gap
+            if gap:
+                now = time.monotonic()
+
+        return next_write
+
+    def _impair(self, data):
+        if not (self.drop_rate or self.noise_rate):
+            return data
+
+        out = bytearray()
+        for b in data:
+            if self.drop_rate and self.random.random() < self.drop_rate:
+                self.stats["dropped"] += 1
+                continue
+            if self.noise_rate and self.random.random() < self.noise_rate:
+                self.stats["corrupted"] += 1
+                b = self.random.randrange(256)
+            out.append(b)
+        return bytes(out)
+
+    # ========================================
+    # 센서 값
+    # ========================================
+    def _adc(self, idx):
+        jitter = self.random.uniform(-0.02, 0.02)
+        return to_adc(max(0.0, self.cells[idx] + jitter))
+
+    def _readings(self):
+        adcs = [self._adc(0), self._adc(1), self._adc(2)]
+        adcs.append(adcs[2])
+        return adcs, [to_voltage(a) for a in adcs]
+
+    def _vcmon_update(self, now):
+        if not self.vcmon_attached:
+            return
+
+        # 할로겐 램프가 켜져 있으면 패널에 빛이 들어온다
+        if self.halogen:
+            self.vc_voltage = self.random.uniform(17.0, 22.0)
+            self.vc_current = self.random.uniform(0.06, 0.15)
+        else:
+            self.vc_voltage = self.random.uniform(0.0, 2.0)
+            self.vc_current = self.random.uniform(0.0, 0.02)
+        self.vc_power = self.vc_voltage * self.vc_current
+
+        if self._prev_vc_time is not None:
+            dt_h = (now - self._prev_vc_time) / 3600.0
+            self.cumulative_energy += self.vc_power * dt_h
+            self.vc_capacity += self.vc_current * dt_h
+        self._prev_vc_time = now
+
+        self.max_current = max(self.max_current, self.vc_current)
+        self.vc_valid = True
+
+        if self.binary:
+            self._emit_bytes(self._vcmon_frame())
+            return
+
+        self._emit(
+            f"VC_MON Data - V:{self.vc_voltage:.2f}V, I:{self.vc_current:.3f}A, "
+            f"P:{self.vc_power:.2f}W, C:{self.vc_capacity:.3f}Ah"
+        )
+
+    def _vcmon_frame(self):
+        """sendVCMonitorFrame() 과 같은 20 바이트 프레임"""
+        body = struct.pack(
+            "<BBHHHII", 14, 0x01, self._frame_seq & 0xFFFF,
+            int(self.vc_voltage * 100 + 0.5), int(self.vc_current * 1000 + 0.5),
+            int(self.vc_power * 100 + 0.5), int(self.vc_capacity * 1000 + 0.5),
+        )
+        self._frame_seq += 1
+        return b"\xa5\x5a" + body + struct.pack("<H", binascii.crc_hqx(body, 0xFFFF))
+
+    # ========================================
+    # 자동 제어 / 인터락 (processAutomaticControl, updateFanOutput)
+    # ========================================
+    def _automatic_control(self):
+        total = to_voltage(self._adc(2))
+        prev = self.battery_ok
+        self.battery_ok = total >= BATTERY_THRESHOLD_VOLTAGE
+
+        if self.battery_ok != prev:
+            if self.battery_ok:
+                self._emit(f"Battery Status: OK ({total:.2f}V >= 10V)")
+            else:
+                self._emit(f"Battery Status: LOW ({total:.2f}V < 10V)")
+
+        if self.battery_ok:
+            if self.fan_commercial:
+                self.fan_commercial = False
+                self._emit("Switching from Commercial to Battery Power")
+            self.fan_battery = True
+        else:
+            if self.fan_battery:
+                self.fan_battery = False
+                self._emit("Switching from Battery to Commercial Power")
+            self.fan_commercial = True
+
+        self._interlock_check()
+
+    def _interlock_check(self):
+        if self.fan_commercial and self.fan_battery:
+            self.fan_commercial = False
+            self.fan_battery = False
+            self._emit("SAFETY: Both fans detected ON - turning OFF both fans!")
+
+    # ========================================
+    # 명령 a ~ y
+    # ========================================
+    def _cmd_a(self):
+        self.pilot = 0
+        self._reply("Pilot Lamp OFF (RED ON - Hardware Limitation)")
+
+    def _cmd_b(self):
+        self.pilot = 1
+        self._reply("Pilot Lamp GREEN (NO Contact)")
+
+    def _cmd_c(self):
+        self.pilot = 2
+        self._reply("Pilot Lamp RED (NC Contact)")
+
+    def _cmd_d(self):
+        if self.fan_battery:
+            self.fan_battery = False
+            self._reply("Battery Fan turned OFF due to interlock")
+        self.fan_commercial = True
+        self._reply("Commercial Fan ON")
+
+    def _cmd_e(self):
+        self.fan_commercial = False
+        self._reply("Commercial Fan OFF")
+
+    def _cmd_f(self):
+        if self.fan_commercial:
+            self.fan_commercial = False
+            self._reply("Commercial Fan turned OFF due to interlock")
+        self.fan_battery = True
+        self._reply("Battery Fan ON")
+
+    def _cmd_g(self):
+        self.fan_battery = False
+        self._reply("Battery Fan OFF")
+
+    def _cmd_h(self):
+        self.halogen = True
+        self._reply("Halogen Lamp ON")
+
+    def _cmd_i(self):
+        self.halogen = False
+        self._reply("Halogen Lamp OFF")
+
+    def _cmd_j(self):
+        adcs, volts = self._readings()
+        names = ("1S Battery", "2S Battery", "3S Battery", "Total Battery")
+        self._reply(
+            "=== Battery Voltage Readings ===",
+            *(f"{n} - ADC: {a} | Voltage: {v:.3f}V" for n, a, v in zip(names, adcs, volts)),
+            "===============================",
+        )
+
+    def _cmd_k(self):
+        if not self.vc_valid:
+            self._reply("VC_MON_LC: No valid data available")
+            return
+        self._reply(
+            "=== VC_MON_LC Data ===",
+            f"Voltage: {self.vc_voltage:.2f} V",
+            f"Current: {self.vc_current:.3f} A",
+            f"Power: {self.vc_power:.2f} W",
+            f"Capacity: {self.vc_capacity:.3f} Ah",
+            f"Energy: {0.0:.2f} Wh",
+            "==================",
+        )
+
+    def _cmd_l(self):
+        self.vc_capacity = 0.0
+        self._reply("VC Monitor Data Reset Command Sent")
+
+    def _cmd_m(self):
+        self.auto_send = True
+        self._reply("VC Monitor Auto Send Start")
+
+    def _cmd_n(self):
+        self.auto_send = False
+        self._reply("VC Monitor Auto Send Stop")
+
+    def _single(self, idx, name):
+        adcs, volts = self._readings()
+        self._reply(f"{name} - ADC: {adcs[idx]} | Voltage: {volts[idx]:.3f}V")
+
+    def _cmd_o(self):
+        self._single(0, "A0 (1S)")
+
+    def _cmd_p(self):
+        self._single(1, "A1 (2S)")
+
+    def _cmd_q(self):
+        self._single(2, "A2 (3S)")
+
+    def _cmd_r(self):
+        self._single(3, "A3 (Total)")
+
+    def _cmd_s(self):
+        step = ARDUINO_REF_VOLTAGE * VOLTAGE_SENSOR_RATIO / ADC_RESOLUTION
+        self._reply(
+            "=== Voltage Sensor Calibration Info ===",
+            f"Arduino Reference Voltage: {ARDUINO_REF_VOLTAGE:.2f}V",
+            f"ADC Resolution: {ADC_RESOLUTION} steps",
+            f"Voltage Sensor Ratio: {VOLTAGE_SENSOR_RATIO:.2f}:1",
+            f"Voltage per ADC step: {step:.6f}V",
+            f"Maximum measurable voltage: {ARDUINO_REF_VOLTAGE * VOLTAGE_SENSOR_RATIO:.2f}V",
+            "=======================================",
+        )
+
+    def _cmd_t(self):
+        adcs, volts = self._readings()
+        names = ("A0 (1S):    ", "A1 (2S):    ", "A2 (3S):    ", "A3 (Total): ")
+        self._reply(
+            "=== Real-time Voltage Monitor ===",
+            *(f"{n}{v:.3f}V (ADC: {a})" for n, a, v in zip(names, adcs, volts)),
+            "=================================",
+        )
+
+    def _cmd_u(self):
+        _, volts = self._readings()
+        lines = ["=================== SYSTEM STATUS ==================="]
+
+        if self.vc_valid:
+            lines += [
+                "【1. Solar Power Status】",
+                f"  Voltage: {self.vc_voltage:.2f} V",
+                f"  Current: {self.vc_current:.3f} A",
+                f"  Max Current: {self.max_current:.3f} A",
+                f"  Power: {self.vc_power:.2f} W",
+                f"  Cumulative Energy: {self.cumulative_energy:.3f} Wh",
+            ]
+        else:
+            lines.append("【1. Solar Power Status】 - No Data Available")
+
+        lines += [
+            "【2. Battery Module Status】",
+            f"  1S: {volts[0]:.2f} V",
+            f"  2S: {volts[1]:.2f} V",
+            f"  3S: {volts[2]:.2f} V",
+            f"  Total: {volts[3]:.2f} V ({'OK' if self.battery_ok else 'LOW'})",
+            "【3. Fan Power Control】",
+            f"  Commercial Power: {'ON' if self.fan_commercial else 'OFF'}",
+            f"  Battery Power: {'ON' if self.fan_battery else 'OFF'}",
+        ]
+
+        if self.fan_commercial and self.fan_battery:
+            lines.append("  ⚠️  WARNING: INTERLOCK VIOLATION DETECTED! Both fans are ON!")
+        elif self.fan_commercial or self.fan_battery:
+            lines.append("  ✅ Interlock OK: Only one fan is active")
+        else:
+            lines.append("  ✅ Interlock OK: Both fans are OFF")
+
+        lines += [
+            "【4. Pilot Lamp Status】",
+            f"  Status: {PILOT_NAMES[self.pilot]}",
+            "【5. Halogen Lamp Status】",
+            f"  Status: {'ON' if self.halogen else 'OFF'}",
+            "====================================================",
+        ]
+        self._reply(*lines)
+
+    def _cmd_v(self):
+        self.max_current = 0.0
+        self.cumulative_energy = 0.0
+        self._reply("Solar Power Data Reset (Max Current, Cumulative Energy)")
+
+    def _cmd_w(self):
+        adcs, _ = self._readings()
+        self._reply(",".join(str(x) for x in (
+            "SNAP", *adcs,
+            int(self.vc_valid),
+            f"{self.vc_voltage:.2f}", f"{self.vc_current:.3f}",
+            f"{self.vc_power:.2f}", f"{self.vc_capacity:.3f}",
+            f"{self.max_current:.3f}", f"{self.cumulative_energy:.3f}",
+            self.pilot, int(self.fan_commercial), int(self.fan_battery),
+            int(self.halogen), int(self.battery_ok),
+        )))
+
+    def _cmd_x(self):
+        self.binary = True
+        self._reply("Binary Frame Mode ON")
+
+    def _cmd_y(self):
+        self.binary = False
+        self._reply("Binary Frame Mode OFF")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KIT_Solar_3 가상 장치 (pty)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--baud", type=int, default=115200, help="전송 속도 (0: 제한 없음)")
+    parser.add_argument("--line-rate", type=float, default=None, help="초당 최대 출력 줄 수")
+    parser.add_argument("--drop", type=float, default=0.0, help="바이트 유실 확률")
+    parser.add_argument("--noise", type=float, default=0.0, help="바이트 변조 확률")
+    parser.add_argument("--auto-interval", type=float, default=0.2, help="자동 송신 주기(초)")
+    parser.add_argument("--no-vcmon", action="store_true", help="VC_MON_LC 미연결 상태로 시작")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--link", default=None, help="pty 경로에 만들 심볼릭 링크 (예: /tmp/ttyKIT)")
+    args = parser.parse_args()
+
+    kit = VirtualKit(
+        latency=args.latency,
+        baud=args.baud,
+        line_rate=args.line_rate,
+        drop_rate=args.drop,
+        noise_rate=args.noise,
+        auto_interval=args.auto_interval,
+        vcmon=not args.no_vcmon,
+        seed=args.seed,
+        link=args.link,
+    )
+    port = kit.start()
+
+    print(f"🔌 Virtual KIT_Solar_3 : {port}")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        kit.stop()
+        print("stats:", kit.stats)
+
+
+if __name__ == "__main__":
+    main()